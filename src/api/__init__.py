@@ -2,7 +2,7 @@
 
 from src.api.client import NPSAPIClient, NPSAPIError, close_client, get_client
 from src.api.rate_limit import RateLimiter
-from src.api.retry import RetryableHTTPClient, RetryConfig
+from src.api.retry import RetryableHTTPClient, RetryConfig, RetryTransport
 
 __all__ = [
     "NPSAPIClient",
@@ -12,4 +12,5 @@ __all__ = [
     "RateLimiter",
     "RetryConfig",
     "RetryableHTTPClient",
+    "RetryTransport",
 ]
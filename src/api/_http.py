@@ -0,0 +1,65 @@
+"""Process-wide HTTP connection pool shared by the upstream API clients."""
+
+import threading
+from typing import Optional
+
+import httpx
+
+# One pool serves NPS, AirVisual, OpenWeather and Open-Meteo; connections are
+# kept per origin, so each upstream reuses its own TLS sessions.
+_SHARED_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+_transport: Optional[httpx.HTTPTransport] = None
+_transport_lock = threading.Lock()
+
+
+class _SharedTransport(httpx.BaseTransport):
+    """
+    Transport view of the shared pool that clients cannot close.
+
+    ``httpx.Client.close()`` closes its transport; clients built on the
+    shared pool get this wrapper, so closing one client leaves the pool
+    open for the others. Use :func:`close_http_transport` to close it.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport):
+        """
+        Initialize the wrapper.
+
+        Args:
+            transport: Pooled transport to delegate requests to
+        """
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request through the shared pool."""
+        return self._transport.handle_request(request)
+
+    def close(self) -> None:
+        """Leave the shared pool open; it outlives individual clients."""
+
+
+def get_http_transport() -> httpx.BaseTransport:
+    """
+    Get the shared pooled HTTP/2 transport, creating it on first use.
+
+    Returns:
+        A transport that can be passed to ``httpx.Client(transport=...)``
+    """
+    global _transport
+    if _transport is None:
+        with _transport_lock:
+            if _transport is None:
+                _transport = httpx.HTTPTransport(
+                    verify=False, http2=True, limits=_SHARED_LIMITS
+                )
+    return _SharedTransport(_transport)
+
+
+def close_http_transport() -> None:
+    """Close the shared connection pool."""
+    global _transport
+    with _transport_lock:
+        if _transport is not None:
+            _transport.close()
+            _transport = None
@@ -1,15 +1,27 @@
 """Air quality API client using AirVisual."""
 
+import logging
+import threading
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import httpx
 
+from src.api._http import get_http_transport
+from src.api.cache import TTLCache
 from src.api.rate_limit import RateLimiter
 from src.api.retry import RetryableHTTPClient, RetryConfig
-from src.config import settings
+from src.config import get_settings
 from src.models.errors import ErrorResponse, ErrorType, HTTPStatusCode
-from src.utils.logging import get_logger, log_api_request, log_api_response
+from src.utils.logging import (
+    get_logger,
+    is_enabled_for,
+    log_api_request,
+    log_api_response,
+    ms_since,
+)
+from src.utils.serialization import response_json, response_preview
+from src.utils.singleflight import SingleFlight
 
 logger = get_logger(__name__)
 
@@ -41,17 +53,43 @@ class AirQualityAPIError(Exception):
 
     def to_error_response(self) -> ErrorResponse:
         """Convert to ErrorResponse model."""
-        details = self.details.copy()
+        # The fields are built here from trusted values, so validation is
+        # skipped; details are still copied so the response never aliases
+        # the exception's own dict.
         if self.status_code:
-            details["status_code"] = self.status_code
-        return ErrorResponse(
-            error=self.error_type, message=self.message, details=details
+            details = {**self.details, "status_code": self.status_code}
+        else:
+            details = dict(self.details)
+        error_type = self.error_type
+        if isinstance(error_type, ErrorType):
+            error_type = error_type.value
+        return ErrorResponse.model_construct(
+            error=error_type, message=self.message, details=details
         )
 
 
+def _location_key(latitude: float, longitude: float) -> Tuple[float, float]:
+    """
+    Build the air quality cache key for a location.
+
+    AirVisual reports the nearest monitored city, so coordinates are rounded
+    to two decimals (about 1 km) and nearby lookups share one entry.
+
+    Args:
+        latitude: Latitude in degrees
+        longitude: Longitude in degrees
+
+    Returns:
+        Rounded ``(latitude, longitude)`` pair
+    """
+    return (round(latitude, 2), round(longitude, 2))
+
+
 class AirQualityClient:
     """Client for interacting with the AirVisual API."""
 
+    _NEAREST_CITY_ENDPOINT = "nearest_city"
+
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -61,6 +99,12 @@ class AirQualityClient:
         requests_per_hour: int = 1000,
         enable_retry: bool = True,
         max_retries: int = 3,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = True,
+        cache_ttl: float = 300.0,
+        transport: Optional[httpx.BaseTransport] = None,
     ):
         """
         Initialize AirQualityClient.
@@ -73,9 +117,18 @@ class AirQualityClient:
             requests_per_hour: Maximum requests per hour for rate limiting
             enable_retry: Whether to enable retry logic
             max_retries: Maximum number of retry attempts
+            max_connections: Maximum number of concurrent pooled connections
+            max_keepalive_connections: Maximum number of idle keep-alive connections
+            keepalive_expiry: Seconds an idle keep-alive connection is kept open
+            http2: Whether to negotiate HTTP/2 with the upstream API
+            cache_ttl: Seconds to reuse a location's air quality reading
+                (0 disables caching)
+            transport: Connection pool to send requests through instead of a
+                private one; the pool and HTTP/2 settings then come from it
         """
-        self.api_key = api_key or settings.airvisual_api_key
-        self.base_url = base_url or settings.airvisual_api_base_url
+        self.api_key = api_key or get_settings().airvisual_api_key
+        self.base_url = base_url or get_settings().airvisual_api_base_url
+        self._nearest_city_url = f"{self.base_url}/{self._NEAREST_CITY_ENDPOINT}"
 
         if not self.api_key:
             logger.warning(
@@ -83,14 +136,28 @@ class AirQualityClient:
                 message="AirVisual API key not provided. Requests will fail.",
             )
 
-        base_client = httpx.Client(
-            base_url=self.base_url,
-            timeout=timeout,
-            follow_redirects=True,
-            verify=False,
-        )
+        if transport is not None:
+            base_client = httpx.Client(
+                base_url=self.base_url,
+                timeout=timeout,
+                follow_redirects=True,
+                transport=transport,
+            )
+        else:
+            base_client = httpx.Client(
+                base_url=self.base_url,
+                timeout=timeout,
+                follow_redirects=True,
+                verify=False,
+                http2=http2,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                    keepalive_expiry=keepalive_expiry,
+                ),
+            )
 
-        if enable_retry:
+        if enable_retry and max_retries > 0:
             retry_config = RetryConfig(
                 max_retries=max_retries,
                 initial_delay=1.0,
@@ -115,14 +182,15 @@ class AirQualityClient:
                 message="Enabled rate limiting",
             )
 
+        self.cache: Optional[TTLCache] = TTLCache(ttl=cache_ttl) if cache_ttl else None
+        # Concurrent lookups for one location share one upstream call
+        self._inflight = SingleFlight()
+
         logger.info("api_client_initialized", base_url=self.base_url)
 
     def close(self) -> None:
         """Close the HTTP client."""
-        if isinstance(self.client, RetryableHTTPClient):
-            self.client.client.close()
-        else:
-            self.client.close()
+        self.client.close()
         logger.debug("api_client_closed", message="Closed AirVisual API client")
 
     def _handle_response(self, response: httpx.Response) -> Dict[str, Any]:
@@ -133,14 +201,14 @@ class AirQualityClient:
             error_message = f"HTTP {e.response.status_code} error"
 
             try:
-                error_data = e.response.json()
+                error_data = response_json(e.response)
                 if isinstance(error_data, dict):
                     error_message = error_data.get("data", {}).get(
                         "message", error_message
                     )
                     error_details.update(error_data)
             except Exception:
-                error_details["response_text"] = e.response.text[:500]
+                error_details["response_text"] = response_preview(e.response)
 
             logger.error(
                 "api_request_failed",
@@ -158,8 +226,9 @@ class AirQualityClient:
             )
 
         try:
-            data = response.json()
-            logger.debug("response_parsed", url=str(response.url))
+            data = response_json(response)
+            if is_enabled_for(logger, logging.DEBUG):
+                logger.debug("response_parsed", url=str(response.url))
             return data
         except Exception as e:
             logger.error("response_parse_failed", error=str(e), url=str(response.url))
@@ -167,7 +236,7 @@ class AirQualityClient:
                 message="Failed to parse API response",
                 status_code=response.status_code,
                 error_type=ErrorType.PARSE_ERROR,
-                details={"error": str(e), "response_text": response.text[:500]},
+                details={"error": str(e), "response_text": response_preview(response)},
             )
 
     def get_nearest_city(self, latitude: float, longitude: float) -> Dict[str, Any]:
@@ -180,20 +249,38 @@ class AirQualityClient:
                 details={"provider": "airvisual"},
             )
 
+        cache_key = _location_key(latitude, longitude)
+        if self.cache is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        # Identical lookups already in flight share that upstream call
+        return self._inflight.do(
+            cache_key, lambda: self._fetch_nearest_city(latitude, longitude, cache_key)
+        )
+
+    def _fetch_nearest_city(
+        self, latitude: float, longitude: float, cache_key: Tuple[float, float]
+    ) -> Dict[str, Any]:
+        """Fetch nearest-city air quality upstream and store it in the cache."""
         if self.rate_limiter:
             self.rate_limiter.acquire(tokens=1, block=True)
 
-        endpoint = "nearest_city"
+        endpoint = self._NEAREST_CITY_ENDPOINT
         params = {"lat": latitude, "lon": longitude, "key": self.api_key}
-        url = f"{self.base_url}/{endpoint}"
-        log_api_request(logger, "GET", url, params)
+        url = self._nearest_city_url
+        debug_enabled = is_enabled_for(logger, logging.DEBUG)
+        if debug_enabled:
+            log_api_request(logger, "GET", url, params)
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
             response = self.client.get(endpoint, params=params)
-            duration_ms = (time.time() - start_time) * 1000
-            log_api_response(logger, "GET", url, response.status_code, duration_ms)
+            status_code = response.status_code
+            if debug_enabled or status_code >= 400:
+                log_api_response(logger, "GET", url, status_code, ms_since(start_ns))
 
             data = self._handle_response(response)
             if data.get("status") != "success":
@@ -203,9 +290,11 @@ class AirQualityClient:
                     error_type=ErrorType.API_ERROR,
                     details={"provider": "airvisual", "response": data},
                 )
+            if self.cache is not None:
+                self.cache.set(cache_key, data)
             return data
         except httpx.TimeoutException:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = ms_since(start_ns)
             error_msg = "Request timed out"
             logger.error("api_timeout", url=url, duration_ms=round(duration_ms, 2))
             log_api_response(logger, "GET", url, 0, duration_ms, error=error_msg)
@@ -215,7 +304,7 @@ class AirQualityClient:
                 details={"url": url},
             )
         except httpx.NetworkError as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = ms_since(start_ns)
             error_msg = f"Network error: {str(e)}"
             logger.error("api_network_error", url=url, error=str(e))
             log_api_response(logger, "GET", url, 0, duration_ms, error=error_msg)
@@ -227,9 +316,16 @@ class AirQualityClient:
         except AirQualityAPIError:
             raise
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = ms_since(start_ns)
             error_msg = f"Unexpected error: {str(e)}"
-            logger.error("api_unexpected_error", url=url, error=str(e), exc_info=True)
+            # The raised error carries str(e); the traceback is only
+            # formatted when debugging.
+            logger.error(
+                "api_unexpected_error",
+                url=url,
+                error=str(e),
+                exc_info=is_enabled_for(logger, logging.DEBUG),
+            )
             log_api_response(logger, "GET", url, 0, duration_ms, error=error_msg)
             raise AirQualityAPIError(
                 message="Unexpected error occurred",
@@ -239,19 +335,23 @@ class AirQualityClient:
 
 
 _client: Optional[AirQualityClient] = None
+_client_lock = threading.Lock()
 
 
 def get_air_quality_client() -> AirQualityClient:
     """Get or create the global AirVisual client instance."""
     global _client
     if _client is None:
-        _client = AirQualityClient()
+        with _client_lock:
+            if _client is None:
+                _client = AirQualityClient(transport=get_http_transport())
     return _client
 
 
 def close_air_quality_client() -> None:
     """Close the global AirVisual client instance."""
     global _client
-    if _client is not None:
-        _client.close()
-        _client = None
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
@@ -0,0 +1,97 @@
+"""In-process TTL cache for idempotent API responses."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Thread-safe, size-bounded cache whose entries expire after a fixed TTL.
+
+    Entries are evicted in least-recently-used order once ``maxsize`` is
+    reached. Expired entries are dropped lazily on lookup.
+    """
+
+    def __init__(self, ttl: float = 60.0, maxsize: int = 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry stays valid after it is stored
+            maxsize: Maximum number of entries kept at once
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Look up a value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached value, or None if it is missing or expired
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        expires_at = time.monotonic() + self.ttl
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        """Return the number of stored entries, including expired ones."""
+        return len(self._data)
+
+
+def make_cache_key(
+    path: str, params: Optional[Dict[str, Any]]
+) -> Optional[Tuple[str, Tuple[Tuple[str, Any], ...]]]:
+    """
+    Build a cache key from an endpoint path and its query parameters.
+
+    Args:
+        path: Normalized endpoint path
+        params: Query parameters
+
+    Returns:
+        A hashable key, or None if the parameters cannot be hashed
+    """
+    if not params:
+        return (path, ())
+    key = (path, tuple(sorted(params.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
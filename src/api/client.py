@@ -1,16 +1,29 @@
 """NPS API client using HTTPX."""
 
+import logging
+import threading
 import time
-from typing import Any, Dict, Optional, TypeVar
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, TypeVar
 
 import httpx
 from pydantic import BaseModel
 
+from src.api._http import get_http_transport
+from src.api.cache import TTLCache, make_cache_key
 from src.api.rate_limit import RateLimiter
 from src.api.retry import RetryableHTTPClient, RetryConfig
-from src.config import settings
-from src.models.errors import ErrorResponse
-from src.utils.logging import get_logger, log_api_request, log_api_response
+from src.config import get_settings
+from src.models.errors import ErrorResponse, ErrorType
+from src.utils.logging import (
+    get_logger,
+    is_enabled_for,
+    log_api_request,
+    log_api_response,
+    ms_since,
+)
+from src.utils.serialization import response_json, response_preview
+from src.utils.singleflight import SingleFlight
 
 # Set up structured logger
 logger = get_logger(__name__)
@@ -46,14 +59,37 @@ class NPSAPIError(Exception):
 
     def to_error_response(self) -> ErrorResponse:
         """Convert to ErrorResponse model."""
-        details = self.details.copy()
+        # The fields are built here from trusted values, so validation is
+        # skipped; details are still copied so the response never aliases
+        # the exception's own dict.
         if self.status_code:
-            details["status_code"] = self.status_code
-        return ErrorResponse(
-            error=self.error_type, message=self.message, details=details
+            details = {**self.details, "status_code": self.status_code}
+        else:
+            details = dict(self.details)
+        error_type = self.error_type
+        if isinstance(error_type, ErrorType):
+            error_type = error_type.value
+        return ErrorResponse.model_construct(
+            error=error_type, message=self.message, details=details
         )
 
 
+@lru_cache(maxsize=64)
+def _normalize_endpoint(endpoint: str) -> str:
+    """
+    Normalize an endpoint path to have exactly one leading slash.
+
+    Endpoints come from a small fixed set, so results are memoized.
+
+    Args:
+        endpoint: API endpoint path (e.g., "/parks" or "parks")
+
+    Returns:
+        Normalized endpoint path with a leading slash
+    """
+    return "/" + endpoint.lstrip("/")
+
+
 class _UseSettingsType:
     """Sentinel type for using settings-based API key."""
 
@@ -64,6 +100,23 @@ _USE_SETTINGS = _UseSettingsType()
 class NPSAPIClient:
     """Client for interacting with the National Park Service API."""
 
+    # Canonical endpoint paths used by the convenience methods
+    _PARKS_PATH = "/parks"
+    _ALERTS_PATH = "/alerts"
+    _VISITOR_CENTERS_PATH = "/visitorcenters"
+    _CAMPGROUNDS_PATH = "/campgrounds"
+    _EVENTS_PATH = "/events"
+
+    # Park codes per bulk /parks request; keeps the query string well under
+    # common URL length limits
+    _PARK_CODES_PER_REQUEST = 100
+
+    # Endpoints whose responses change rarely enough to cache; alerts and
+    # events are time-sensitive and always fetched fresh.
+    _CACHEABLE_PATHS = frozenset(
+        {_PARKS_PATH, _VISITOR_CENTERS_PATH, _CAMPGROUNDS_PATH}
+    )
+
     def __init__(
         self,
         api_key: Optional[str] | _UseSettingsType = _USE_SETTINGS,
@@ -73,6 +126,12 @@ class NPSAPIClient:
         requests_per_hour: int = 1000,
         enable_retry: bool = True,
         max_retries: int = 3,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = True,
+        cache_ttl: Optional[float] = 60.0,
+        transport: Optional[httpx.BaseTransport] = None,
     ):
         """
         Initialize the NPS API client.
@@ -85,12 +144,20 @@ class NPSAPIClient:
             requests_per_hour: Maximum requests per hour (default: 1000)
             enable_retry: Whether to enable automatic retries
             max_retries: Maximum number of retry attempts
+            max_connections: Maximum number of concurrent pooled connections
+            max_keepalive_connections: Maximum number of idle keep-alive connections
+            keepalive_expiry: Seconds an idle keep-alive connection is kept open
+            http2: Whether to negotiate HTTP/2 with the upstream API
+            cache_ttl: Seconds to cache responses from cacheable endpoints.
+                None or 0 disables response caching.
+            transport: Connection pool to send requests through instead of a
+                private one; the pool and HTTP/2 settings then come from it
         """
         if api_key is _USE_SETTINGS:
-            self.api_key = settings.nps_api_key
+            self.api_key = get_settings().nps_api_key
         else:
             self.api_key = api_key
-        self.base_url = base_url or settings.nps_api_base_url
+        self.base_url = base_url or get_settings().nps_api_base_url
 
         if not self.api_key:
             logger.warning(
@@ -103,16 +170,32 @@ class NPSAPIClient:
         if self.api_key:
             headers["X-Api-Key"] = self.api_key
 
-        base_client = httpx.Client(
-            base_url=self.base_url,
-            headers=headers,
-            timeout=timeout,
-            follow_redirects=True,
-            verify=False,
-        )
+        # Pool and HTTP/2 settings come from the shared transport when given
+        if transport is not None:
+            base_client = httpx.Client(
+                base_url=self.base_url,
+                headers=headers,
+                timeout=timeout,
+                follow_redirects=True,
+                transport=transport,
+            )
+        else:
+            base_client = httpx.Client(
+                base_url=self.base_url,
+                headers=headers,
+                timeout=timeout,
+                follow_redirects=True,
+                verify=False,
+                http2=http2,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                    keepalive_expiry=keepalive_expiry,
+                ),
+            )
 
         # Wrap with retry logic if enabled
-        if enable_retry:
+        if enable_retry and max_retries > 0:
             retry_config = RetryConfig(
                 max_retries=max_retries,
                 initial_delay=1.0,
@@ -138,24 +221,14 @@ class NPSAPIClient:
                 message="Enabled rate limiting",
             )
 
-        logger.info("api_client_initialized", base_url=self.base_url)
-
-    def __enter__(self):
-        """Context manager entry."""
-        return self
+        # Cache idempotent lookups of slowly changing data
+        self.cache: Optional[TTLCache] = None
+        if cache_ttl:
+            self.cache = TTLCache(ttl=cache_ttl)
+        # Concurrent identical requests share one upstream call
+        self._inflight = SingleFlight()
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit."""
-        self.close()
-
-    def close(self):
-        """Close the HTTP client."""
-        # Handle both wrapped and unwrapped clients
-        if isinstance(self.client, RetryableHTTPClient):
-            self.client.client.close()
-        else:
-            self.client.close()
-        logger.debug("api_client_closed", message="Closed NPS API client")
+        logger.info("api_client_initialized", base_url=self.base_url)
 
     def _handle_response(self, response: httpx.Response) -> Dict[str, Any]:
         """
@@ -178,13 +251,13 @@ class NPSAPIClient:
 
             # Try to extract error details from response
             try:
-                error_data = e.response.json()
+                error_data = response_json(e.response)
                 if isinstance(error_data, dict):
                     error_message = error_data.get("message", error_message)
                     error_details.update(error_data)
             except Exception:
                 # If we can't parse JSON, use the response text
-                error_details["response_text"] = e.response.text[:500]
+                error_details["response_text"] = response_preview(e.response)
 
             logger.error(
                 "api_request_failed",
@@ -203,8 +276,9 @@ class NPSAPIClient:
 
         # Parse JSON response
         try:
-            data = response.json()
-            logger.debug("response_parsed", url=str(response.url))
+            data = response_json(response)
+            if is_enabled_for(logger, logging.DEBUG):
+                logger.debug("response_parsed", url=str(response.url))
             return data
         except Exception as e:
             logger.error("response_parse_failed", error=str(e), url=str(response.url))
@@ -212,7 +286,7 @@ class NPSAPIClient:
                 message="Failed to parse API response",
                 status_code=response.status_code,
                 error_type="parse_error",
-                details={"error": str(e), "response_text": response.text[:500]},
+                details={"error": str(e), "response_text": response_preview(response)},
             )
 
     def _build_url(self, endpoint: str) -> str:
@@ -225,86 +299,209 @@ class NPSAPIClient:
         Returns:
             Normalized endpoint path with a leading slash
         """
-        return f"/{endpoint.lstrip('/')}"
+        return _normalize_endpoint(endpoint)
 
-    def get(
-        self, endpoint: str, params: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
+    def _park_code_batches(self, codes: Sequence[str]) -> List[str]:
         """
-        Make a GET request to the NPS API.
+        Split park codes into comma-separated batches for bulk lookups.
 
         Args:
-            endpoint: API endpoint path (e.g., "/parks")
-            params: Query parameters
+            codes: Park codes to look up; duplicates are dropped
 
         Returns:
-            Parsed JSON response data
+            Comma-separated ``parkCode`` values, one per request
+        """
+        unique = list(dict.fromkeys(codes))
+        size = self._PARK_CODES_PER_REQUEST
+        return [",".join(unique[i : i + size]) for i in range(0, len(unique), size)]
 
-        Raises:
-            NPSAPIError: If the request fails
+    @staticmethod
+    def _merge_park_batches(responses: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
-        # Acquire rate limit token if rate limiting is enabled
-        if self.rate_limiter:
-            self.rate_limiter.acquire(tokens=1, block=True)
+        Merge the responses of batched park lookups into one NPS response.
 
-        path = self._build_url(endpoint)
-        url = self.base_url + path
-        # Log the outgoing request
-        log_api_request(logger, "GET", url, params)
+        Args:
+            responses: NPS API responses, one per batch
 
-        # Track request timing
-        start_time = time.time()
-        status_code = None
-        error_msg = None
+        Returns:
+            NPS API response containing the data of every batch
+        """
+        if len(responses) == 1:
+            return responses[0]
+        data = [park for response in responses for park in response.get("data", [])]
+        return {
+            "total": str(len(data)),
+            "limit": str(len(data)),
+            "start": "0",
+            "data": data,
+        }
+
+    def _request_failed(self, error: Exception, url: str, start_ns: int) -> NPSAPIError:
+        """
+        Log a failed request and translate the error into an NPSAPIError.
 
-        try:
-            response = self.client.get(path, params=params)
-            status_code = response.status_code
-            duration_ms = (time.time() - start_time) * 1000
+        Args:
+            error: Exception raised while sending the request
+            url: Full request URL
+            start_ns: Monotonic time the request was started, in nanoseconds
 
-            # Log the response
-            log_api_response(logger, "GET", url, status_code, duration_ms)
+        Returns:
+            NPSAPIError describing the failure
+        """
+        duration_ms = ms_since(start_ns)
 
-            return self._handle_response(response)
-        except httpx.TimeoutException:
-            duration_ms = (time.time() - start_time) * 1000
+        if isinstance(error, httpx.TimeoutException):
             error_msg = "Request timed out"
 
             logger.error("api_timeout", url=url, duration_ms=round(duration_ms, 2))
             log_api_response(logger, "GET", url, 0, duration_ms, error=error_msg)
 
-            raise NPSAPIError(
+            return NPSAPIError(
                 message=error_msg,
                 error_type="timeout_error",
                 details={"url": url},
             )
-        except httpx.NetworkError as e:
-            duration_ms = (time.time() - start_time) * 1000
-            error_msg = f"Network error: {str(e)}"
 
-            logger.error("api_network_error", url=url, error=str(e))
+        if isinstance(error, httpx.NetworkError):
+            error_msg = f"Network error: {str(error)}"
+
+            logger.error("api_network_error", url=url, error=str(error))
             log_api_response(logger, "GET", url, 0, duration_ms, error=error_msg)
 
-            raise NPSAPIError(
+            return NPSAPIError(
                 message="Network error occurred",
                 error_type="network_error",
-                details={"url": url, "error": str(e)},
+                details={"url": url, "error": str(error)},
             )
+
+        error_msg = f"Unexpected error: {str(error)}"
+
+        # The raised error carries str(error); the traceback is only
+        # formatted when debugging.
+        logger.error(
+            "api_unexpected_error",
+            url=url,
+            error=str(error),
+            exc_info=is_enabled_for(logger, logging.DEBUG),
+        )
+        log_api_response(logger, "GET", url, 0, duration_ms, error=error_msg)
+
+        return NPSAPIError(
+            message="Unexpected error occurred",
+            error_type="unknown_error",
+            details={"error": str(error), "url": url},
+        )
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+    def close(self):
+        """Close the HTTP client."""
+        self.client.close()
+        logger.debug("api_client_closed", message="Closed NPS API client")
+
+    def get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        use_cache: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Make a GET request to the NPS API.
+
+        Args:
+            endpoint: API endpoint path (e.g., "/parks")
+            params: Query parameters
+            use_cache: Whether to serve and store the response in the response
+                cache. Only endpoints with slowly changing data are cached.
+
+        Returns:
+            Parsed JSON response data. Responses served from the cache, or
+            shared with a concurrent identical request, are shared between
+            callers and must not be mutated.
+
+        Raises:
+            NPSAPIError: If the request fails
+        """
+        path = _normalize_endpoint(endpoint)
+
+        # Serve slowly changing data from the response cache when possible
+        cache = self.cache
+        cache_key = None
+        if use_cache and cache is not None and path in self._CACHEABLE_PATHS:
+            cache_key = make_cache_key(path, params)
+            if cache_key is not None:
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    return cached
+
+        # Identical requests already in flight share that upstream call
+        flight_key = cache_key or make_cache_key(path, params)
+        if flight_key is None:
+            return self._fetch(path, params, cache_key)
+        return self._inflight.do(
+            flight_key, lambda: self._fetch(path, params, cache_key)
+        )
+
+    def _fetch(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        cache_key: Optional[Any],
+    ) -> Dict[str, Any]:
+        """
+        Send a GET request upstream, bypassing the response cache lookup.
+
+        Args:
+            path: Normalized endpoint path
+            params: Query parameters
+            cache_key: Key to store the response under, or None to skip caching
+
+        Returns:
+            Parsed JSON response data
+
+        Raises:
+            NPSAPIError: If the request fails
+        """
+        cache = self.cache
+
+        # Acquire rate limit token if rate limiting is enabled
+        if self.rate_limiter:
+            self.rate_limiter.acquire(tokens=1, block=True)
+
+        # The full URL is only needed for logs and error details, so it is
+        # built lazily rather than on every successful request.
+        debug_enabled = is_enabled_for(logger, logging.DEBUG)
+        if debug_enabled:
+            log_api_request(logger, "GET", self.base_url + path, params)
+
+        # Track request timing
+        start_ns = time.perf_counter_ns()
+
+        try:
+            response = self.client.get(path, params=params)
+
+            # Successful responses are logged at DEBUG; errors always are
+            status_code = response.status_code
+            if debug_enabled or status_code >= 400:
+                log_api_response(
+                    logger, "GET", self.base_url + path, status_code, ms_since(start_ns)
+                )
+
+            data = self._handle_response(response)
+            if cache is not None and cache_key is not None:
+                cache.set(cache_key, data)
+            return data
         except NPSAPIError:
             # Re-raise our custom errors (already logged in _handle_response)
             raise
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
-            error_msg = f"Unexpected error: {str(e)}"
-
-            logger.error("api_unexpected_error", url=url, error=str(e), exc_info=True)
-            log_api_response(logger, "GET", url, 0, duration_ms, error=error_msg)
-
-            raise NPSAPIError(
-                message="Unexpected error occurred",
-                error_type="unknown_error",
-                details={"error": str(e), "url": url},
-            )
+            raise self._request_failed(e, self.base_url + path, start_ns)
 
     def get_parks(self, **params) -> Dict[str, Any]:
         """
@@ -316,7 +513,7 @@ class NPSAPIClient:
         Returns:
             NPS API response with park data
         """
-        return self.get("/parks", params=params)
+        return self.get(self._PARKS_PATH, params=params, use_cache=True)
 
     def get_park_by_code(self, park_code: str) -> Dict[str, Any]:
         """
@@ -328,7 +525,33 @@ class NPSAPIClient:
         Returns:
             NPS API response with park data
         """
-        return self.get("/parks", params={"parkCode": park_code})
+        return self.get(
+            self._PARKS_PATH, params={"parkCode": park_code}, use_cache=True
+        )
+
+    def get_parks_by_codes(self, codes: Sequence[str], **params) -> Dict[str, Any]:
+        """
+        Get several parks by park code with as few requests as possible.
+
+        Codes are sent comma-separated in a single ``parkCode`` parameter,
+        split into batches only when the list is very long.
+
+        Args:
+            codes: Park codes to look up
+            **params: Additional query parameters
+
+        Returns:
+            NPS API response with data for every matched park
+        """
+        responses = [
+            self.get(
+                self._PARKS_PATH,
+                params={**params, "parkCode": batch, "limit": batch.count(",") + 1},
+                use_cache=True,
+            )
+            for batch in self._park_code_batches(codes)
+        ]
+        return self._merge_park_batches(responses)
 
     def get_alerts(self, park_code: Optional[str] = None, **params) -> Dict[str, Any]:
         """
@@ -343,7 +566,7 @@ class NPSAPIClient:
         """
         if park_code:
             params["parkCode"] = park_code
-        return self.get("/alerts", params=params)
+        return self.get(self._ALERTS_PATH, params=params)
 
     def get_visitor_centers(
         self, park_code: Optional[str] = None, **params
@@ -360,7 +583,7 @@ class NPSAPIClient:
         """
         if park_code:
             params["parkCode"] = park_code
-        return self.get("/visitorcenters", params=params)
+        return self.get(self._VISITOR_CENTERS_PATH, params=params, use_cache=True)
 
     def get_campgrounds(
         self, park_code: Optional[str] = None, **params
@@ -377,7 +600,7 @@ class NPSAPIClient:
         """
         if park_code:
             params["parkCode"] = park_code
-        return self.get("/campgrounds", params=params)
+        return self.get(self._CAMPGROUNDS_PATH, params=params, use_cache=True)
 
     def get_events(self, park_code: Optional[str] = None, **params) -> Dict[str, Any]:
         """
@@ -392,11 +615,12 @@ class NPSAPIClient:
         """
         if park_code:
             params["parkCode"] = park_code
-        return self.get("/events", params=params)
+        return self.get(self._EVENTS_PATH, params=params)
 
 
 # Global client instance
 _client: Optional[NPSAPIClient] = None
+_client_lock = threading.Lock()
 
 
 def get_client() -> NPSAPIClient:
@@ -408,13 +632,16 @@ def get_client() -> NPSAPIClient:
     """
     global _client
     if _client is None:
-        _client = NPSAPIClient()
+        with _client_lock:
+            if _client is None:
+                _client = NPSAPIClient(transport=get_http_transport())
     return _client
 
 
 def close_client():
     """Close the global client instance."""
     global _client
-    if _client is not None:
-        _client.close()
-        _client = None
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
@@ -3,9 +3,14 @@
 import logging
 import time
 from threading import Lock
+from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Internal token unit: one token is worth one hour in nanoseconds, so a refill
+# of ``elapsed_ns * requests_per_hour`` is exact integer arithmetic.
+_NS_PER_HOUR = 3600 * 1_000_000_000
+
 
 class RateLimiter:
     """
@@ -14,6 +19,11 @@ class RateLimiter:
     This implements a simple token bucket algorithm to limit the rate of API requests.
     """
 
+    # Refills are deferred while at least this many times the requested tokens
+    # remain and the last refill is younger than _REFILL_INTERVAL_NS.
+    _HEADROOM_FACTOR = 10
+    _REFILL_INTERVAL_NS = 100_000_000
+
     def __init__(self, requests_per_hour: int = 1000):
         """
         Initialize the rate limiter.
@@ -24,23 +34,94 @@ class RateLimiter:
         self.requests_per_hour = requests_per_hour
         self.tokens_per_second = requests_per_hour / 3600.0
         self.max_tokens = requests_per_hour
-        self.tokens = float(requests_per_hour)
-        self.last_update = time.time()
+        # Bucket state in integer units of 1 / _NS_PER_HOUR tokens
+        self._max_scaled = requests_per_hour * _NS_PER_HOUR
+        self._tokens_scaled = self._max_scaled
+        self._last_ns = time.monotonic_ns()
         self.lock = Lock()
 
         logger.info(
-            f"Initialized rate limiter: {requests_per_hour} requests/hour "
-            f"({self.tokens_per_second:.2f} requests/second)"
+            "Initialized rate limiter: %d requests/hour (%.2f requests/second)",
+            requests_per_hour,
+            self.tokens_per_second,
         )
 
-    def _refill_tokens(self):
-        """Refill tokens based on elapsed time."""
-        now = time.time()
-        elapsed = now - self.last_update
-        self.tokens = min(
-            self.max_tokens, self.tokens + elapsed * self.tokens_per_second
-        )
-        self.last_update = now
+    @property
+    def tokens(self) -> float:
+        """Tokens currently in the bucket, as of the last refill."""
+        return self._tokens_scaled / _NS_PER_HOUR
+
+    @tokens.setter
+    def tokens(self, value: float) -> None:
+        self._tokens_scaled = round(value * _NS_PER_HOUR)
+
+    def _refill_tokens(self, now_ns: Optional[int] = None):
+        """
+        Refill tokens based on elapsed time.
+
+        Must be called with ``self.lock`` held.
+
+        Args:
+            now_ns: ``time.monotonic_ns()`` timestamp to refill up to.
+                Defaults to the current time.
+        """
+        if now_ns is None:
+            now_ns = time.monotonic_ns()
+        elapsed_ns = now_ns - self._last_ns
+        # A caller that sampled the clock before blocking on the lock may carry
+        # a timestamp older than the last refill; never move time backwards.
+        if elapsed_ns > 0:
+            self._tokens_scaled = min(
+                self._max_scaled,
+                self._tokens_scaled + elapsed_ns * self.requests_per_hour,
+            )
+            self._last_ns = now_ns
+
+    def _try_take(self, tokens: int, now_ns: int) -> int:
+        """
+        Refill the bucket and take tokens if enough are available.
+
+        The critical section is kept to the bare state update; callers do
+        clock reads, logging, and sleeping outside the lock.
+
+        Args:
+            tokens: Number of tokens to take
+            now_ns: ``time.monotonic_ns()`` timestamp sampled by the caller
+
+        Returns:
+            Scaled tokens available before the attempt
+        """
+        needed = tokens * _NS_PER_HOUR
+        with self.lock:
+            available = self._tokens_scaled
+            # Fast path: with ample headroom and a recent refill, the refill
+            # math cannot change the outcome, so defer it. _last_ns is left
+            # untouched, so the skipped interval is credited on the next refill.
+            if (
+                available < needed * self._HEADROOM_FACTOR
+                or now_ns - self._last_ns >= self._REFILL_INTERVAL_NS
+            ):
+                self._refill_tokens(now_ns)
+                available = self._tokens_scaled
+            if available >= needed:
+                self._tokens_scaled = available - needed
+        return available
+
+    def _wait_seconds(self, tokens: int, available: int) -> float:
+        """
+        Compute how long to wait until enough tokens have been refilled.
+
+        Args:
+            tokens: Number of tokens requested
+            available: Scaled tokens available at the last attempt
+
+        Returns:
+            Wait time in seconds
+        """
+        missing = tokens * _NS_PER_HOUR - available
+        # Ceiling division so the bucket is guaranteed full enough afterwards
+        wait_ns = -(-missing // self.requests_per_hour)
+        return wait_ns / 1_000_000_000
 
     def acquire(self, tokens: int = 1, block: bool = True) -> bool:
         """
@@ -53,48 +134,52 @@ class RateLimiter:
         Returns:
             True if tokens were acquired, False otherwise
         """
-        with self.lock:
-            self._refill_tokens()
+        needed = tokens * _NS_PER_HOUR
+        available = self._try_take(tokens, time.monotonic_ns())
+
+        if available >= needed:
+            logger.debug(
+                "Acquired %d token(s). Remaining: %.2f",
+                tokens,
+                (available - needed) / _NS_PER_HOUR,
+            )
+            return True
 
-            if self.tokens >= tokens:
-                self.tokens -= tokens
-                logger.debug(
-                    f"Acquired {tokens} token(s). Remaining: {self.tokens:.2f}"
-                )
-                return True
-
-            if not block:
-                logger.debug(
-                    f"Failed to acquire {tokens} token(s). Available: {self.tokens:.2f}"
-                )
-                return False
-
-            # Calculate wait time
-            tokens_needed = tokens - self.tokens
-            wait_time = tokens_needed / self.tokens_per_second
-
-            logger.info(
-                f"Rate limit reached. Waiting {wait_time:.2f} seconds for {tokens} token(s)"
+        if not block:
+            logger.debug(
+                "Failed to acquire %d token(s). Available: %.2f",
+                tokens,
+                available / _NS_PER_HOUR,
             )
+            return False
+
+        # Calculate wait time
+        wait_time = self._wait_seconds(tokens, available)
+
+        logger.info(
+            "Rate limit reached. Waiting %.2f seconds for %d token(s)",
+            wait_time,
+            tokens,
+        )
 
-        # Release lock while waiting
         time.sleep(wait_time)
 
         # Try again after waiting
-        with self.lock:
-            self._refill_tokens()
-            if self.tokens >= tokens:
-                self.tokens -= tokens
-                logger.debug(
-                    f"Acquired {tokens} token(s) after waiting. Remaining: {self.tokens:.2f}"
-                )
-                return True
-
-            # This shouldn't happen, but handle it gracefully
-            logger.warning(
-                f"Failed to acquire tokens after waiting. Available: {self.tokens:.2f}"
+        available = self._try_take(tokens, time.monotonic_ns())
+        if available >= needed:
+            logger.debug(
+                "Acquired %d token(s) after waiting. Remaining: %.2f",
+                tokens,
+                (available - needed) / _NS_PER_HOUR,
             )
-            return False
+            return True
+
+        # This shouldn't happen, but handle it gracefully
+        logger.warning(
+            "Failed to acquire tokens after waiting. Available: %.2f",
+            available / _NS_PER_HOUR,
+        )
+        return False
 
     def get_available_tokens(self) -> float:
         """
@@ -110,6 +195,6 @@ class RateLimiter:
     def reset(self):
         """Reset the rate limiter to full capacity."""
         with self.lock:
-            self.tokens = float(self.max_tokens)
-            self.last_update = time.time()
+            self._tokens_scaled = self._max_scaled
+            self._last_ns = time.monotonic_ns()
             logger.info("Rate limiter reset to full capacity")
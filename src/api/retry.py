@@ -1,7 +1,10 @@
 """Retry logic with exponential backoff for API requests."""
 
 import logging
+import random
 import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from functools import wraps
 from typing import Callable, Optional, Tuple, TypeVar
 
@@ -15,6 +18,15 @@ T = TypeVar("T")
 class RetryConfig:
     """Configuration for retry behavior."""
 
+    __slots__ = (
+        "max_retries",
+        "initial_delay",
+        "max_delay",
+        "exponential_base",
+        "retry_on_status_codes",
+        "jitter",
+    )
+
     def __init__(
         self,
         max_retries: int = 3,
@@ -22,6 +34,7 @@ class RetryConfig:
         max_delay: float = 60.0,
         exponential_base: float = 2.0,
         retry_on_status_codes: Optional[Tuple[int, ...]] = None,
+        jitter: bool = True,
     ):
         """
         Initialize retry configuration.
@@ -32,6 +45,8 @@ class RetryConfig:
             max_delay: Maximum delay in seconds between retries
             exponential_base: Base for exponential backoff calculation
             retry_on_status_codes: HTTP status codes that should trigger a retry
+            jitter: Whether to randomize backoff delays (full jitter) so that
+                concurrent clients do not retry in lockstep
         """
         self.max_retries = max_retries
         self.initial_delay = initial_delay
@@ -44,10 +59,19 @@ class RetryConfig:
             503,  # Service Unavailable
             504,  # Gateway Timeout
         )
+        self.jitter = jitter
+
+
+# Shared by clients that retry with the default settings; treat as read-only.
+DEFAULT_RETRY_CONFIG = RetryConfig()
 
 
 def calculate_backoff_delay(
-    attempt: int, initial_delay: float, max_delay: float, exponential_base: float
+    attempt: int,
+    initial_delay: float,
+    max_delay: float,
+    exponential_base: float,
+    jitter: bool = False,
 ) -> float:
     """
     Calculate exponential backoff delay.
@@ -57,12 +81,83 @@ def calculate_backoff_delay(
         initial_delay: Initial delay in seconds
         max_delay: Maximum delay in seconds
         exponential_base: Base for exponential calculation
+        jitter: If True, return a uniformly random delay between zero and the
+            capped exponential delay ("full jitter")
+
+    Returns:
+        Delay in seconds
+    """
+    cap = min(initial_delay * (exponential_base**attempt), max_delay)
+    if jitter:
+        return random.uniform(0, cap)
+    return cap
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a ``Retry-After`` header value.
+
+    Args:
+        value: Header value, either delay seconds or an HTTP-date
+
+    Returns:
+        Seconds to wait, or None if the value is missing or malformed
+    """
+    if not value or not isinstance(value, str):
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def retry_after_hint(error: Exception) -> Optional[float]:
+    """
+    Extract the server-requested retry delay from an HTTP error.
+
+    Args:
+        error: The exception that occurred
+
+    Returns:
+        Seconds to wait from the response's ``Retry-After`` header, or None
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        return parse_retry_after(error.response.headers.get("retry-after"))
+    return None
+
+
+def _retry_delay(
+    config: RetryConfig, attempt: int, hint: Optional[float] = None
+) -> float:
+    """
+    Pick the delay before the next attempt.
+
+    A server-provided ``Retry-After`` hint wins over the computed backoff, but
+    is still capped at ``config.max_delay``.
+
+    Args:
+        config: Retry configuration
+        attempt: Current attempt number (0-indexed)
+        hint: Delay requested by the server, if any
 
     Returns:
         Delay in seconds
     """
-    delay = initial_delay * (exponential_base**attempt)
-    return min(delay, max_delay)
+    if hint is not None:
+        return min(hint, config.max_delay)
+    return calculate_backoff_delay(
+        attempt,
+        config.initial_delay,
+        config.max_delay,
+        config.exponential_base,
+        jitter=config.jitter,
+    )
 
 
 def should_retry_error(
@@ -89,6 +184,11 @@ def should_retry_error(
     return False
 
 
+def _log_not_retryable(func_name: str, error: Exception) -> None:
+    """Log that a failed call is not being retried."""
+    logger.debug("Error not retryable for %s: %s", func_name, type(error).__name__)
+
+
 def retry_with_backoff(config: Optional[RetryConfig] = None):
     """
     Add retry logic with exponential backoff to a function.
@@ -103,53 +203,123 @@ def retry_with_backoff(config: Optional[RetryConfig] = None):
         config = RetryConfig()
 
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        # Bound methods of mocks and other callables may lack __name__
+        func_name = getattr(func, "__name__", type(func).__name__)
+
         @wraps(func)
         def wrapper(*args, **kwargs) -> T:
-            last_exception = None
+            # Fast path: most calls succeed on the first attempt, so no retry
+            # bookkeeping is set up until one fails. Non-retryable errors are
+            # re-raised straight from the handler.
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                if not should_retry_error(e, config.retry_on_status_codes):
+                    _log_not_retryable(func_name, e)
+                    raise
+                last_exception = e
+
+            for attempt in range(config.max_retries):
+                delay = _retry_delay(config, attempt, retry_after_hint(last_exception))
+
+                logger.warning(
+                    "Attempt %d/%d failed for %s. Retrying in %.2f seconds. Error: %s",
+                    attempt + 1,
+                    config.max_retries + 1,
+                    func_name,
+                    delay,
+                    last_exception,
+                )
+
+                time.sleep(delay)
 
-            for attempt in range(config.max_retries + 1):
                 try:
                     return func(*args, **kwargs)
                 except Exception as e:
+                    if not should_retry_error(e, config.retry_on_status_codes):
+                        _log_not_retryable(func_name, e)
+                        raise
                     last_exception = e
 
-                    # Check if we should retry
-                    if attempt >= config.max_retries:
-                        logger.error(
-                            f"Max retries ({config.max_retries}) exceeded for {func.__name__}"
-                        )
-                        break
-
-                    if not should_retry_error(e, config.retry_on_status_codes):
-                        logger.debug(
-                            f"Error not retryable for {func.__name__}: {type(e).__name__}"
-                        )
-                        break
-
-                    # Calculate backoff delay
-                    delay = calculate_backoff_delay(
-                        attempt,
-                        config.initial_delay,
-                        config.max_delay,
-                        config.exponential_base,
-                    )
-
-                    logger.warning(
-                        f"Attempt {attempt + 1}/{config.max_retries + 1} failed for {func.__name__}. "
-                        f"Retrying in {delay:.2f} seconds. Error: {e}"
-                    )
-
-                    time.sleep(delay)
-
-            # If we get here, all retries failed
-            if last_exception:
-                raise last_exception
+            logger.error(
+                "Max retries (%d) exceeded for %s", config.max_retries, func_name
+            )
+            raise last_exception
 
         return wrapper
 
     return decorator
 
 
+class RetryTransport(httpx.BaseTransport):
+    """
+    HTTPX transport that retries failed requests with exponential backoff.
+
+    Retries happen inside the client's transport pipeline, so callers use a
+    plain ``httpx.Client`` and successful requests pay no retry overhead
+    beyond one method call. Transport errors and responses whose status is
+    in ``retry_on_status_codes`` are retried; the final response is returned
+    as-is so the caller's status handling still applies.
+    """
+
+    def __init__(
+        self,
+        transport: Optional[httpx.BaseTransport] = None,
+        config: Optional[RetryConfig] = None,
+    ):
+        """
+        Initialize the retry transport.
+
+        Args:
+            transport: Transport that sends the requests. Defaults to a new
+                ``httpx.HTTPTransport``.
+            config: Retry configuration
+        """
+        self.transport = transport or httpx.HTTPTransport()
+        self.config = config or RetryConfig()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request, retrying transient failures."""
+        config = self.config
+        attempt = 0
+        while True:
+            try:
+                response = self.transport.handle_request(request)
+            except Exception as e:
+                if attempt >= config.max_retries or not should_retry_error(
+                    e, config.retry_on_status_codes
+                ):
+                    raise
+                reason: object = e
+                hint = None
+            else:
+                if (
+                    attempt >= config.max_retries
+                    or response.status_code not in config.retry_on_status_codes
+                ):
+                    return response
+                hint = parse_retry_after(response.headers.get("retry-after"))
+                response.close()
+                reason = f"HTTP {response.status_code}"
+
+            delay = _retry_delay(config, attempt, hint)
+            logger.warning(
+                "Attempt %d/%d failed for %s %s. Retrying in %.2f seconds. Error: %s",
+                attempt + 1,
+                config.max_retries + 1,
+                request.method,
+                request.url,
+                delay,
+                reason,
+            )
+            time.sleep(delay)
+            attempt += 1
+
+    def close(self) -> None:
+        """Close the wrapped transport."""
+        self.transport.close()
+
+
 class RetryableHTTPClient:
     """
     HTTP client wrapper with built-in retry logic.
@@ -167,39 +337,30 @@ class RetryableHTTPClient:
         """
         self.client = client
         self.config = config or RetryConfig()
+        # Decorate each verb once; the wrappers stay bound to this config
+        # object, so replacing self.config later does not affect them
+        retry = retry_with_backoff(self.config)
+        self._get = retry(client.get)
+        self._post = retry(client.post)
+        self._put = retry(client.put)
+        self._delete = retry(client.delete)
 
     def get(self, *args, **kwargs) -> httpx.Response:
         """Make a GET request with retry logic."""
-
-        @retry_with_backoff(self.config)
-        def _get():
-            return self.client.get(*args, **kwargs)
-
-        return _get()
+        return self._get(*args, **kwargs)
 
     def post(self, *args, **kwargs) -> httpx.Response:
         """Make a POST request with retry logic."""
-
-        @retry_with_backoff(self.config)
-        def _post():
-            return self.client.post(*args, **kwargs)
-
-        return _post()
+        return self._post(*args, **kwargs)
 
     def put(self, *args, **kwargs) -> httpx.Response:
         """Make a PUT request with retry logic."""
-
-        @retry_with_backoff(self.config)
-        def _put():
-            return self.client.put(*args, **kwargs)
-
-        return _put()
+        return self._put(*args, **kwargs)
 
     def delete(self, *args, **kwargs) -> httpx.Response:
         """Make a DELETE request with retry logic."""
+        return self._delete(*args, **kwargs)
 
-        @retry_with_backoff(self.config)
-        def _delete():
-            return self.client.delete(*args, **kwargs)
-
-        return _delete()
+    def close(self) -> None:
+        """Close the wrapped client."""
+        self.client.close()
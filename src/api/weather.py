@@ -1,15 +1,28 @@
 """Weather API clients for OpenWeather and Open-Meteo."""
 
+import logging
+import threading
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlencode
 
 import httpx
 
+from src.api._http import get_http_transport
+from src.api.cache import TTLCache
 from src.api.rate_limit import RateLimiter
-from src.api.retry import RetryableHTTPClient, RetryConfig
-from src.config import settings
+from src.api.retry import DEFAULT_RETRY_CONFIG, RetryConfig, RetryTransport
+from src.config import get_settings
 from src.models.errors import ErrorResponse, ErrorType, HTTPStatusCode
-from src.utils.logging import get_logger, log_api_request, log_api_response
+from src.utils.logging import (
+    get_logger,
+    is_enabled_for,
+    log_api_request,
+    log_api_response,
+    ms_since,
+)
+from src.utils.serialization import response_json, response_preview
+from src.utils.singleflight import SingleFlight
 
 logger = get_logger(__name__)
 
@@ -17,6 +30,8 @@ logger = get_logger(__name__)
 class WeatherAPIError(Exception):
     """Custom exception for weather API errors."""
 
+    __slots__ = ("message", "status_code", "error_type", "details")
+
     def __init__(
         self,
         message: str,
@@ -41,17 +56,165 @@ class WeatherAPIError(Exception):
 
     def to_error_response(self) -> ErrorResponse:
         """Convert to ErrorResponse model."""
-        details = self.details.copy()
+        # The fields are built here from trusted values, so validation is
+        # skipped; details are still copied so the response never aliases
+        # the exception's own dict.
         if self.status_code:
-            details["status_code"] = self.status_code
-        return ErrorResponse(
-            error=self.error_type, message=self.message, details=details
+            details = {**self.details, "status_code": self.status_code}
+        else:
+            details = dict(self.details)
+        error_type = self.error_type
+        if isinstance(error_type, ErrorType):
+            error_type = error_type.value
+        return ErrorResponse.model_construct(
+            error=error_type, message=self.message, details=details
+        )
+
+
+def _request_failed(error: Exception, url: str, start_ns: int) -> WeatherAPIError:
+    """
+    Log a failed weather request and map it to a WeatherAPIError.
+
+    Args:
+        error: Exception raised while sending the request
+        url: Request URL
+        start_ns: ``time.perf_counter_ns()`` timestamp taken before the request
+
+    Returns:
+        WeatherAPIError describing the failure
+    """
+    duration_ms = ms_since(start_ns)
+    if isinstance(error, httpx.TimeoutException):
+        error_msg = "Request timed out"
+        logger.error("api_timeout", url=url, duration_ms=round(duration_ms, 2))
+        log_api_response(logger, "GET", url, 0, duration_ms, error=error_msg)
+        return WeatherAPIError(
+            message=error_msg,
+            error_type=ErrorType.TIMEOUT_ERROR,
+            details={"url": url},
+        )
+    if isinstance(error, httpx.NetworkError):
+        error_msg = f"Network error: {str(error)}"
+        logger.error("api_network_error", url=url, error=str(error))
+        log_api_response(logger, "GET", url, 0, duration_ms, error=error_msg)
+        return WeatherAPIError(
+            message="Network error occurred",
+            error_type=ErrorType.NETWORK_ERROR,
+            details={"url": url, "error": str(error)},
+        )
+    error_msg = f"Unexpected error: {str(error)}"
+    # The raised error carries str(error); the traceback is only
+    # formatted when debugging.
+    logger.error(
+        "api_unexpected_error",
+        url=url,
+        error=str(error),
+        exc_info=is_enabled_for(logger, logging.DEBUG),
+    )
+    log_api_response(logger, "GET", url, 0, duration_ms, error=error_msg)
+    return WeatherAPIError(
+        message="Unexpected error occurred",
+        error_type=ErrorType.UNKNOWN_ERROR,
+        details={"error": str(error), "url": url},
+    )
+
+
+def _handle_response(response: httpx.Response, error_key: str) -> Dict[str, Any]:
+    """
+    Check a weather API response and decode its JSON body.
+
+    Args:
+        response: HTTP response to handle
+        error_key: Key of the provider's error message in error bodies
+
+    Returns:
+        Decoded response body
+
+    Raises:
+        WeatherAPIError: If the status is an error or the body is not JSON
+    """
+    try:
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        error_details = {"url": str(e.request.url)}
+        error_message = f"HTTP {e.response.status_code} error"
+
+        try:
+            error_data = response_json(e.response)
+            if isinstance(error_data, dict):
+                error_message = error_data.get(error_key, error_message)
+                error_details.update(error_data)
+        except Exception:
+            error_details["response_text"] = response_preview(e.response)
+
+        logger.error(
+            "api_request_failed",
+            error=error_message,
+            status_code=e.response.status_code,
+            url=str(e.request.url),
+            details=error_details,
+        )
+
+        raise WeatherAPIError(
+            message=error_message,
+            status_code=e.response.status_code,
+            error_type=ErrorType.HTTP_ERROR,
+            details=error_details,
+        )
+
+    try:
+        data = response_json(response)
+        if is_enabled_for(logger, logging.DEBUG):
+            logger.debug("response_parsed", url=str(response.url))
+        return data
+    except Exception as e:
+        logger.error("response_parse_failed", error=str(e), url=str(response.url))
+        raise WeatherAPIError(
+            message="Failed to parse API response",
+            status_code=response.status_code,
+            error_type=ErrorType.PARSE_ERROR,
+            details={"error": str(e), "response_text": response_preview(response)},
         )
 
 
+def _location_key(latitude: float, longitude: float) -> Tuple[float, float]:
+    """
+    Build the weather cache key for a location.
+
+    Coordinates are rounded to three decimals (about 100 m), so repeated
+    lookups for the same park share one entry.
+
+    Args:
+        latitude: Latitude in degrees
+        longitude: Longitude in degrees
+
+    Returns:
+        Rounded ``(latitude, longitude)`` pair
+    """
+    return (round(latitude, 3), round(longitude, 3))
+
+
+def _retry_config(max_retries: int) -> RetryConfig:
+    """
+    Get the retry configuration for a weather client.
+
+    Args:
+        max_retries: Maximum number of retries
+
+    Returns:
+        The shared default configuration when it matches, else a new one
+    """
+    if max_retries == DEFAULT_RETRY_CONFIG.max_retries:
+        return DEFAULT_RETRY_CONFIG
+    return RetryConfig(max_retries=max_retries)
+
+
 class OpenWeatherClient:
     """Client for OpenWeather API."""
 
+    _ENDPOINT = "weather"
+    _ERROR_KEY = "message"
+
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -61,6 +224,11 @@ class OpenWeatherClient:
         requests_per_hour: int = 1000,
         enable_retry: bool = True,
         max_retries: int = 3,
+        cache_ttl: float = 600.0,
+        http_client: Optional[Any] = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 8,
+        http2: bool = True,
     ):
         """
         Initialize OpenWeather client.
@@ -73,9 +241,17 @@ class OpenWeatherClient:
             requests_per_hour: Maximum requests per hour
             enable_retry: Enable retry logic
             max_retries: Maximum number of retries
+            cache_ttl: Seconds to reuse a location's current weather
+                (0 disables caching)
+            http_client: HTTPX client shared with other providers. When
+                given, ``timeout`` and the retry options are taken from it
+                and ``close()`` leaves it open.
+            max_connections: Maximum number of concurrent connections
+            max_keepalive_connections: Maximum number of idle pooled connections
+            http2: Negotiate HTTP/2 so concurrent requests share a connection
         """
-        self.api_key = api_key or settings.openweather_api_key
-        self.base_url = base_url or settings.openweather_api_base_url
+        self.api_key = api_key or get_settings().openweather_api_key
+        self.base_url = base_url or get_settings().openweather_api_base_url
 
         if not self.api_key:
             logger.warning(
@@ -83,28 +259,37 @@ class OpenWeatherClient:
                 message="OpenWeather API key not provided. Requests will fail.",
             )
 
-        base_client = httpx.Client(
-            base_url=self.base_url,
-            timeout=timeout,
-            follow_redirects=True,
-            verify=False,
-        )
-
-        if enable_retry:
-            retry_config = RetryConfig(
-                max_retries=max_retries,
-                initial_delay=1.0,
-                max_delay=60.0,
-                exponential_base=2.0,
+        self._owns_client = http_client is None
+        if http_client is not None:
+            self.client = http_client
+        else:
+            # Retries run inside the transport, so self.client is a plain client
+            retry_config: Optional[RetryConfig] = None
+            if enable_retry and max_retries > 0:
+                retry_config = _retry_config(max_retries)
+                logger.info(
+                    "retry_enabled",
+                    max_retries=max_retries,
+                    message="Enabled retry logic",
+                )
+            limits = httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
             )
-            self.client = RetryableHTTPClient(base_client, retry_config)
-            logger.info(
-                "retry_enabled",
-                max_retries=max_retries,
-                message="Enabled retry logic",
+            # TLS, HTTP/2 and pool settings live on the transport
+            transport: httpx.BaseTransport = httpx.HTTPTransport(
+                verify=False,
+                http2=http2,
+                limits=limits,
+            )
+            if retry_config is not None:
+                transport = RetryTransport(transport, retry_config)
+            self.client = httpx.Client(
+                base_url=self.base_url,
+                timeout=timeout,
+                follow_redirects=True,
+                transport=transport,
             )
-        else:
-            self.client = base_client
 
         self.rate_limiter: Optional[RateLimiter] = None
         if enable_rate_limiting:
@@ -115,61 +300,29 @@ class OpenWeatherClient:
                 message="Enabled rate limiting",
             )
 
-        logger.info("api_client_initialized", base_url=self.base_url)
+        # Only the coordinates vary between requests
+        self._base_params = {"appid": self.api_key, "units": "metric"}
+        self._weather_url = f"{self.base_url}/{self._ENDPOINT}"
+        query = urlencode({"appid": self.api_key or "", "units": "metric"})
+        self._request_url_template = f"{self._weather_url}?{query}&lat={{}}&lon={{}}"
 
-    def close(self) -> None:
-        """Close the HTTP client."""
-        if isinstance(self.client, RetryableHTTPClient):
-            self.client.client.close()
-        else:
-            self.client.close()
-        logger.debug("api_client_closed", message="Closed OpenWeather client")
+        self.cache: Optional[TTLCache] = TTLCache(ttl=cache_ttl) if cache_ttl else None
+        # Concurrent lookups for one location share one upstream call
+        self._inflight = SingleFlight()
 
-    def _handle_response(self, response: httpx.Response) -> Dict[str, Any]:
-        try:
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            error_details = {"url": str(e.request.url)}
-            error_message = f"HTTP {e.response.status_code} error"
-
-            try:
-                error_data = e.response.json()
-                if isinstance(error_data, dict):
-                    error_message = error_data.get("message", error_message)
-                    error_details.update(error_data)
-            except Exception:
-                error_details["response_text"] = e.response.text[:500]
-
-            logger.error(
-                "api_request_failed",
-                error=error_message,
-                status_code=e.response.status_code,
-                url=str(e.request.url),
-                details=error_details,
-            )
+        logger.info("api_client_initialized", base_url=self.base_url)
 
-            raise WeatherAPIError(
-                message=error_message,
-                status_code=e.response.status_code,
-                error_type=ErrorType.HTTP_ERROR,
-                details=error_details,
-            )
+    def _weather_params(self, latitude: float, longitude: float) -> Dict[str, Any]:
+        """Build current-weather query parameters."""
+        return {"lat": latitude, "lon": longitude, **self._base_params}
 
-        try:
-            data = response.json()
-            logger.debug("response_parsed", url=str(response.url))
-            return data
-        except Exception as e:
-            logger.error("response_parse_failed", error=str(e), url=str(response.url))
-            raise WeatherAPIError(
-                message="Failed to parse API response",
-                status_code=response.status_code,
-                error_type=ErrorType.PARSE_ERROR,
-                details={"error": str(e), "response_text": response.text[:500]},
-            )
+    def _request_url(self, latitude: float, longitude: float) -> str:
+        """
+        Build the full current-weather request URL, checking the API key.
 
-    def get_current_weather(self, latitude: float, longitude: float) -> Dict[str, Any]:
-        """Get current weather from OpenWeather."""
+        The static part of the query string is encoded once at construction;
+        only the numeric coordinates are formatted per call.
+        """
         if not self.api_key:
             raise WeatherAPIError(
                 message="OpenWeather API key is missing",
@@ -177,64 +330,76 @@ class OpenWeatherClient:
                 error_type=ErrorType.MISSING_API_KEY,
                 details={"provider": "openweather"},
             )
+        return self._request_url_template.format(latitude, longitude)
+
+    def close(self) -> None:
+        """Close the HTTP client unless it is shared."""
+        if self._owns_client:
+            self.client.close()
+        logger.debug("api_client_closed", message="Closed OpenWeather client")
 
+    def get_current_weather(self, latitude: float, longitude: float) -> Dict[str, Any]:
+        """Get current weather from OpenWeather."""
+        request_url = self._request_url(latitude, longitude)
+
+        cache_key = _location_key(latitude, longitude)
+        if self.cache is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        # Identical lookups already in flight share that upstream call
+        return self._inflight.do(
+            cache_key,
+            lambda: self._fetch_current_weather(
+                latitude, longitude, cache_key, request_url
+            ),
+        )
+
+    def _fetch_current_weather(
+        self,
+        latitude: float,
+        longitude: float,
+        cache_key: Tuple[float, float],
+        request_url: str,
+    ) -> Dict[str, Any]:
+        """Fetch current weather upstream and store it in the cache."""
+        # Cache hits never reach here, so they do not spend rate limit tokens
         if self.rate_limiter:
             self.rate_limiter.acquire(tokens=1, block=True)
 
-        endpoint = "weather"
-        params = {
-            "lat": latitude,
-            "lon": longitude,
-            "appid": self.api_key,
-            "units": "metric",
-        }
-        url = f"{self.base_url}/{endpoint}"
-        log_api_request(logger, "GET", url, params)
+        url = self._weather_url
+        debug_enabled = is_enabled_for(logger, logging.DEBUG)
+        if debug_enabled:
+            log_api_request(
+                logger, "GET", url, self._weather_params(latitude, longitude)
+            )
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
-            response = self.client.get(endpoint, params=params)
-            duration_ms = (time.time() - start_time) * 1000
-            log_api_response(logger, "GET", url, response.status_code, duration_ms)
-            return self._handle_response(response)
-        except httpx.TimeoutException:
-            duration_ms = (time.time() - start_time) * 1000
-            error_msg = "Request timed out"
-            logger.error("api_timeout", url=url, duration_ms=round(duration_ms, 2))
-            log_api_response(logger, "GET", url, 0, duration_ms, error=error_msg)
-            raise WeatherAPIError(
-                message=error_msg,
-                error_type=ErrorType.TIMEOUT_ERROR,
-                details={"url": url},
-            )
-        except httpx.NetworkError as e:
-            duration_ms = (time.time() - start_time) * 1000
-            error_msg = f"Network error: {str(e)}"
-            logger.error("api_network_error", url=url, error=str(e))
-            log_api_response(logger, "GET", url, 0, duration_ms, error=error_msg)
-            raise WeatherAPIError(
-                message="Network error occurred",
-                error_type=ErrorType.NETWORK_ERROR,
-                details={"url": url, "error": str(e)},
-            )
+            response = self.client.get(request_url)
+            # Successful responses are logged at DEBUG; errors always are
+            if debug_enabled or response.status_code >= 400:
+                log_api_response(
+                    logger, "GET", url, response.status_code, ms_since(start_ns)
+                )
+            data = _handle_response(response, self._ERROR_KEY)
+            if self.cache is not None:
+                self.cache.set(cache_key, data)
+            return data
         except WeatherAPIError:
             raise
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
-            error_msg = f"Unexpected error: {str(e)}"
-            logger.error("api_unexpected_error", url=url, error=str(e), exc_info=True)
-            log_api_response(logger, "GET", url, 0, duration_ms, error=error_msg)
-            raise WeatherAPIError(
-                message="Unexpected error occurred",
-                error_type=ErrorType.UNKNOWN_ERROR,
-                details={"error": str(e), "url": url},
-            )
+            raise _request_failed(e, url, start_ns)
 
 
 class OpenMeteoClient:
     """Client for Open-Meteo API."""
 
+    _ENDPOINT = "forecast"
+    _ERROR_KEY = "reason"
+
     def __init__(
         self,
         base_url: Optional[str] = None,
@@ -243,6 +408,11 @@ class OpenMeteoClient:
         requests_per_hour: int = 1000,
         enable_retry: bool = True,
         max_retries: int = 3,
+        cache_ttl: float = 600.0,
+        http_client: Optional[Any] = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 8,
+        http2: bool = True,
     ):
         """
         Initialize Open-Meteo client.
@@ -254,31 +424,48 @@ class OpenMeteoClient:
             requests_per_hour: Maximum requests per hour
             enable_retry: Enable retry logic
             max_retries: Maximum number of retries
+            cache_ttl: Seconds to reuse a location's current weather
+                (0 disables caching)
+            http_client: HTTPX client shared with other providers. When
+                given, ``timeout`` and the retry options are taken from it
+                and ``close()`` leaves it open.
+            max_connections: Maximum number of concurrent connections
+            max_keepalive_connections: Maximum number of idle pooled connections
+            http2: Negotiate HTTP/2 so concurrent requests share a connection
         """
-        self.base_url = base_url or settings.open_meteo_api_base_url
-
-        base_client = httpx.Client(
-            base_url=self.base_url,
-            timeout=timeout,
-            follow_redirects=True,
-            verify=False,  # Disable SSL verification for Windows compatibility
-        )
+        self.base_url = base_url or get_settings().open_meteo_api_base_url
 
-        if enable_retry:
-            retry_config = RetryConfig(
-                max_retries=max_retries,
-                initial_delay=1.0,
-                max_delay=60.0,
-                exponential_base=2.0,
+        self._owns_client = http_client is None
+        if http_client is not None:
+            self.client = http_client
+        else:
+            # Retries run inside the transport, so self.client is a plain client
+            retry_config: Optional[RetryConfig] = None
+            if enable_retry and max_retries > 0:
+                retry_config = _retry_config(max_retries)
+                logger.info(
+                    "retry_enabled",
+                    max_retries=max_retries,
+                    message="Enabled retry logic",
+                )
+            limits = httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
             )
-            self.client = RetryableHTTPClient(base_client, retry_config)
-            logger.info(
-                "retry_enabled",
-                max_retries=max_retries,
-                message="Enabled retry logic",
+            # TLS, HTTP/2 and pool settings live on the transport
+            transport: httpx.BaseTransport = httpx.HTTPTransport(
+                verify=False,  # Disable SSL verification for Windows compatibility
+                http2=http2,
+                limits=limits,
+            )
+            if retry_config is not None:
+                transport = RetryTransport(transport, retry_config)
+            self.client = httpx.Client(
+                base_url=self.base_url,
+                timeout=timeout,
+                follow_redirects=True,
+                transport=transport,
             )
-        else:
-            self.client = base_client
 
         self.rate_limiter: Optional[RateLimiter] = None
         if enable_rate_limiting:
@@ -289,124 +476,117 @@ class OpenMeteoClient:
                 message="Enabled rate limiting",
             )
 
+        # Only the coordinates vary between requests
+        self._base_params = {"current_weather": True, "windspeed_unit": "ms"}
+        self._weather_url = f"{self.base_url}/{self._ENDPOINT}"
+        self._request_url_template = (
+            f"{self._weather_url}?current_weather=true&windspeed_unit=ms"
+            "&latitude={}&longitude={}"
+        )
+
+        self.cache: Optional[TTLCache] = TTLCache(ttl=cache_ttl) if cache_ttl else None
+        # Concurrent lookups for one location share one upstream call
+        self._inflight = SingleFlight()
+
         logger.info("api_client_initialized", base_url=self.base_url)
 
+    def _weather_params(self, latitude: float, longitude: float) -> Dict[str, Any]:
+        """Build current-weather query parameters."""
+        return {"latitude": latitude, "longitude": longitude, **self._base_params}
+
+    def _request_url(self, latitude: float, longitude: float) -> str:
+        """Build the full current-weather request URL from the template."""
+        return self._request_url_template.format(latitude, longitude)
+
     def close(self) -> None:
-        """Close the HTTP client."""
-        if isinstance(self.client, RetryableHTTPClient):
-            self.client.client.close()
-        else:
+        """Close the HTTP client unless it is shared."""
+        if self._owns_client:
             self.client.close()
         logger.debug("api_client_closed", message="Closed Open-Meteo client")
 
-    def _handle_response(self, response: httpx.Response) -> Dict[str, Any]:
-        try:
-            response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            error_details = {"url": str(e.request.url)}
-            error_message = f"HTTP {e.response.status_code} error"
-
-            try:
-                error_data = e.response.json()
-                if isinstance(error_data, dict):
-                    error_message = error_data.get("reason", error_message)
-                    error_details.update(error_data)
-            except Exception:
-                error_details["response_text"] = e.response.text[:500]
-
-            logger.error(
-                "api_request_failed",
-                error=error_message,
-                status_code=e.response.status_code,
-                url=str(e.request.url),
-                details=error_details,
-            )
-
-            raise WeatherAPIError(
-                message=error_message,
-                status_code=e.response.status_code,
-                error_type=ErrorType.HTTP_ERROR,
-                details=error_details,
-            )
-
-        try:
-            data = response.json()
-            logger.debug("response_parsed", url=str(response.url))
-            return data
-        except Exception as e:
-            logger.error("response_parse_failed", error=str(e), url=str(response.url))
-            raise WeatherAPIError(
-                message="Failed to parse API response",
-                status_code=response.status_code,
-                error_type=ErrorType.PARSE_ERROR,
-                details={"error": str(e), "response_text": response.text[:500]},
-            )
-
     def get_current_weather(self, latitude: float, longitude: float) -> Dict[str, Any]:
         """Get current weather from Open-Meteo."""
+        cache_key = _location_key(latitude, longitude)
+        if self.cache is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        # Identical lookups already in flight share that upstream call
+        return self._inflight.do(
+            cache_key,
+            lambda: self._fetch_current_weather(latitude, longitude, cache_key),
+        )
+
+    def _fetch_current_weather(
+        self,
+        latitude: float,
+        longitude: float,
+        cache_key: Tuple[float, float],
+    ) -> Dict[str, Any]:
+        """Fetch current weather upstream and store it in the cache."""
+        # Cache hits never reach here, so they do not spend rate limit tokens
         if self.rate_limiter:
             self.rate_limiter.acquire(tokens=1, block=True)
 
-        endpoint = "forecast"
-        params = {
-            "latitude": latitude,
-            "longitude": longitude,
-            "current_weather": True,
-            "windspeed_unit": "ms",
-        }
-        url = f"{self.base_url}/{endpoint}"
-        log_api_request(logger, "GET", url, params)
+        request_url = self._request_url(latitude, longitude)
+        url = self._weather_url
+        debug_enabled = is_enabled_for(logger, logging.DEBUG)
+        if debug_enabled:
+            log_api_request(
+                logger, "GET", url, self._weather_params(latitude, longitude)
+            )
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
-            response = self.client.get(endpoint, params=params)
-            duration_ms = (time.time() - start_time) * 1000
-            log_api_response(logger, "GET", url, response.status_code, duration_ms)
-            return self._handle_response(response)
-        except httpx.TimeoutException:
-            duration_ms = (time.time() - start_time) * 1000
-            error_msg = "Request timed out"
-            logger.error("api_timeout", url=url, duration_ms=round(duration_ms, 2))
-            log_api_response(logger, "GET", url, 0, duration_ms, error=error_msg)
-            raise WeatherAPIError(
-                message=error_msg,
-                error_type=ErrorType.TIMEOUT_ERROR,
-                details={"url": url},
-            )
-        except httpx.NetworkError as e:
-            duration_ms = (time.time() - start_time) * 1000
-            error_msg = f"Network error: {str(e)}"
-            logger.error("api_network_error", url=url, error=str(e))
-            log_api_response(logger, "GET", url, 0, duration_ms, error=error_msg)
-            raise WeatherAPIError(
-                message="Network error occurred",
-                error_type=ErrorType.NETWORK_ERROR,
-                details={"url": url, "error": str(e)},
-            )
+            response = self.client.get(request_url)
+            # Successful responses are logged at DEBUG; errors always are
+            if debug_enabled or response.status_code >= 400:
+                log_api_response(
+                    logger, "GET", url, response.status_code, ms_since(start_ns)
+                )
+            data = _handle_response(response, self._ERROR_KEY)
+            if self.cache is not None:
+                self.cache.set(cache_key, data)
+            return data
         except WeatherAPIError:
             raise
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
-            error_msg = f"Unexpected error: {str(e)}"
-            logger.error("api_unexpected_error", url=url, error=str(e), exc_info=True)
-            log_api_response(logger, "GET", url, 0, duration_ms, error=error_msg)
-            raise WeatherAPIError(
-                message="Unexpected error occurred",
-                error_type=ErrorType.UNKNOWN_ERROR,
-                details={"error": str(e), "url": url},
-            )
+            raise _request_failed(e, url, start_ns)
 
 
 _openweather_client: Optional[OpenWeatherClient] = None
 _open_meteo_client: Optional[OpenMeteoClient] = None
+_http_client: Optional[httpx.Client] = None
+_clients_lock = threading.Lock()
+
+
+def _get_http_client() -> httpx.Client:
+    """
+    Get or create the HTTP client shared by the global weather clients.
+
+    Must be called with ``_clients_lock`` held.
+    """
+    global _http_client
+    if _http_client is None:
+        # Pooled with the NPS and AirVisual clients; closing this client
+        # leaves the shared pool open
+        _http_client = httpx.Client(
+            timeout=20.0,
+            follow_redirects=True,
+            transport=RetryTransport(get_http_transport(), DEFAULT_RETRY_CONFIG),
+        )
+    return _http_client
 
 
 def get_openweather_client() -> OpenWeatherClient:
     """Get or create the global OpenWeather client instance."""
     global _openweather_client
     if _openweather_client is None:
-        _openweather_client = OpenWeatherClient()
+        with _clients_lock:
+            if _openweather_client is None:
+                _openweather_client = OpenWeatherClient(http_client=_get_http_client())
     return _openweather_client
 
 
@@ -414,16 +594,22 @@ def get_open_meteo_client() -> OpenMeteoClient:
     """Get or create the global Open-Meteo client instance."""
     global _open_meteo_client
     if _open_meteo_client is None:
-        _open_meteo_client = OpenMeteoClient()
+        with _clients_lock:
+            if _open_meteo_client is None:
+                _open_meteo_client = OpenMeteoClient(http_client=_get_http_client())
     return _open_meteo_client
 
 
 def close_weather_clients() -> None:
     """Close global weather client instances."""
-    global _openweather_client, _open_meteo_client
-    if _openweather_client is not None:
-        _openweather_client.close()
-        _openweather_client = None
-    if _open_meteo_client is not None:
-        _open_meteo_client.close()
-        _open_meteo_client = None
+    global _openweather_client, _open_meteo_client, _http_client
+    with _clients_lock:
+        if _openweather_client is not None:
+            _openweather_client.close()
+            _openweather_client = None
+        if _open_meteo_client is not None:
+            _open_meteo_client.close()
+            _open_meteo_client = None
+        if _http_client is not None:
+            _http_client.close()
+            _http_client = None
@@ -1,7 +1,8 @@
 """Configuration management using Pydantic settings."""
 
 import sys
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -28,7 +29,27 @@ class Settings(BaseSettings):
     log_json: bool = False  # Whether to output logs in JSON format
     log_include_timestamp: bool = True  # Whether to include timestamps in logs
     server_name: str = "National Parks"
+    # Validate hand-built weather, air quality and error payloads against
+    # their models
+    debug_validate: bool = False
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the application settings, loading them on first use.
+
+    Tests can call ``get_settings.cache_clear()`` to reload from a patched
+    environment.
+
+    Returns:
+        The shared Settings instance
+    """
+    return Settings()
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the legacy ``settings`` module attribute lazily."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
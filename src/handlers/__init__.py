@@ -1,14 +1,14 @@
-"""Tool handlers for the National Parks MCP server."""
-
-from src.handlers.find_parks import find_parks
-from src.handlers.get_air_quality import get_air_quality
-from src.handlers.get_alerts import get_alerts
-from src.handlers.get_campgrounds import get_campgrounds
-from src.handlers.get_events import get_events
-from src.handlers.get_park_context import get_park_context
-from src.handlers.get_park_details import get_park_details
-from src.handlers.get_visitor_centers import get_visitor_centers
-from src.handlers.get_weather import get_weather
+"""
+Tool handlers for the National Parks MCP server.
+
+Handlers are imported on first use, so starting the server only pays for the
+modules behind the tools that are actually called.
+"""
+
+import importlib
+import sys
+import types
+from typing import Any, Callable, Dict
 
 __all__ = [
     "find_parks",
@@ -20,4 +20,59 @@ __all__ = [
     "get_events",
     "get_weather",
     "get_park_context",
+    "get_park_context_async",
+    "load_handler",
 ]
+
+# Coroutine handler variants, mapped to the submodule defining them
+_ASYNC_HANDLERS = {"get_park_context_async": "get_park_context"}
+_HANDLER_NAMES = frozenset(__all__) - {"load_handler"} - set(_ASYNC_HANDLERS)
+_loaded: Dict[str, Callable[..., Dict[str, Any]]] = {}
+
+
+def load_handler(name: str) -> Callable[..., Dict[str, Any]]:
+    """
+    Import a tool handler by name.
+
+    Each handler lives in the submodule of the same name; the function is
+    taken from the submodule and cached here. Async variants such as
+    ``get_park_context_async`` are taken from their sync handler's submodule.
+
+    Args:
+        name: Handler function name, e.g. ``"find_parks"``
+
+    Returns:
+        The handler function
+
+    Raises:
+        AttributeError: If ``name`` is not a known handler
+    """
+    handler = _loaded.get(name)
+    if handler is None:
+        submodule = _ASYNC_HANDLERS.get(name, name)
+        if submodule not in _HANDLER_NAMES:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        module = importlib.import_module(f"{__name__}.{submodule}")
+        handler = _loaded[name] = getattr(module, name)
+        globals()[name] = handler
+    return handler
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve handler functions lazily (PEP 562)."""
+    return load_handler(name)
+
+
+class _HandlerPackage(types.ModuleType):
+    """Package module that keeps handler names bound to functions."""
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Importing a handler submodule binds it over the function of the same
+        # name; bind the function instead so ``from src.handlers import X``
+        # never returns a module.
+        if name in _HANDLER_NAMES and isinstance(value, types.ModuleType):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _HandlerPackage
@@ -0,0 +1,131 @@
+"""Response builders shared by the weather and air quality handlers."""
+
+import time
+from typing import Any, Dict, Optional
+
+from src.models.external import AirQualityResponse, WeatherResponse
+from src.utils.validation import checked
+
+# Stand-in for missing sections of upstream payloads; never mutated
+_EMPTY: Dict[str, Any] = {}
+
+
+def pack(**fields: Any) -> Dict[str, Any]:
+    """Build a response dict, dropping fields whose value is None."""
+    return {key: value for key, value in fields.items() if value is not None}
+
+
+def _float(value: Any) -> Optional[float]:
+    return None if value is None else float(value)
+
+
+def _format_openweather_time(timestamp: int | None) -> str | None:
+    # Same output as datetime.fromtimestamp(ts, tz=timezone.utc).isoformat()
+    # for whole-second timestamps, without building a datetime
+    if timestamp is None:
+        return None
+    t = time.gmtime(timestamp)
+    return (
+        f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+        f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}+00:00"
+    )
+
+
+def build_openweather_response(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Normalize an OpenWeather current weather payload.
+
+    Args:
+        data: Raw OpenWeather response
+
+    Returns:
+        Dictionary shaped like WeatherResponse, without None fields
+    """
+    coord = data.get("coord") or _EMPTY
+    main = data.get("main") or _EMPTY
+    wind = data.get("wind") or _EMPTY
+    weather_desc = None
+    if data.get("weather"):
+        weather_desc = data["weather"][0].get("description")
+
+    return checked(
+        WeatherResponse,
+        pack(
+            provider="openweather",
+            latitude=float(coord.get("lat")),
+            longitude=float(coord.get("lon")),
+            temperature_c=_float(main.get("temp")),
+            humidity_percent=_float(main.get("humidity")),
+            pressure_hpa=_float(main.get("pressure")),
+            wind_speed_m_s=_float(wind.get("speed")),
+            wind_direction_deg=_float(wind.get("deg")),
+            weather_description=weather_desc,
+            observation_time=_format_openweather_time(data.get("dt")),
+        ),
+    )
+
+
+def build_open_meteo_response(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Normalize an Open-Meteo current weather payload.
+
+    Args:
+        data: Raw Open-Meteo response
+
+    Returns:
+        Dictionary shaped like WeatherResponse, without None fields
+    """
+    current = data.get("current_weather") or _EMPTY
+    return checked(
+        WeatherResponse,
+        pack(
+            provider="open-meteo",
+            latitude=float(data.get("latitude")),
+            longitude=float(data.get("longitude")),
+            temperature_c=_float(current.get("temperature")),
+            wind_speed_m_s=_float(current.get("windspeed")),
+            wind_direction_deg=_float(current.get("winddirection")),
+            observation_time=current.get("time"),
+        ),
+    )
+
+
+def build_air_quality_response(
+    response: Dict[str, Any], latitude: float, longitude: float
+) -> Dict[str, Any]:
+    """
+    Normalize an AirVisual nearest-city payload.
+
+    Args:
+        response: Raw AirVisual response
+        latitude: Requested latitude, used if the response has no coordinates
+        longitude: Requested longitude, used if the response has no coordinates
+
+    Returns:
+        Dictionary shaped like AirQualityResponse, without None fields
+    """
+    data = response.get("data") or _EMPTY
+    location_data = data.get("location") or _EMPTY
+    coordinates = location_data.get("coordinates") or (longitude, latitude)
+    pollution = (data.get("current") or _EMPTY).get("pollution") or _EMPTY
+
+    return checked(
+        AirQualityResponse,
+        pack(
+            provider="airvisual",
+            location=pack(
+                city=data.get("city"),
+                state=data.get("state"),
+                country=data.get("country"),
+                latitude=float(coordinates[1]),
+                longitude=float(coordinates[0]),
+            ),
+            indices=pack(
+                aqi_us=pollution.get("aqius"),
+                aqi_cn=pollution.get("aqicn"),
+                main_pollutant_us=pollution.get("mainus"),
+                main_pollutant_cn=pollution.get("maincn"),
+            ),
+            timestamp=pollution.get("ts"),
+        ),
+    )
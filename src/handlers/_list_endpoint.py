@@ -0,0 +1,104 @@
+"""Shared fetch, validate, format and group flow for NPS list endpoints."""
+
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional
+
+from pydantic import TypeAdapter
+
+import src.api.client as nps_client
+from src.utils.logging import get_logger
+from src.utils.validation import validate_items
+
+logger = get_logger(__name__)
+
+
+def query_params(limit: int, **optional: Any) -> Dict[str, Any]:
+    """
+    Build NPS query parameters in one pass.
+
+    Args:
+        limit: Page size, always sent
+        **optional: Parameters sent only when they are set and non-empty
+
+    Returns:
+        Query parameters for the NPS client
+    """
+    return {"limit": limit, **{key: value for key, value in optional.items() if value}}
+
+
+def fetch_list(
+    client_fn: Callable[..., Dict[str, Any]],
+    adapter: TypeAdapter,
+    formatter: Callable[[List[Any]], List[Dict[str, Any]]],
+    result_key: str,
+    params: Dict[str, Any],
+    noun: str,
+    item_label: Optional[str] = None,
+    group_by_park: bool = True,
+) -> Dict[str, Any]:
+    """
+    Fetch an NPS list endpoint and shape it into the handler response.
+
+    Items are validated with ``adapter``, formatted with ``formatter`` and
+    grouped by their ``parkCode``.
+
+    Args:
+        client_fn: Bound NPS client method to call with ``params``
+        adapter: TypeAdapter for a list of the item model
+        formatter: Formatter turning validated items into response dicts
+        result_key: Response key for the items; groups go under
+            ``<result_key>ByPark``
+        params: Query parameters; ``limit`` must be set
+        noun: Plural item name used in log events
+        item_label: If set, invalid items are skipped and logged using this
+            field as their label; otherwise a ValidationError is raised
+        group_by_park: If False, the ``<result_key>ByPark`` grouping is
+            left out of the response
+
+    Returns:
+        Dictionary with ``total``, ``limit``, ``start``, the items, and
+        unless disabled the items grouped by park code
+
+    Raises:
+        NPSAPIError: If the API request fails
+        ValidationError: If an item is invalid and ``item_label`` is not set
+    """
+    try:
+        response = client_fn(**params)
+    except nps_client.NPSAPIError as e:
+        logger.error("list_request_failed", items=noun, error=e.message)
+        raise
+    logger.info("list_items_found", items=noun, total=response.get("total", 0))
+
+    items = response.get("data", [])
+    if item_label is None:
+        validated_data = adapter.validate_python(items)
+    else:
+        # Skip invalid items so one bad record does not fail the whole page
+        validated_data = validate_items(
+            adapter,
+            items,
+            lambda item, errors: logger.warning(
+                "list_item_invalid",
+                items=noun,
+                item=item.get(item_label, "unknown"),
+                errors=errors,
+            ),
+        )
+
+    formatted_items = formatter(validated_data)
+    result = {
+        "total": int(response.get("total", len(validated_data))),
+        "limit": int(response.get("limit", params["limit"])),
+        "start": int(response.get("start", 0)),
+        result_key: formatted_items,
+    }
+    if not group_by_park:
+        return result
+
+    # Group items by park code for better organization
+    items_by_park: Dict[str, list] = defaultdict(list)
+    for item in formatted_items:
+        items_by_park[item["parkCode"]].append(item)
+    result[f"{result_key}ByPark"] = dict(items_by_park)
+    return result
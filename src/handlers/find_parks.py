@@ -1,17 +1,22 @@
 """Handler for finding parks."""
 
+import logging
 from typing import Any, Dict
 
 import src.api.client as nps_client
 from src.constants import STATE_CODES
+from src.handlers._list_endpoint import query_params
 from src.models.requests import FindParksRequest
-from src.models.responses import NPSResponse, ParkData
+from src.models.responses import PARK_LIST_ADAPTER
 from src.utils.formatters import format_park_data
-from src.utils.logging import get_logger
+from src.utils.logging import get_logger, is_enabled_for
 
 get_client = nps_client.get_client
 logger = get_logger(__name__)
 
+# Constant-time membership checks for state code validation
+_VALID_STATE_CODES = frozenset(STATE_CODES)
+
 
 def find_parks(request: FindParksRequest) -> Dict[str, Any]:
     """
@@ -26,20 +31,26 @@ def find_parks(request: FindParksRequest) -> Dict[str, Any]:
     Raises:
         NPSAPIError: If the API request fails
     """
-    logger.info(
-        "finding_parks",
-        params=request.model_dump(exclude_none=True),
-        message="Finding parks with search parameters",
-    )
+    # Dumping the request is only worth it when the record will be emitted
+    if is_enabled_for(logger, logging.INFO):
+        logger.info(
+            "finding_parks",
+            params=request.model_dump(exclude_none=True),
+            message="Finding parks with search parameters",
+        )
 
     # Validate state codes if provided
     if request.state_code:
-        provided_states = [s.strip().upper() for s in request.state_code.split(",")]
-        invalid_states = [
-            state for state in provided_states if state not in STATE_CODES
-        ]
-
-        if invalid_states:
+        state_codes = request.state_code.split(",")
+        invalid = set(map(str.upper, map(str.strip, state_codes))) - _VALID_STATE_CODES
+
+        if invalid:
+            # Report invalid codes in the order given, once each
+            invalid_states = [
+                state
+                for state in dict.fromkeys(s.strip().upper() for s in state_codes)
+                if state in invalid
+            ]
             logger.warning(
                 "invalid_state_codes",
                 invalid_states=invalid_states,
@@ -57,16 +68,13 @@ def find_parks(request: FindParksRequest) -> Dict[str, Any]:
     limit = min(request.limit, 50) if request.limit else 10
 
     # Build query parameters from request
-    params = {}
-    if request.state_code:
-        params["stateCode"] = request.state_code
-    if request.q:
-        params["q"] = request.q
-    params["limit"] = limit
-    if request.start:
-        params["start"] = request.start
-    if request.activities:
-        params["activities"] = request.activities
+    params = query_params(
+        limit,
+        stateCode=request.state_code,
+        q=request.q,
+        start=request.start,
+        activities=request.activities,
+    )
 
     # Make API request
     try:
@@ -76,16 +84,16 @@ def find_parks(request: FindParksRequest) -> Dict[str, Any]:
             "parks_found", total=total_parks, message=f"Found {total_parks} parks"
         )
 
-        # Parse response into Pydantic models
-        nps_response = NPSResponse[ParkData](**response)
+        # Parse the park records into Pydantic models
+        parks = PARK_LIST_ADAPTER.validate_python(response.get("data", []))
 
         # Format the response for better readability
-        formatted_parks = format_park_data(nps_response.data)
+        formatted_parks = format_park_data(parks)
 
         result = {
-            "total": int(nps_response.total),
-            "limit": int(nps_response.limit),
-            "start": int(nps_response.start),
+            "total": total_parks,
+            "limit": int(response.get("limit", limit)),
+            "start": int(response.get("start", 0)),
             "parks": formatted_parks,
         }
 
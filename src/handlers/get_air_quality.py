@@ -3,11 +3,7 @@
 from typing import Any, Dict
 
 from src.api.air_quality import get_air_quality_client
-from src.models.external import (
-    AirQualityIndices,
-    AirQualityLocation,
-    AirQualityResponse,
-)
+from src.handlers._external import build_air_quality_response
 from src.models.requests import GetAirQualityRequest
 from src.utils.error_handler import handle_invalid_input_error, handle_not_found_error
 from src.utils.geo import LocationResolutionError, resolve_park_location
@@ -49,29 +45,7 @@ def get_air_quality(request: GetAirQualityRequest) -> Dict[str, Any]:
     client = get_air_quality_client()
     response = client.get_nearest_city(latitude, longitude)
 
-    data = response.get("data", {})
-    location_data = data.get("location", {}) or {}
-    coordinates = location_data.get("coordinates") or [longitude, latitude]
-    pollution = (data.get("current") or {}).get("pollution", {})
-
-    result = AirQualityResponse(
-        location=AirQualityLocation(
-            city=data.get("city"),
-            state=data.get("state"),
-            country=data.get("country"),
-            latitude=float(coordinates[1]),
-            longitude=float(coordinates[0]),
-        ),
-        indices=AirQualityIndices(
-            aqi_us=pollution.get("aqius"),
-            aqi_cn=pollution.get("aqicn"),
-            main_pollutant_us=pollution.get("mainus"),
-            main_pollutant_cn=pollution.get("maincn"),
-        ),
-        timestamp=pollution.get("ts"),
-    )
-
-    payload = result.model_dump(exclude_none=True)
+    payload = build_air_quality_response(response, latitude, longitude)
     if park:
         payload["park"] = {"name": park.full_name, "code": park.park_code}
 
@@ -1,16 +1,22 @@
 """Handler for getting park alerts and closures."""
 
-from typing import Any, Dict
+import logging
+from typing import Any, Dict, List, Optional
+
+from pydantic import TypeAdapter
 
 import src.api.client as nps_client
+from src.handlers._list_endpoint import fetch_list, query_params
 from src.models.requests import GetAlertsRequest
-from src.models.responses import AlertData, NPSResponse
+from src.models.responses import AlertData
 from src.utils.formatters import format_alert_data
-from src.utils.logging import get_logger
+from src.utils.logging import get_logger, is_enabled_for
 
 get_client = nps_client.get_client
 logger = get_logger(__name__)
 
+_ALERT_LIST_ADAPTER = TypeAdapter(List[AlertData])
+
 
 def get_alerts(request: GetAlertsRequest) -> Dict[str, Any]:
     """
@@ -25,7 +31,13 @@ def get_alerts(request: GetAlertsRequest) -> Dict[str, Any]:
     Raises:
         NPSAPIError: If the API request fails
     """
-    logger.info(f"Getting alerts with params: {request.model_dump(exclude_none=True)}")
+    # Dumping the request is only worth it when the record will be emitted
+    if is_enabled_for(logger, logging.INFO):
+        logger.info(
+            "getting_alerts",
+            params=request.model_dump(exclude_none=True),
+            message="Getting alerts with search parameters",
+        )
 
     # Get API client
     client = get_client()
@@ -34,42 +46,35 @@ def get_alerts(request: GetAlertsRequest) -> Dict[str, Any]:
     limit = min(request.limit, 50) if request.limit else 10
 
     # Build query parameters from request
-    params = {"limit": limit}
-    if request.park_code:
-        params["parkCode"] = request.park_code
-    if request.start:
-        params["start"] = request.start
-    if request.q:
-        params["q"] = request.q
-
-    # Make API request
-    try:
-        response = client.get_alerts(**params)
-        logger.info(f"Found {response.get('total', 0)} alerts")
-
-        # Parse response into Pydantic models
-        nps_response = NPSResponse[AlertData](**response)
-
-        # Format the response for better readability
-        formatted_alerts = format_alert_data(nps_response.data)
-
-        # Group alerts by park code for better organization
-        alerts_by_park: Dict[str, list] = {}
-        for alert in formatted_alerts:
-            park_code = alert["parkCode"]
-            if park_code not in alerts_by_park:
-                alerts_by_park[park_code] = []
-            alerts_by_park[park_code].append(alert)
-
-        result = {
-            "total": int(nps_response.total),
-            "limit": int(nps_response.limit),
-            "start": int(nps_response.start),
-            "alerts": formatted_alerts,
-            "alertsByPark": alerts_by_park,
-        }
-
-        return result
-    except nps_client.NPSAPIError as e:
-        logger.error(f"Failed to get alerts: {e.message}")
-        raise
+    params = query_params(
+        limit, parkCode=request.park_code, start=request.start, q=request.q
+    )
+
+    return fetch_list(
+        client.get_alerts,
+        _ALERT_LIST_ADAPTER,
+        format_alert_data,
+        "alerts",
+        params,
+        "alerts",
+        group_by_park=request.include_grouping,
+    )
+
+
+def get_alerts_bulk(
+    park_codes: List[str], limit: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Get alerts for several parks with a single NPS API request.
+
+    Args:
+        park_codes: Park codes to fetch alerts for
+        limit: Maximum number of alerts to return across all parks
+
+    Returns:
+        Dictionary containing alert data, grouped per park in ``alertsByPark``
+
+    Raises:
+        NPSAPIError: If the API request fails
+    """
+    return get_alerts(GetAlertsRequest(park_code=park_codes, limit=limit))
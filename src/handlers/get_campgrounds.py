@@ -1,19 +1,22 @@
 """Handler for getting campground information."""
 
-from typing import Any, Dict
+import logging
+from typing import Any, Dict, List
 
-from pydantic import ValidationError
+from pydantic import TypeAdapter
 
 import src.api.client as nps_client
+from src.handlers._list_endpoint import fetch_list, query_params
 from src.models.requests import GetCampgroundsRequest
-from src.models.responses import CampgroundData, NPSResponse
+from src.models.responses import CampgroundData
 from src.utils.formatters import format_campground_data
-from src.utils.logging import get_logger
+from src.utils.logging import get_logger, is_enabled_for
 
 get_client = nps_client.get_client
-
 logger = get_logger(__name__)
 
+_CAMPGROUND_LIST_ADAPTER = TypeAdapter(List[CampgroundData])
+
 
 def get_campgrounds(request: GetCampgroundsRequest) -> Dict[str, Any]:
     """
@@ -28,9 +31,13 @@ def get_campgrounds(request: GetCampgroundsRequest) -> Dict[str, Any]:
     Raises:
         NPSAPIError: If the API request fails
     """
-    logger.info(
-        f"Getting campgrounds with params: {request.model_dump(exclude_none=True)}"
-    )
+    # Dumping the request is only worth it when the record will be emitted
+    if is_enabled_for(logger, logging.INFO):
+        logger.info(
+            "getting_campgrounds",
+            params=request.model_dump(exclude_none=True),
+            message="Getting campgrounds with search parameters",
+        )
 
     # Get API client
     client = get_client()
@@ -39,59 +46,17 @@ def get_campgrounds(request: GetCampgroundsRequest) -> Dict[str, Any]:
     limit = min(request.limit, 50) if request.limit else 10
 
     # Build query parameters from request
-    params = {"limit": limit}
-    if request.park_code:
-        params["parkCode"] = request.park_code
-    if request.start:
-        params["start"] = request.start
-    if request.q:
-        params["q"] = request.q
-
-    # Make API request
-    try:
-        response = client.get_campgrounds(**params)
-        logger.info(f"Found {response.get('total', 0)} campgrounds")
-
-        # Parse response items individually with graceful error handling
-        validated_data = []
-        for item in response.get("data", []):
-            try:
-                validated_item = CampgroundData.model_validate(item)
-                validated_data.append(validated_item)
-            except ValidationError as e:
-                logger.warning(
-                    f"Validation error for campground {item.get('name', 'unknown')}: {e}"
-                )
-                continue
-
-        # Create response with validated items and ensure metadata is always present
-        nps_response = NPSResponse[CampgroundData](
-            total=response.get("total", str(len(validated_data))),
-            limit=response.get("limit", str(limit)),
-            start=response.get("start", "0"),
-            data=validated_data,
-        )
-
-        # Format the response for better readability
-        formatted_campgrounds = format_campground_data(nps_response.data)
-
-        # Group campgrounds by park code for better organization
-        campgrounds_by_park: Dict[str, list] = {}
-        for campground in formatted_campgrounds:
-            park_code = campground["parkCode"]
-            if park_code not in campgrounds_by_park:
-                campgrounds_by_park[park_code] = []
-            campgrounds_by_park[park_code].append(campground)
-
-        result = {
-            "total": int(nps_response.total),
-            "limit": int(nps_response.limit),
-            "start": int(nps_response.start),
-            "campgrounds": formatted_campgrounds,
-            "campgroundsByPark": campgrounds_by_park,
-        }
+    params = query_params(
+        limit, parkCode=request.park_code, start=request.start, q=request.q
+    )
 
-        return result
-    except nps_client.NPSAPIError as e:
-        logger.error(f"Failed to get campgrounds: {e.message}")
-        raise
+    return fetch_list(
+        client.get_campgrounds,
+        _CAMPGROUND_LIST_ADAPTER,
+        format_campground_data,
+        "campgrounds",
+        params,
+        "campgrounds",
+        item_label="name",
+        group_by_park=request.include_grouping,
+    )
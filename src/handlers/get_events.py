@@ -1,18 +1,22 @@
 """Handler for getting park events and programs."""
 
-from typing import Any, Dict
+import logging
+from typing import Any, Dict, List
 
-from pydantic import ValidationError
+from pydantic import TypeAdapter
 
 import src.api.client as nps_client
+from src.handlers._list_endpoint import fetch_list, query_params
 from src.models.requests import GetEventsRequest
-from src.models.responses import EventData, NPSResponse
+from src.models.responses import EventData
 from src.utils.formatters import format_event_data
-from src.utils.logging import get_logger
+from src.utils.logging import get_logger, is_enabled_for
 
 get_client = nps_client.get_client
 logger = get_logger(__name__)
 
+_EVENT_LIST_ADAPTER = TypeAdapter(List[EventData])
+
 
 def get_events(request: GetEventsRequest) -> Dict[str, Any]:
     """
@@ -27,7 +31,13 @@ def get_events(request: GetEventsRequest) -> Dict[str, Any]:
     Raises:
         NPSAPIError: If the API request fails
     """
-    logger.info(f"Getting events with params: {request.model_dump(exclude_none=True)}")
+    # Dumping the request is only worth it when the record will be emitted
+    if is_enabled_for(logger, logging.INFO):
+        logger.info(
+            "getting_events",
+            params=request.model_dump(exclude_none=True),
+            message="Getting events with search parameters",
+        )
 
     # Get API client
     client = get_client()
@@ -36,63 +46,22 @@ def get_events(request: GetEventsRequest) -> Dict[str, Any]:
     limit = min(request.limit, 50) if request.limit else 10
 
     # Build query parameters from request
-    params = {"limit": limit}
-    if request.park_code:
-        params["parkCode"] = request.park_code
-    if request.start:
-        params["start"] = request.start
-    if request.q:
-        params["q"] = request.q
-    if request.date_start:
-        params["dateStart"] = request.date_start
-    if request.date_end:
-        params["dateEnd"] = request.date_end
-
-    # Make API request
-    try:
-        response = client.get_events(**params)
-        logger.info(f"Found {response.get('total', 0)} events")
-
-        # Parse response items individually with graceful error handling
-        validated_data = []
-        for item in response.get("data", []):
-            try:
-                validated_item = EventData.model_validate(item)
-                validated_data.append(validated_item)
-            except ValidationError as e:
-                logger.warning(
-                    f"Validation error for event {item.get('title', 'unknown')}: {e}"
-                )
-                continue
-
-        # Create response with validated items and ensure metadata is always present
-        nps_response = NPSResponse[EventData](
-            total=response.get("total", str(len(validated_data))),
-            limit=response.get("limit", str(limit)),
-            start=response.get("start", "0"),
-            data=validated_data,
-        )
-
-        # Format the response for better readability
-        formatted_events = format_event_data(nps_response.data)
-
-        # Group events by park code for better organization
-        events_by_park: Dict[str, list] = {}
-        for event in formatted_events:
-            park_code = event["parkCode"]
-            if park_code not in events_by_park:
-                events_by_park[park_code] = []
-            events_by_park[park_code].append(event)
-
-        result = {
-            "total": int(nps_response.total),
-            "limit": int(nps_response.limit),
-            "start": int(nps_response.start),
-            "events": formatted_events,
-            "eventsByPark": events_by_park,
-        }
-
-        return result
-    except nps_client.NPSAPIError as e:
-        logger.error(f"Failed to get events: {e.message}")
-        raise
+    params = query_params(
+        limit,
+        parkCode=request.park_code,
+        start=request.start,
+        q=request.q,
+        dateStart=request.date_start,
+        dateEnd=request.date_end,
+    )
+
+    return fetch_list(
+        client.get_events,
+        _EVENT_LIST_ADAPTER,
+        format_event_data,
+        "events",
+        params,
+        "events",
+        item_label="title",
+        group_by_park=request.include_grouping,
+    )
@@ -1,10 +1,10 @@
 """Handler for getting detailed park information."""
 
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 import src.api.client as nps_client
 from src.models.requests import GetParkDetailsRequest
-from src.models.responses import NPSResponse, ParkData
+from src.models.responses import PARK_LIST_ADAPTER, ParkData
 from src.utils.error_handler import handle_not_found_error
 from src.utils.formatters import format_park_details
 from src.utils.logging import get_logger
@@ -17,16 +17,24 @@ def get_park_details(request: GetParkDetailsRequest) -> Dict[str, Any]:
     """
     Get comprehensive information about a specific national park.
 
+    A list of park codes is looked up with a single request through
+    :func:`get_park_details_bulk`.
+
     Args:
         request: GetParkDetailsRequest with park code
 
     Returns:
-        Dictionary containing detailed park information
+        Dictionary containing detailed park information, or for a list of
+        park codes the matched parks keyed by park code under ``parks``
 
     Raises:
         NPSAPIError: If the API request fails
     """
-    logger.info(f"Getting park details for park code: {request.park_code}")
+    if isinstance(request.park_code, list):
+        parks = get_park_details_bulk(request.park_code)
+        return {"total": len(parks), "parks": parks}
+
+    logger.info("getting_park_details", park_code=request.park_code)
 
     # Get API client
     client = get_client()
@@ -34,22 +42,48 @@ def get_park_details(request: GetParkDetailsRequest) -> Dict[str, Any]:
     # Make API request using park code
     try:
         response = client.get_park_by_code(request.park_code)
-        logger.debug(f"Received response for park code: {request.park_code}")
+        logger.debug("park_details_received", park_code=request.park_code)
 
         # Check if park was found
         if not response.get("data") or len(response["data"]) == 0:
-            logger.warning(f"No park found with park code: {request.park_code}")
+            logger.warning("park_not_found", park_code=request.park_code)
             return handle_not_found_error("park", request.park_code)
 
-        # Parse response into Pydantic model
-        nps_response = NPSResponse[ParkData](**response)
+        # Parse the park record into a Pydantic model
+        park = ParkData.model_validate(response["data"][0])
 
         # Format the park details for better readability
-        park_details = format_park_details(nps_response.data[0])
+        park_details = format_park_details(park)
 
-        logger.info(f"Successfully retrieved details for park: {park_details['name']}")
+        logger.info("park_details_retrieved", park_name=park_details["name"])
         return park_details
 
     except nps_client.NPSAPIError as e:
-        logger.error(f"Failed to get park details: {e.message}")
+        logger.error("park_details_failed", error=e.message)
+        raise
+
+
+def get_park_details_bulk(park_codes: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Get detailed information for several parks with one NPS API request.
+
+    Args:
+        park_codes: Park codes to look up
+
+    Returns:
+        Formatted park details keyed by park code; codes that match no park
+        are left out
+
+    Raises:
+        NPSAPIError: If the API request fails
+    """
+    logger.info("getting_park_details_bulk", park_codes=park_codes)
+
+    try:
+        response = get_client().get_parks_by_codes(park_codes)
+    except nps_client.NPSAPIError as e:
+        logger.error("park_details_failed", error=e.message)
         raise
+
+    parks = PARK_LIST_ADAPTER.validate_python(response.get("data", []))
+    return {park.park_code: format_park_details(park) for park in parks}
@@ -1,16 +1,22 @@
 """Handler for getting visitor center information."""
 
-from typing import Any, Dict
+import logging
+from typing import Any, Dict, List
+
+from pydantic import TypeAdapter
 
 import src.api.client as nps_client
+from src.handlers._list_endpoint import fetch_list, query_params
 from src.models.requests import GetVisitorCentersRequest
-from src.models.responses import NPSResponse, VisitorCenterData
+from src.models.responses import VisitorCenterData
 from src.utils.formatters import format_visitor_center_data
-from src.utils.logging import get_logger
+from src.utils.logging import get_logger, is_enabled_for
 
 get_client = nps_client.get_client
 logger = get_logger(__name__)
 
+_VISITOR_CENTER_LIST_ADAPTER = TypeAdapter(List[VisitorCenterData])
+
 
 def get_visitor_centers(request: GetVisitorCentersRequest) -> Dict[str, Any]:
     """
@@ -25,9 +31,13 @@ def get_visitor_centers(request: GetVisitorCentersRequest) -> Dict[str, Any]:
     Raises:
         NPSAPIError: If the API request fails
     """
-    logger.info(
-        f"Getting visitor centers with params: {request.model_dump(exclude_none=True)}"
-    )
+    # Dumping the request is only worth it when the record will be emitted
+    if is_enabled_for(logger, logging.INFO):
+        logger.info(
+            "getting_visitor_centers",
+            params=request.model_dump(exclude_none=True),
+            message="Getting visitor centers with search parameters",
+        )
 
     # Get API client
     client = get_client()
@@ -36,42 +46,16 @@ def get_visitor_centers(request: GetVisitorCentersRequest) -> Dict[str, Any]:
     limit = min(request.limit, 50) if request.limit else 10
 
     # Build query parameters from request
-    params = {"limit": limit}
-    if request.park_code:
-        params["parkCode"] = request.park_code
-    if request.start:
-        params["start"] = request.start
-    if request.q:
-        params["q"] = request.q
-
-    # Make API request
-    try:
-        response = client.get_visitor_centers(**params)
-        logger.info(f"Found {response.get('total', 0)} visitor centers")
-
-        # Parse response into Pydantic models
-        nps_response = NPSResponse[VisitorCenterData](**response)
-
-        # Format the response for better readability
-        formatted_centers = format_visitor_center_data(nps_response.data)
-
-        # Group visitor centers by park code for better organization
-        centers_by_park: Dict[str, list] = {}
-        for center in formatted_centers:
-            park_code = center["parkCode"]
-            if park_code not in centers_by_park:
-                centers_by_park[park_code] = []
-            centers_by_park[park_code].append(center)
-
-        result = {
-            "total": int(nps_response.total),
-            "limit": int(nps_response.limit),
-            "start": int(nps_response.start),
-            "visitorCenters": formatted_centers,
-            "visitorCentersByPark": centers_by_park,
-        }
+    params = query_params(
+        limit, parkCode=request.park_code, start=request.start, q=request.q
+    )
 
-        return result
-    except nps_client.NPSAPIError as e:
-        logger.error(f"Failed to get visitor centers: {e.message}")
-        raise
+    return fetch_list(
+        client.get_visitor_centers,
+        _VISITOR_CENTER_LIST_ADAPTER,
+        format_visitor_center_data,
+        "visitorCenters",
+        params,
+        "visitor centers",
+        group_by_park=request.include_grouping,
+    )
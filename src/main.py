@@ -5,17 +5,28 @@ import argparse
 import sys
 from typing import NoReturn
 
-from src.config import settings
-from src.server import get_server
-from src.utils.logging import configure_logging, get_logger
-
-
-def parse_args() -> argparse.Namespace:
+# Result of parsing an empty command line, the usual way MCP clients spawn
+# the server; must match the parser defaults below
+_DEFAULT_ARGS = {
+    "log_level": None,
+    "log_json": None,
+    "no_timestamp": False,
+    "quiet": False,
+}
+
+_API_KEY_WARNING = (
+    "Warning: NPS_API_KEY is not set in environment variables.\n"
+    "Get your API key at: https://www.nps.gov/subjects/developer/get-started.htm\n"
+    "\n"
+)
+
+
+def _build_parser() -> argparse.ArgumentParser:
     """
-    Parse command-line arguments.
+    Build the command-line argument parser.
 
     Returns:
-        Parsed command-line arguments
+        Configured argument parser
     """
     parser = argparse.ArgumentParser(
         prog="python-mcp-nationalparks",
@@ -76,7 +87,30 @@ Get your free NPS API key at:
         help="Disable timestamps in log output",
     )
 
-    return parser.parse_args()
+    parser.add_argument(
+        "-q",
+        "--quiet",
+        action="store_true",
+        default=False,
+        help="Do not print the startup banner and warnings to stderr",
+    )
+
+    return parser
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parse command-line arguments.
+
+    Without arguments the parser is not built at all and the defaults are
+    returned directly.
+
+    Returns:
+        Parsed command-line arguments
+    """
+    if len(sys.argv) <= 1:
+        return argparse.Namespace(**_DEFAULT_ARGS)
+    return _build_parser().parse_args()
 
 
 def main() -> NoReturn:
@@ -93,6 +127,12 @@ def main() -> NoReturn:
     # Parse command-line arguments
     args = parse_args()
 
+    # Imported only now, so --help, --version and argument errors exit
+    # without loading settings, FastMCP or the models
+    from src.config import settings
+    from src.server import get_server
+    from src.utils.logging import configure_logging, get_logger
+
     # Override settings with command-line arguments if provided
     if args.log_level is not None:
         settings.log_level = args.log_level
@@ -103,10 +143,14 @@ def main() -> NoReturn:
     if args.no_timestamp:
         settings.log_include_timestamp = False
 
+    log_level = settings.log_level
+    log_json = settings.log_json
+    server_name = settings.server_name
+
     # Configure structured logging
     configure_logging(
-        log_level=settings.log_level,
-        json_logs=settings.log_json,
+        log_level=log_level,
+        json_logs=log_json,
         include_timestamp=settings.log_include_timestamp,
     )
 
@@ -118,27 +162,21 @@ def main() -> NoReturn:
             "api_key_not_configured",
             message="NPS_API_KEY not configured. Some functionality may be limited.",
         )
-        print(
-            "Warning: NPS_API_KEY is not set in environment variables.",
-            file=sys.stderr,
-        )
-        print(
-            "Get your API key at: https://www.nps.gov/subjects/developer/get-started.htm",
-            file=sys.stderr,
-        )
-        print("", file=sys.stderr)
+        if not args.quiet:
+            sys.stderr.write(_API_KEY_WARNING)
 
     # Log server startup information
     logger.info(
         "server_starting",
-        server_name=settings.server_name,
+        server_name=server_name,
         api_base_url=settings.nps_api_base_url,
-        log_level=settings.log_level,
-        log_format="json" if settings.log_json else "console",
+        log_level=log_level,
+        log_format="json" if log_json else "console",
     )
 
     # Print startup message to stderr (stdout is used for MCP protocol)
-    print(f"{settings.server_name} MCP Server running on stdio", file=sys.stderr)
+    if not args.quiet:
+        sys.stderr.write(f"{server_name} MCP Server running on stdio\n")
 
     try:
         # Initialize and run FastMCP server
@@ -146,11 +184,11 @@ def main() -> NoReturn:
         server.run()
     except KeyboardInterrupt:
         logger.info("server_shutdown", reason="keyboard_interrupt")
-        print("\nServer shutdown by user", file=sys.stderr)
+        sys.stderr.write("\nServer shutdown by user\n")
         sys.exit(0)
     except Exception as e:
         logger.error("server_fatal_error", error=str(e), exc_info=True)
-        print(f"Fatal error: {e}", file=sys.stderr)
+        sys.stderr.write(f"Fatal error: {e}\n")
         sys.exit(1)
 
 
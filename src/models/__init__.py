@@ -1,39 +1,66 @@
-"""Data models for the National Parks MCP Server."""
-
-from src.models.errors import ErrorResponse, ValidationErrorResponse
-from src.models.requests import (
-    FindParksRequest,
-    GetAlertsRequest,
-    GetCampgroundsRequest,
-    GetEventsRequest,
-    GetParkDetailsRequest,
-    GetVisitorCentersRequest,
-)
-from src.models.responses import (
-    AlertData,
-    CampgroundData,
-    EventData,
-    NPSResponse,
-    ParkData,
-    VisitorCenterData,
-)
-
-__all__ = [
+"""
+Data models for the National Parks MCP Server.
+
+Models are imported from their submodules on first access, so importing
+``src.models.errors`` does not also build every NPS response model.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.models.errors import ErrorResponse, ErrorType, ValidationErrorResponse
+    from src.models.requests import (
+        FindParksRequest,
+        GetAlertsRequest,
+        GetCampgroundsRequest,
+        GetEventsRequest,
+        GetParkDetailsRequest,
+        GetVisitorCentersRequest,
+    )
+    from src.models.responses import (
+        AlertData,
+        CampgroundData,
+        EventData,
+        NPSResponse,
+        ParkData,
+        VisitorCenterData,
+    )
+
+_EXPORTS = {
     # Request models
-    "FindParksRequest",
-    "GetParkDetailsRequest",
-    "GetAlertsRequest",
-    "GetVisitorCentersRequest",
-    "GetCampgroundsRequest",
-    "GetEventsRequest",
+    "FindParksRequest": "requests",
+    "GetParkDetailsRequest": "requests",
+    "GetAlertsRequest": "requests",
+    "GetVisitorCentersRequest": "requests",
+    "GetCampgroundsRequest": "requests",
+    "GetEventsRequest": "requests",
     # Response models
-    "NPSResponse",
-    "ParkData",
-    "AlertData",
-    "VisitorCenterData",
-    "CampgroundData",
-    "EventData",
+    "NPSResponse": "responses",
+    "ParkData": "responses",
+    "AlertData": "responses",
+    "VisitorCenterData": "responses",
+    "CampgroundData": "responses",
+    "EventData": "responses",
     # Error models
-    "ErrorResponse",
-    "ValidationErrorResponse",
-]
+    "ErrorResponse": "errors",
+    "ErrorType": "errors",
+    "ValidationErrorResponse": "errors",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve exported models lazily (PEP 562)."""
+    submodule = _EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{submodule}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    """Include the lazily resolved models in ``dir()``."""
+    return sorted(set(globals()) | set(__all__))
@@ -4,6 +4,7 @@ from enum import Enum
 from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
+from pydantic import ValidationError as PydanticValidationError
 
 
 class ErrorType(str, Enum):
@@ -89,7 +90,10 @@ class ErrorResponse(BaseModel):
         Returns:
             ErrorResponse instance
         """
-        return cls(
+        # Built from our own trusted values, so validation is skipped
+        if isinstance(error_type, ErrorType):
+            error_type = error_type.value
+        return cls.model_construct(
             error=error_type,
             message=message,
             status_code=status_code,
@@ -130,18 +134,19 @@ class ValidationErrorResponse(BaseModel):
             ValidationErrorResponse instance
         """
         errors = []
-        if hasattr(exc, "errors"):
-            for error in exc.errors():
-                errors.append(
-                    ValidationError(
-                        loc=[str(loc) for loc in error.get("loc", [])],
-                        msg=error.get("msg", "Validation error"),
-                        type=error.get("type", "value_error"),
-                    )
+        if isinstance(exc, PydanticValidationError):
+            # URLs are not part of the response, so skip building them
+            errors = [
+                ValidationError(
+                    loc=[str(part) for part in error["loc"]],
+                    msg=error["msg"],
+                    type=error["type"],
                 )
+                for error in exc.errors(include_url=False)
+            ]
 
-        return cls(
-            error=ErrorType.VALIDATION_ERROR,
+        return cls.model_construct(
+            error=ErrorType.VALIDATION_ERROR.value,
             message="Input validation failed",
             validation_errors=errors,
         )
@@ -1,8 +1,19 @@
 """Pydantic models for tool input validation."""
 
-from typing import Optional
+from typing import Annotated, List, Optional, Union
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+
+def _join_park_codes(value: Union[str, List[str], None]) -> Optional[str]:
+    """Collapse a list of park codes into the NPS comma-separated form.
+
+    Lets one request cover several parks, so the handler makes a single
+    upstream call instead of one per park.
+    """
+    if isinstance(value, (list, tuple)):
+        return ",".join(code.strip() for code in value if code and code.strip())
+    return value
 
 
 class FindParksRequest(BaseModel):
@@ -41,27 +52,28 @@ class GetParkDetailsRequest(BaseModel):
 
     model_config = ConfigDict(populate_by_name=True)
 
-    park_code: str = Field(
+    park_code: Union[
+        Annotated[str, Field(min_length=1)], Annotated[List[str], Field(min_length=1)]
+    ] = Field(
         ...,
         alias="parkCode",
-        description='The park code of the national park (e.g., "yose" for Yosemite, "grca" for Grand Canyon)',
-        min_length=1,
+        description='The park code of the national park (e.g., "yose" for Yosemite, "grca" for Grand Canyon). A list of park codes returns the details of each park, keyed by park code.',
     )
 
 
-class GetAlertsRequest(BaseModel):
-    """Request model for getting park alerts."""
+class _ParkListRequest(BaseModel):
+    """Filters shared by the NPS list endpoints (alerts, events, ...)."""
 
     model_config = ConfigDict(populate_by_name=True)
 
-    park_code: Optional[str] = Field(
+    park_code: Optional[Union[str, List[str]]] = Field(
         None,
         alias="parkCode",
-        description='Filter alerts by park code (e.g., "yose" for Yosemite). Multiple parks can be comma-separated (e.g., "yose,grca").',
+        description='Filter results by park code (e.g., "yose" for Yosemite). Multiple parks can be comma-separated (e.g., "yose,grca") or given as a list.',
     )
     limit: Optional[int] = Field(
         None,
-        description="Maximum number of alerts to return (default: 10, max: 50)",
+        description="Maximum number of results to return (default: 10, max: 50)",
         ge=1,
         le=50,
     )
@@ -72,85 +84,36 @@ class GetAlertsRequest(BaseModel):
     )
     q: Optional[str] = Field(
         None,
-        description="Search term to filter alerts by title or description",
+        description="Search term to filter results by name, title or description",
+    )
+    include_grouping: bool = Field(
+        True,
+        alias="includeGrouping",
+        description="Also return the results grouped by park code",
     )
 
+    @field_validator("park_code", mode="before")
+    @classmethod
+    def join_park_codes(cls, v: Union[str, List[str], None]) -> Optional[str]:
+        """Accept a list of park codes for a single batched lookup."""
+        return _join_park_codes(v)
 
-class GetVisitorCentersRequest(BaseModel):
-    """Request model for getting visitor centers."""
-
-    model_config = ConfigDict(populate_by_name=True)
 
-    park_code: Optional[str] = Field(
-        None,
-        alias="parkCode",
-        description='Filter visitor centers by park code (e.g., "yose" for Yosemite). Multiple parks can be comma-separated (e.g., "yose,grca").',
-    )
-    limit: Optional[int] = Field(
-        None,
-        description="Maximum number of visitor centers to return (default: 10, max: 50)",
-        ge=1,
-        le=50,
-    )
-    start: Optional[int] = Field(
-        None,
-        description="Start position for results (useful for pagination)",
-        ge=0,
-    )
-    q: Optional[str] = Field(
-        None,
-        description="Search term to filter visitor centers by name or description",
-    )
+class GetAlertsRequest(_ParkListRequest):
+    """Request model for getting park alerts."""
 
 
-class GetCampgroundsRequest(BaseModel):
-    """Request model for getting campgrounds."""
+class GetVisitorCentersRequest(_ParkListRequest):
+    """Request model for getting visitor centers."""
 
-    model_config = ConfigDict(populate_by_name=True)
 
-    park_code: Optional[str] = Field(
-        None,
-        alias="parkCode",
-        description='Filter campgrounds by park code (e.g., "yose" for Yosemite). Multiple parks can be comma-separated (e.g., "yose,grca").',
-    )
-    limit: Optional[int] = Field(
-        None,
-        description="Maximum number of campgrounds to return (default: 10, max: 50)",
-        ge=1,
-        le=50,
-    )
-    start: Optional[int] = Field(
-        None,
-        description="Start position for results (useful for pagination)",
-        ge=0,
-    )
-    q: Optional[str] = Field(
-        None,
-        description="Search term to filter campgrounds by name or description",
-    )
+class GetCampgroundsRequest(_ParkListRequest):
+    """Request model for getting campgrounds."""
 
 
-class GetEventsRequest(BaseModel):
+class GetEventsRequest(_ParkListRequest):
     """Request model for getting park events."""
 
-    model_config = ConfigDict(populate_by_name=True)
-
-    park_code: Optional[str] = Field(
-        None,
-        alias="parkCode",
-        description='Filter events by park code (e.g., "yose" for Yosemite). Multiple parks can be comma-separated (e.g., "yose,grca").',
-    )
-    limit: Optional[int] = Field(
-        None,
-        description="Maximum number of events to return (default: 10, max: 50)",
-        ge=1,
-        le=50,
-    )
-    start: Optional[int] = Field(
-        None,
-        description="Start position for results (useful for pagination)",
-        ge=0,
-    )
     date_start: Optional[str] = Field(
         None,
         alias="dateStart",
@@ -161,10 +124,6 @@ class GetEventsRequest(BaseModel):
         alias="dateEnd",
         description="End date for filtering events (format: YYYY-MM-DD)",
     )
-    q: Optional[str] = Field(
-        None,
-        description="Search term to filter events by title or description",
-    )
 
 
 class GetAirQualityRequest(BaseModel):
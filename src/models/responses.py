@@ -1,45 +1,74 @@
 """Pydantic models for NPS API responses."""
 
-from typing import Any, Generic, List, Optional, TypeVar, Union
+from typing import Annotated, Any, Generic, List, Optional, Tuple, TypeVar, Union
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
+from pydantic.dataclasses import dataclass
 
 # Generic type for NPSResponse
 T = TypeVar("T")
 
-
-class Activity(BaseModel):
+# Yes/no strings used by the NPS API for boolean fields; anything else
+# ("Unknown", "N/A", ...) means the value is not known
+_BOOL_STRINGS = {
+    "yes": True,
+    "true": True,
+    "1": True,
+    "no": False,
+    "false": False,
+    "0": False,
+}
+
+
+# Leaf records with no validators of their own: slotted, frozen dataclasses
+# are validated by pydantic-core like models but take a fraction of the
+# memory, and parks carry many of them (images, fees, addresses, ...)
+_leaf_record = dataclass(
+    slots=True, frozen=True, config=ConfigDict(populate_by_name=True)
+)
+
+
+def _parse_bool_string(v: Union[str, bool, None]) -> Optional[bool]:
+    # One dict lookup per value; these validators run for every record
+    if isinstance(v, bool):
+        return v
+    if isinstance(v, str):
+        return _BOOL_STRINGS.get(v.strip().lower())
+    return None
+
+
+@_leaf_record
+class Activity:
     """Activity model."""
 
     id: str
     name: str
 
 
-class Topic(BaseModel):
+@_leaf_record
+class Topic:
     """Topic model."""
 
     id: str
     name: str
 
 
-class PhoneNumber(BaseModel):
+@_leaf_record
+class PhoneNumber:
     """Phone number model."""
 
-    model_config = ConfigDict(populate_by_name=True)
-
-    phone_number: str = Field(alias="phoneNumber")
+    phone_number: Annotated[str, Field(alias="phoneNumber")]
     description: str
     extension: str
     type: str
 
 
-class EmailAddress(BaseModel):
+@_leaf_record
+class EmailAddress:
     """Email address model."""
 
-    model_config = ConfigDict(populate_by_name=True)
-
     description: str
-    email_address: str = Field(alias="emailAddress")
+    email_address: Annotated[str, Field(alias="emailAddress")]
 
 
 class Contacts(BaseModel):
@@ -53,7 +82,8 @@ class Contacts(BaseModel):
     )
 
 
-class Fee(BaseModel):
+@_leaf_record
+class Fee:
     """Fee model."""
 
     cost: str
@@ -61,7 +91,8 @@ class Fee(BaseModel):
     title: str
 
 
-class StandardHours(BaseModel):
+@_leaf_record
+class StandardHours:
     """Standard operating hours model."""
 
     sunday: str
@@ -78,34 +109,34 @@ class OperatingHours(BaseModel):
 
     model_config = ConfigDict(populate_by_name=True)
 
-    exceptions: List[Any] = Field(default_factory=list)
+    # Unread pass-through fields; the shared empty tuple default avoids a
+    # fresh list for every record that omits them
+    exceptions: Tuple[Any, ...] = ()
     description: str
     standard_hours: StandardHours = Field(alias="standardHours")
     name: str
 
 
-class Address(BaseModel):
+@_leaf_record
+class Address:
     """Address model."""
 
-    model_config = ConfigDict(populate_by_name=True)
-
-    postal_code: str = Field(alias="postalCode")
+    postal_code: Annotated[str, Field(alias="postalCode")]
     city: str
-    state_code: str = Field(alias="stateCode")
+    state_code: Annotated[str, Field(alias="stateCode")]
     line1: str
     line2: str
     line3: str
     type: str
 
 
-class Image(BaseModel):
+@_leaf_record
+class Image:
     """Image model."""
 
-    model_config = ConfigDict(populate_by_name=True)
-
     credit: str
     title: str
-    alt_text: str = Field(alias="altText")
+    alt_text: Annotated[str, Field(alias="altText")]
     caption: str
     url: str
 
@@ -129,7 +160,7 @@ class ParkData(BaseModel):
     contacts: Contacts
     entrance_fees: List[Fee] = Field(default_factory=list, alias="entranceFees")
     entrance_passes: List[Fee] = Field(default_factory=list, alias="entrancePasses")
-    fees: List[Any] = Field(default_factory=list)
+    fees: Tuple[Any, ...] = ()
     directions_info: str = Field(alias="directionsInfo")
     directions_url: str = Field(alias="directionsUrl")
     operating_hours: List[OperatingHours] = Field(
@@ -219,19 +250,7 @@ class CampgroundAmenities(BaseModel):
         - Unknown strings: "Unknown", "N/A", "Not Available", "", None -> None
         - Already boolean values: pass through unchanged
         """
-        if v is None or v == "":
-            return None
-        if isinstance(v, bool):
-            return v
-        if isinstance(v, str):
-            v_lower = v.lower().strip()
-            if v_lower in ["yes", "true", "1"]:
-                return True
-            elif v_lower in ["no", "false", "0"]:
-                return False
-            elif v_lower in ["unknown", "n/a", "not available"]:
-                return None
-        return None
+        return _parse_bool_string(v)
 
 
 class Campsites(BaseModel):
@@ -287,9 +306,7 @@ class CampgroundData(BaseModel):
     passport_stamp_location_description: str = Field(
         alias="passportStampLocationDescription"
     )
-    passport_stamp_images: List[Any] = Field(
-        default_factory=list, alias="passportStampImages"
-    )
+    passport_stamp_images: Tuple[Any, ...] = Field((), alias="passportStampImages")
     geometry_poi_id: str = Field(alias="geometryPoiId")
     reservation_info: str = Field(alias="reservationInfo")
     reservation_url: str = Field(alias="reservationUrl")
@@ -334,17 +351,7 @@ class EventTime(BaseModel):
         - Empty/None values: "", None -> None
         - Already boolean values: pass through unchanged
         """
-        if v is None or v == "":
-            return None
-        if isinstance(v, bool):
-            return v
-        if isinstance(v, str):
-            v_lower = v.lower().strip()
-            if v_lower in ["yes", "true", "1"]:
-                return True
-            elif v_lower in ["no", "false", "0"]:
-                return False
-        return None
+        return _parse_bool_string(v)
 
 
 class EventData(BaseModel):
@@ -398,17 +405,7 @@ class EventData(BaseModel):
         - Empty/None values: "", None -> None
         - Already boolean values: pass through unchanged
         """
-        if v is None or v == "":
-            return None
-        if isinstance(v, bool):
-            return v
-        if isinstance(v, str):
-            v_lower = v.lower().strip()
-            if v_lower in ["yes", "true", "1"]:
-                return True
-            if v_lower in ["no", "false", "0"]:
-                return False
-        return None
+        return _parse_bool_string(v)
 
 
 class NPSResponse(BaseModel, Generic[T]):
@@ -418,3 +415,7 @@ class NPSResponse(BaseModel, Generic[T]):
     limit: str
     start: str
     data: List[T]
+
+
+# Validates the ``data`` list of a /parks response in one pydantic-core call
+PARK_LIST_ADAPTER = TypeAdapter(List[ParkData])
@@ -9,13 +9,40 @@ from src.models.errors import (
     ErrorResponse,
     ErrorType,
     HTTPStatusCode,
-    ValidationError,
     ValidationErrorResponse,
 )
 from src.utils.logging import get_logger
+from src.utils.validation import checked
 
 logger = get_logger(__name__)
 
+# Enum values and category pairs used on every error, resolved once
+_VALIDATION_ERROR = ErrorType.VALIDATION_ERROR.value
+_INTERNAL_ERROR = ErrorType.INTERNAL_ERROR.value
+_VALIDATION_CATEGORY = (ErrorType.VALIDATION_ERROR, HTTPStatusCode.UNPROCESSABLE_ENTITY)
+_INTERNAL_CATEGORY = (ErrorType.INTERNAL_ERROR, HTTPStatusCode.INTERNAL_SERVER_ERROR)
+
+
+def _error_response(
+    error_type: str,
+    message: str,
+    status_code: Optional[int],
+    details: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    # Same dict as ErrorResponse.from_exception(...).model_dump(); all values
+    # come from this module, so no model is built on the error path
+    if isinstance(error_type, ErrorType):
+        error_type = error_type.value
+    return checked(
+        ErrorResponse,
+        {
+            "error": error_type,
+            "message": message,
+            "details": details or {},
+            "status_code": status_code,
+        },
+    )
+
 
 def handle_validation_error(exc: PydanticValidationError) -> Dict[str, Any]:
     """
@@ -29,29 +56,28 @@ def handle_validation_error(exc: PydanticValidationError) -> Dict[str, Any]:
     """
     logger.warning(
         "validation_error",
-        error_count=len(exc.errors()),
+        error_count=exc.error_count(),
         message="Input validation failed",
     )
 
-    errors = []
-    for error in exc.errors():
-        errors.append(
-            ValidationError(
-                loc=[str(loc) for loc in error.get("loc", [])],
-                msg=error.get("msg", "Validation error"),
-                type=error.get("type", "value_error"),
-            )
-        )
-
-    response = ValidationErrorResponse(
-        error=ErrorType.VALIDATION_ERROR,
-        message="Input validation failed",
-        validation_errors=errors,
-        status_code=HTTPStatusCode.UNPROCESSABLE_ENTITY,
+    # Same dict as ValidationErrorResponse.from_pydantic_error(exc).model_dump()
+    return checked(
+        ValidationErrorResponse,
+        {
+            "error": _VALIDATION_ERROR,
+            "message": "Input validation failed",
+            "validation_errors": [
+                {
+                    "loc": [str(part) for part in error["loc"]],
+                    "msg": error["msg"],
+                    "type": error["type"],
+                }
+                for error in exc.errors(include_url=False)
+            ],
+            "status_code": HTTPStatusCode.UNPROCESSABLE_ENTITY,
+        },
     )
 
-    return response.model_dump()
-
 
 def handle_api_error(exc: Any) -> Dict[str, Any]:
     """
@@ -70,19 +96,17 @@ def handle_api_error(exc: Any) -> Dict[str, Any]:
         message=exc.message,
     )
 
-    response = ErrorResponse(
-        error=exc.error_type,
+    return _error_response(
+        error_type=exc.error_type,
         message=exc.message,
         status_code=exc.status_code,
         details=exc.details,
     )
 
-    return response.model_dump()
-
 
 def handle_generic_error(
     exc: Exception,
-    error_type: str = ErrorType.INTERNAL_ERROR,
+    error_type: str = _INTERNAL_ERROR,
     status_code: Optional[int] = None,
     context: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
@@ -108,15 +132,13 @@ def handle_generic_error(
     details = context or {}
     details["error_class"] = exc.__class__.__name__
 
-    response = ErrorResponse(
-        error=error_type,
+    return _error_response(
+        error_type=error_type,
         message=str(exc) or "An unexpected error occurred",
         status_code=status_code or HTTPStatusCode.INTERNAL_SERVER_ERROR,
         details=details,
     )
 
-    return response.model_dump()
-
 
 def handle_not_found_error(resource_type: str, resource_id: str) -> Dict[str, Any]:
     """
@@ -137,8 +159,8 @@ def handle_not_found_error(resource_type: str, resource_id: str) -> Dict[str, An
 
     error_message = f"{resource_type.capitalize()} not found"
 
-    response = ErrorResponse(
-        error=error_message,
+    return _error_response(
+        error_type=error_message,
         message=f"{error_message}: No {resource_type} found with park code: {resource_id}",
         status_code=HTTPStatusCode.NOT_FOUND,
         details={
@@ -147,8 +169,6 @@ def handle_not_found_error(resource_type: str, resource_id: str) -> Dict[str, An
         },
     )
 
-    return response.model_dump()
-
 
 def handle_auth_error(message: str = "Authentication failed") -> Dict[str, Any]:
     """
@@ -162,15 +182,13 @@ def handle_auth_error(message: str = "Authentication failed") -> Dict[str, Any]:
     """
     logger.error("auth_error", message=message)
 
-    response = ErrorResponse(
-        error=ErrorType.AUTH_ERROR,
+    return _error_response(
+        error_type=ErrorType.AUTH_ERROR.value,
         message=message,
         status_code=HTTPStatusCode.UNAUTHORIZED,
         details={},
     )
 
-    return response.model_dump()
-
 
 def handle_invalid_input_error(
     message: str, details: Optional[Dict[str, Any]] = None
@@ -187,15 +205,13 @@ def handle_invalid_input_error(
     """
     logger.warning("invalid_input_error", message=message)
 
-    response = ErrorResponse(
-        error=ErrorType.INVALID_INPUT,
+    return _error_response(
+        error_type=ErrorType.INVALID_INPUT.value,
         message=message,
         status_code=HTTPStatusCode.BAD_REQUEST,
         details=details or {},
     )
 
-    return response.model_dump()
-
 
 def handle_rate_limit_error(retry_after: Optional[int] = None) -> Dict[str, Any]:
     """
@@ -213,15 +229,13 @@ def handle_rate_limit_error(retry_after: Optional[int] = None) -> Dict[str, Any]
     if retry_after:
         details["retry_after"] = retry_after
 
-    response = ErrorResponse(
-        error=ErrorType.RATE_LIMIT_ERROR,
+    return _error_response(
+        error_type=ErrorType.RATE_LIMIT_ERROR.value,
         message="Rate limit exceeded. Please try again later.",
         status_code=HTTPStatusCode.TOO_MANY_REQUESTS,
         details=details,
     )
 
-    return response.model_dump()
-
 
 def categorize_error(exc: Exception) -> tuple[str, int]:
     """
@@ -234,8 +248,8 @@ def categorize_error(exc: Exception) -> tuple[str, int]:
         Tuple of (error_type, status_code)
     """
     if isinstance(exc, PydanticValidationError):
-        return ErrorType.VALIDATION_ERROR, HTTPStatusCode.UNPROCESSABLE_ENTITY
+        return _VALIDATION_CATEGORY
     elif isinstance(exc, NPSAPIError):
         return exc.error_type, exc.status_code or HTTPStatusCode.INTERNAL_SERVER_ERROR
     else:
-        return ErrorType.INTERNAL_ERROR, HTTPStatusCode.INTERNAL_SERVER_ERROR
+        return _INTERNAL_CATEGORY
@@ -1,9 +1,10 @@
 """Geospatial helpers for resolving park coordinates."""
 
+from functools import lru_cache
 from typing import Tuple
 
 import src.api.client as nps_client
-from src.models.responses import NPSResponse, ParkData
+from src.models.responses import ParkData
 
 
 class LocationResolutionError(Exception):
@@ -22,10 +23,14 @@ class LocationResolutionError(Exception):
         super().__init__(message)
 
 
+@lru_cache(maxsize=1024)
 def resolve_park_location(park_code: str) -> Tuple[ParkData, float, float]:
     """
     Resolve a park code into a ParkData model and coordinates.
 
+    Park metadata does not change while the server runs, so successful
+    lookups are memoized per park code. Failures raise and are not cached.
+
     Args:
         park_code: NPS park code
 
@@ -40,8 +45,7 @@ def resolve_park_location(park_code: str) -> Tuple[ParkData, float, float]:
             reason="park_not_found",
         )
 
-    nps_response = NPSResponse[ParkData](**response)
-    park = nps_response.data[0]
+    park = ParkData.model_validate(response["data"][0])
 
     try:
         latitude = float(park.latitude)
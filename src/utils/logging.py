@@ -1,12 +1,18 @@
 """Structured logging configuration using structlog."""
 
+import atexit
 import logging
+import queue
 import sys
+import time
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any, Dict, Optional
 
 import structlog
 from structlog.types import EventDict, Processor
 
+from src.utils.serialization import dumps
+
 
 def add_app_context(
     logger: logging.Logger, method_name: str, event_dict: EventDict
@@ -108,6 +114,65 @@ def _censor_dict(data: Dict[str, Any], sensitive_keys: set) -> Dict[str, Any]:
     return censored
 
 
+# Processors shared by every configuration. filter_by_level comes first so
+# events below the configured level are dropped before any other work.
+_BASE_PROCESSORS: tuple[Processor, ...] = (
+    structlog.stdlib.filter_by_level,
+    structlog.contextvars.merge_contextvars,
+    add_app_context,
+    add_log_level,
+    structlog.stdlib.add_logger_name,
+    censor_sensitive_data,
+    structlog.processors.StackInfoRenderer(),
+    structlog.processors.format_exc_info,
+)
+
+
+def _render_json(event_dict: EventDict, **kwargs: Any) -> str:
+    # JSONRenderer serializer: one orjson pass instead of json.dumps
+    return dumps(event_dict).decode()
+
+
+# Writes log lines to stderr off the calling thread; see _install_log_writer
+_listener: Optional[QueueListener] = None
+
+
+def _install_log_writer(level: int) -> None:
+    """
+    Send root log records to stderr through a background listener thread.
+
+    Behaves like ``logging.basicConfig(format="%(message)s", stream=sys.stderr)``
+    and likewise does nothing if the root logger already has handlers. Events
+    are still rendered by the caller, but the stream write happens on the
+    listener thread, so logging costs a tool call one queue put instead of
+    a blocking write. Queued lines are flushed at interpreter exit.
+
+    Args:
+        level: Level to set on the root logger
+    """
+    global _listener
+    root = logging.getLogger()
+    if root.handlers:
+        return
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    _listener = QueueListener(log_queue, stream_handler)
+    _listener.start()
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(level)
+
+
+@atexit.register
+def _stop_log_writer() -> None:
+    """Flush queued log lines and stop the listener thread, if running."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
 def configure_logging(
     log_level: str = "INFO",
     json_logs: bool = False,
@@ -125,22 +190,10 @@ def configure_logging(
     numeric_level = getattr(logging, log_level.upper(), logging.INFO)
 
     # Configure standard library logging
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stderr,
-        level=numeric_level,
-    )
+    _install_log_writer(numeric_level)
 
     # Build processor chain
-    processors: list[Processor] = [
-        structlog.contextvars.merge_contextvars,
-        add_app_context,
-        add_log_level,
-        structlog.stdlib.add_logger_name,
-        censor_sensitive_data,
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
-    ]
+    processors: list[Processor] = list(_BASE_PROCESSORS)
 
     # Add timestamp if requested
     if include_timestamp:
@@ -148,7 +201,7 @@ def configure_logging(
 
     # Add appropriate renderer based on format preference
     if json_logs:
-        processors.append(structlog.processors.JSONRenderer())
+        processors.append(structlog.processors.JSONRenderer(serializer=_render_json))
     else:
         processors.append(
             structlog.dev.ConsoleRenderer(
@@ -234,6 +287,24 @@ def log_response(
         logger.info("tool_response", **log_data)
 
 
+def is_enabled_for(logger: Any, level: int) -> bool:
+    """
+    Check whether a logger would emit records at the given level.
+
+    Loggers without a stdlib-style ``isEnabledFor`` (e.g. structlog before
+    :func:`configure_logging` has run) are treated as enabled.
+
+    Args:
+        logger: Logger instance
+        level: Standard library logging level
+
+    Returns:
+        True if a record at ``level`` would be emitted
+    """
+    check = getattr(logger, "isEnabledFor", None)
+    return check is None or check(level)
+
+
 def log_api_request(
     logger: structlog.stdlib.BoundLogger,
     method: str,
@@ -249,6 +320,9 @@ def log_api_request(
         url: Request URL
         params: Query parameters
     """
+    if not is_enabled_for(logger, logging.DEBUG):
+        return
+
     logger.debug(
         "api_request",
         method=method,
@@ -277,6 +351,16 @@ def log_api_response(
         duration_ms: Request duration in milliseconds
         error: Error message if request failed
     """
+    if error:
+        level = logging.ERROR
+    elif status_code >= 400:
+        level = logging.WARNING
+    else:
+        level = logging.DEBUG
+
+    if not is_enabled_for(logger, level):
+        return
+
     log_data = {
         "method": method,
         "url": url,
@@ -290,7 +374,20 @@ def log_api_response(
     if error:
         log_data["error"] = error
         logger.error("api_response", **log_data)
-    elif status_code >= 400:
+    elif level == logging.WARNING:
         logger.warning("api_response", **log_data)
     else:
         logger.debug("api_response", **log_data)
+
+
+def ms_since(start_ns: int) -> float:
+    """
+    Return the milliseconds elapsed since a ``time.perf_counter_ns()`` reading.
+
+    Args:
+        start_ns: Performance counter start timestamp in nanoseconds
+
+    Returns:
+        Elapsed time in milliseconds
+    """
+    return (time.perf_counter_ns() - start_ns) / 1e6
@@ -0,0 +1,94 @@
+"""JSON serialization helpers with an optional orjson fast path."""
+
+import json
+from typing import Any
+
+import httpx
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson installed
+    orjson = None  # type: ignore[assignment]
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    Decode a JSON document.
+
+    Uses orjson when it is installed and falls back to the standard library.
+
+    Args:
+        data: Raw JSON document
+
+    Returns:
+        Decoded Python object
+
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Encode an object as compact UTF-8 JSON.
+
+    Uses orjson when it is installed and falls back to the standard library.
+    Values that are not JSON types are encoded with ``str()``.
+
+    Args:
+        obj: Object to encode
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        obj, default=str, ensure_ascii=False, separators=(",", ":")
+    ).encode()
+
+
+def response_json(response: httpx.Response) -> Any:
+    """
+    Decode the JSON body of an HTTPX response.
+
+    The raw body bytes are handed straight to orjson, skipping httpx's
+    text decoding and the stdlib parser. Responses without a byte body
+    fall back to ``response.json()``.
+
+    Args:
+        response: HTTPX response object
+
+    Returns:
+        Decoded response body
+
+    Raises:
+        ValueError: If the body is not valid JSON
+    """
+    content = response.content
+    if orjson is not None and isinstance(content, (bytes, bytearray, memoryview)):
+        return orjson.loads(content)
+    return response.json()
+
+
+def response_preview(response: httpx.Response, limit: int = 500) -> str:
+    """
+    Return a short text preview of a response body for error details.
+
+    Only the first ``limit`` bytes are decoded, so a large body is never
+    decoded in full just to report its beginning.
+
+    Args:
+        response: HTTPX response object
+        limit: Maximum number of body bytes to include
+
+    Returns:
+        Decoded prefix of the response body
+    """
+    content = response.content
+    if isinstance(content, (bytes, bytearray, memoryview)):
+        return bytes(content[:limit]).decode("utf-8", errors="replace")
+    return response.text[:limit]
@@ -0,0 +1,63 @@
+"""Request coalescing for concurrent identical upstream calls."""
+
+import threading
+from concurrent.futures import Future
+from typing import Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Collapse concurrent calls that share a key into a single execution.
+
+    The first caller for a key runs the call; callers arriving while it is
+    in flight wait for it and receive the same result or exception. Nothing
+    is remembered once the call finishes, so this complements a response
+    cache by covering the window before the first response is stored.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty set of in-flight calls."""
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """
+        Run ``fn`` unless a call for ``key`` is already in flight.
+
+        Args:
+            key: Identifies equivalent calls
+            fn: Callable performing the call
+
+        Returns:
+            The result of the single shared call
+
+        Raises:
+            Exception: Whatever the shared call raised
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as exc:
+            self._forget(key)
+            future.set_exception(exc)
+            raise
+        self._forget(key)
+        future.set_result(result)
+        return result
+
+    def _forget(self, key: Hashable) -> None:
+        with self._lock:
+            del self._calls[key]
+
+    def __len__(self) -> int:
+        """Return the number of calls currently in flight."""
+        return len(self._calls)
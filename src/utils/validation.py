@@ -0,0 +1,68 @@
+"""Helpers for validating upstream records and hand-built responses."""
+
+from typing import Any, Callable, Dict, List, Sequence, Type, TypeVar
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from src.config import get_settings
+
+T = TypeVar("T")
+
+
+def checked(model: Type[BaseModel], payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Return a hand-built response, checking it against its model in debug mode.
+
+    Responses on hot paths are assembled as plain dicts; with DEBUG_VALIDATE
+    set they are also validated against the documented response model.
+
+    Args:
+        model: Response model describing the payload
+        payload: Hand-built response dictionary
+
+    Returns:
+        The payload, unchanged
+
+    Raises:
+        ValidationError: If DEBUG_VALIDATE is set and the payload does not
+            match the model
+    """
+    if get_settings().debug_validate:
+        model.model_validate(payload)
+    return payload
+
+
+def validate_items(
+    adapter: TypeAdapter[List[T]],
+    items: Sequence[Any],
+    on_invalid: Callable[[Any, List[Dict[str, Any]]], None],
+) -> List[T]:
+    """
+    Validate a list of records in one call, skipping the invalid ones.
+
+    The whole list is validated by a single ``TypeAdapter`` call. If any
+    record fails, the failing indices are read from the error locations,
+    reported through ``on_invalid``, and the remaining records are
+    validated again in one call.
+
+    Args:
+        adapter: TypeAdapter for a list of the record model
+        items: Raw records from the API response
+        on_invalid: Called with each invalid record and its errors
+
+    Returns:
+        The validated records, in their original order
+    """
+    try:
+        return adapter.validate_python(items)
+    except ValidationError as e:
+        errors_by_index: Dict[int, List[Dict[str, Any]]] = {}
+        for error in e.errors():
+            errors_by_index.setdefault(error["loc"][0], []).append(error)
+
+    for index, errors in errors_by_index.items():
+        on_invalid(items[index], errors)
+
+    return adapter.validate_python(
+        [item for index, item in enumerate(items) if index not in errors_by_index]
+    )
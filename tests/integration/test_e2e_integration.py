@@ -5,7 +5,7 @@ Verifies MCP protocol compliance and data consistency.
 Requirements: 1.2, 2.4
 """
 
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 from src.models.requests import (
     FindParksRequest,
@@ -347,6 +347,70 @@ class TestGetParkDetailsE2E:
             assert "message" in result
             assert "Park not found" in result["message"]
 
+    @staticmethod
+    def _park(code, name):
+        return {
+            "id": code,
+            "url": f"https://www.nps.gov/{code}/index.htm",
+            "fullName": name,
+            "parkCode": code,
+            "description": name,
+            "latitude": "0",
+            "longitude": "0",
+            "latLong": "lat:0, long:0",
+            "states": "CA",
+            "contacts": {"phoneNumbers": [], "emailAddresses": []},
+            "directionsInfo": "",
+            "directionsUrl": "",
+            "weatherInfo": "",
+            "name": name,
+            "designation": "National Park",
+        }
+
+    def test_get_park_details_bulk_uses_one_request(self):
+        """Test that several parks are fetched with one request and keyed by code."""
+        mock_response = {
+            "total": "2",
+            "limit": "2",
+            "start": "0",
+            "data": [
+                self._park("yose", "Yosemite National Park"),
+                self._park("grca", "Grand Canyon National Park"),
+            ],
+        }
+
+        with patch("src.handlers.get_park_details.get_client") as mock_get_client:
+            mock_client = Mock()
+            mock_client.get_parks_by_codes.return_value = mock_response
+            mock_get_client.return_value = mock_client
+
+            from src.handlers.get_park_details import get_park_details_bulk
+
+            result = get_park_details_bulk(["yose", "grca", "nope"])
+
+        mock_client.get_parks_by_codes.assert_called_once_with(["yose", "grca", "nope"])
+        assert set(result) == {"yose", "grca"}
+        assert result["grca"]["name"] == "Grand Canyon National Park"
+
+    def test_get_park_details_accepts_list_of_codes(self):
+        """Test that getParkDetails batches a list of park codes."""
+        mock_response = {"data": [self._park("yose", "Yosemite National Park")]}
+
+        with patch("src.handlers.get_park_details.get_client") as mock_get_client:
+            mock_client = Mock()
+            mock_client.get_parks_by_codes.return_value = mock_response
+            mock_get_client.return_value = mock_client
+
+            from src.handlers.get_park_details import get_park_details
+
+            request = GetParkDetailsRequest(parkCode=["yose", "nope"])
+            result = get_park_details(request)
+
+        mock_client.get_parks_by_codes.assert_called_once_with(["yose", "nope"])
+        mock_client.get_park_by_code.assert_not_called()
+        assert result["total"] == 1
+        assert result["parks"]["yose"]["name"] == "Yosemite National Park"
+
 
 class TestGetAlertsE2E:
     """End-to-end tests for get_alerts tool."""
@@ -811,6 +875,102 @@ class TestMCPProtocolCompliance:
         # FastMCP server is initialized and ready to handle tool calls
         assert server.mcp.name == "National Parks"
 
+    def test_park_context_tool_awaits_async_handler(self):
+        """Test that getParkContext awaits the async handler on the loop."""
+        import asyncio
+
+        from fastmcp import Client
+
+        from src.server import NationalParksServer
+
+        server = NationalParksServer()
+        payload = {"park": {"parkCode": "yose"}}
+        handler = AsyncMock(return_value=payload)
+
+        async def call():
+            async with Client(server.mcp) as client:
+                return await client.call_tool("getParkContext", {"parkCode": "yose"})
+
+        with patch("src.server.load_handler", return_value=handler) as mock_load:
+            result = asyncio.run(call())
+
+        mock_load.assert_called_once_with("get_park_context_async")
+        handler.assert_awaited_once()
+        assert result.structured_content == payload
+
+    def test_tool_argument_errors_use_structured_responses(self):
+        """Test that request model violations come back as error responses."""
+        import asyncio
+
+        from fastmcp import Client
+
+        from src.server import NationalParksServer
+
+        server = NationalParksServer()
+
+        async def call():
+            async with Client(server.mcp) as client:
+                return await client.call_tool("findParks", {"limit": 500})
+
+        with patch("src.server.load_handler") as mock_load:
+            result = asyncio.run(call())
+
+        mock_load.assert_not_called()
+        assert result.structured_content["error"] == "validation_error"
+
+    def test_get_server_creates_one_instance_under_concurrent_calls(self):
+        """Test that concurrent first calls to get_server share one server."""
+        import threading
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        import src.server as server_module
+
+        created = []
+
+        def slow_server():
+            time.sleep(0.05)
+            created.append(object())
+            return created[-1]
+
+        barrier = threading.Barrier(8)
+
+        def call():
+            barrier.wait()
+            return server_module.get_server()
+
+        original = server_module._server
+        server_module._server = None
+        try:
+            with patch.object(
+                server_module, "NationalParksServer", side_effect=slow_server
+            ):
+                with ThreadPoolExecutor(max_workers=8) as pool:
+                    servers = list(pool.map(lambda _: call(), range(8)))
+        finally:
+            server_module._server = original
+
+        assert len(created) == 1
+        assert all(server is created[0] for server in servers)
+
+    def test_run_closes_upstream_clients_on_shutdown(self):
+        """Test that stopping the server closes the shared connection pool."""
+        from src.server import NationalParksServer
+
+        server = NationalParksServer()
+
+        with (
+            patch.object(server.mcp, "run", side_effect=KeyboardInterrupt),
+            patch("src.server.close_client") as mock_close_nps,
+            patch("src.server.close_weather_clients") as mock_close_weather,
+            patch("src.server.close_http_transport") as mock_close_pool,
+        ):
+            server.run()
+
+        mock_close_nps.assert_called_once_with()
+        mock_close_weather.assert_called_once_with()
+        mock_close_pool.assert_called_once_with()
+
     def test_response_data_consistency_across_tools(self):
         """Test that response data is consistent across all tools."""
         # Verify that all request models have consistent structure
@@ -0,0 +1,45 @@
+"""Unit tests for the AirVisual API client."""
+
+import httpx
+
+from src.api.air_quality import AirQualityClient
+
+
+def _client(calls, **kwargs) -> AirQualityClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, json={"status": "success", "data": {}})
+
+    client = AirQualityClient(api_key="test-key", enable_retry=False, **kwargs)
+    client.client = httpx.Client(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+def test_nearby_lookups_share_cached_response():
+    """Test that lookups within the same rounded cell hit the cache."""
+    calls = []
+    client = _client(calls, requests_per_hour=3600)
+
+    first = client.get_nearest_city(37.801, -119.501)
+    tokens_after_first = client.rate_limiter.tokens
+    second = client.get_nearest_city(37.804, -119.498)
+    client.close()
+
+    assert second == first
+    assert len(calls) == 1
+    assert client.rate_limiter.tokens == tokens_after_first
+
+
+def test_zero_ttl_disables_cache():
+    """Test that cache_ttl=0 sends every request upstream."""
+    calls = []
+    client = _client(calls, enable_rate_limiting=False, cache_ttl=0)
+
+    client.get_nearest_city(37.8, -119.5)
+    client.get_nearest_city(37.8, -119.5)
+    client.close()
+
+    assert client.cache is None
+    assert len(calls) == 2
@@ -4,6 +4,7 @@ Tests authentication, rate limiting, error handling, and retry logic.
 Requirements: 3.2, 3.3, 3.4
 """
 
+import threading
 import time
 from unittest.mock import Mock, patch
 
@@ -12,7 +13,16 @@ import pytest
 
 from src.api.client import NPSAPIClient, NPSAPIError
 from src.api.rate_limit import RateLimiter
-from src.api.retry import RetryConfig, calculate_backoff_delay, should_retry_error
+from src.api.retry import (
+    RetryableHTTPClient,
+    RetryConfig,
+    RetryTransport,
+    calculate_backoff_delay,
+    parse_retry_after,
+    retry_after_hint,
+    retry_with_backoff,
+    should_retry_error,
+)
 
 
 class TestNPSAPIClient:
@@ -54,6 +64,21 @@ class TestNPSAPIClient:
             call_args = mock_client_class.call_args
             assert call_args.kwargs.get("base_url") == custom_url
 
+    def test_client_configures_connection_pool(self):
+        """Test that client enables HTTP/2 and keep-alive pool limits."""
+        with patch("httpx.Client") as mock_client_class:
+            _ = NPSAPIClient(
+                enable_rate_limiting=False,
+                enable_retry=False,
+                max_keepalive_connections=5,
+            )
+
+            call_args = mock_client_class.call_args
+            assert call_args.kwargs.get("http2") is True
+            limits = call_args.kwargs.get("limits")
+            assert limits.max_keepalive_connections == 5
+            assert limits.keepalive_expiry == 30.0
+
     def test_build_url_with_leading_slash(self):
         """Test URL building with leading slash."""
         with patch("httpx.Client"):
@@ -212,6 +237,30 @@ class TestNPSAPIClient:
         assert error_response.details["status_code"] == 500
         assert error_response.details["key"] == "value"
 
+    def test_error_response_conversion_leaves_details_untouched(self):
+        """Test that converting an error never mutates its own details."""
+        details = {"key": "value"}
+        error = NPSAPIError(message="Test error", status_code=500, details=details)
+
+        error_response = error.to_error_response()
+        error_response.details["extra"] = True
+
+        assert error.details == {"key": "value"}
+        assert "status_code" not in details
+
+    def test_error_response_conversion_serializes_enum_error_type(self):
+        """Test that ErrorType members are stored as their plain string value."""
+        from src.models.errors import ErrorType
+
+        error = NPSAPIError(message="Timed out", error_type=ErrorType.TIMEOUT_ERROR)
+
+        dumped = error.to_error_response().model_dump()
+
+        assert dumped["error"] == "timeout_error"
+        assert type(dumped["error"]) is str
+        assert dumped["details"] == {}
+        assert dumped["status_code"] is None
+
 
 class TestRateLimiter:
     """Test suite for RateLimiter."""
@@ -264,6 +313,69 @@ class TestRateLimiter:
         limiter.reset()
         assert limiter.tokens == 1000
 
+    def test_concurrent_acquire_never_over_issues(self):
+        """Test that concurrent acquires never hand out more tokens than exist."""
+        limiter = RateLimiter(requests_per_hour=50)
+        results = []
+
+        def worker():
+            for _ in range(10):
+                results.append(limiter.acquire(tokens=1, block=False))
+
+        threads = [threading.Thread(target=worker) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sum(results) == 50
+
+    def test_refill_is_exact_integer_math(self):
+        """Test that refills accumulate without floating-point drift."""
+        with patch("src.api.rate_limit.time.monotonic_ns", return_value=0):
+            limiter = RateLimiter(requests_per_hour=3600)
+        limiter.tokens = 0.0
+
+        # Refill in many tiny steps; the total must be exactly one token
+        with limiter.lock:
+            for now_ns in range(1_000_000, 1_000_000_001, 1_000_000):
+                limiter._refill_tokens(now_ns)
+
+        assert limiter.tokens == 1.0
+
+    def test_wait_time_covers_missing_tokens(self):
+        """Test that the blocking wait is long enough to refill the deficit."""
+        limiter = RateLimiter(requests_per_hour=3600)
+        limiter.tokens = 0.25
+
+        with patch("src.api.rate_limit.time.sleep") as mock_sleep:
+            limiter.acquire(tokens=1, block=True)
+
+        (wait_time,), _ = mock_sleep.call_args
+        assert 0.74 < wait_time <= 0.75
+
+    def test_acquire_defers_refill_with_ample_headroom(self):
+        """Test that a recent refill and full bucket skip the refill math."""
+        limiter = RateLimiter(requests_per_hour=1000)
+
+        with patch.object(limiter, "_refill_tokens") as mock_refill:
+            assert limiter.acquire(tokens=1, block=False) is True
+
+        mock_refill.assert_not_called()
+        assert limiter.tokens == 999
+
+    def test_acquire_refills_when_headroom_is_low(self):
+        """Test that a nearly empty bucket is always refilled first."""
+        limiter = RateLimiter(requests_per_hour=1000)
+        limiter.tokens = 5.0
+
+        with patch.object(
+            limiter, "_refill_tokens", wraps=limiter._refill_tokens
+        ) as mock_refill:
+            limiter.acquire(tokens=1, block=False)
+
+        mock_refill.assert_called_once()
+
 
 class TestRetryLogic:
     """Test suite for retry logic."""
@@ -292,6 +404,35 @@ class TestRetryLogic:
         )
         assert delay == 10.0
 
+    def test_backoff_delay_full_jitter(self):
+        """Test that jittered delays fall between zero and the capped delay."""
+        with patch("src.api.retry.random.uniform", return_value=1.5) as uniform:
+            delay = calculate_backoff_delay(
+                attempt=3,
+                initial_delay=1.0,
+                max_delay=4.0,
+                exponential_base=2.0,
+                jitter=True,
+            )
+        assert delay == 1.5
+        uniform.assert_called_once_with(0, 4.0)
+
+    def test_parse_retry_after(self):
+        """Test parsing of delay-seconds and HTTP-date Retry-After values."""
+        assert parse_retry_after("120") == 120.0
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+    def test_retry_after_hint_from_http_error(self):
+        """Test that Retry-After is read from HTTP status errors."""
+        response = httpx.Response(429, headers={"Retry-After": "7"})
+        error = httpx.HTTPStatusError(
+            "Too many requests", request=Mock(), response=response
+        )
+        assert retry_after_hint(error) == 7.0
+        assert retry_after_hint(httpx.NetworkError("down")) is None
+
     def test_should_retry_network_error(self):
         """Test that network errors trigger retry."""
         error = httpx.NetworkError("Network error")
@@ -337,6 +478,13 @@ class TestRetryLogic:
         assert config.max_delay == 120.0
         assert config.exponential_base == 3.0
 
+    def test_retry_config_uses_slots(self):
+        """Test that RetryConfig stores its fields in slots."""
+        config = RetryConfig()
+        assert not hasattr(config, "__dict__")
+        with pytest.raises(AttributeError):
+            config.unknown_option = True
+
     def test_retry_config_default_status_codes(self):
         """Test default retry status codes."""
         config = RetryConfig()
@@ -346,6 +494,108 @@ class TestRetryLogic:
         assert 503 in config.retry_on_status_codes
         assert 504 in config.retry_on_status_codes
 
+    def test_non_retryable_error_is_raised_without_sleeping(self):
+        """Test that a non-retryable first failure propagates immediately."""
+        func = Mock(side_effect=ValueError("bad input"))
+        wrapped = retry_with_backoff(RetryConfig(max_retries=3))(func)
+
+        with patch("src.api.retry.time.sleep") as mock_sleep:
+            with pytest.raises(ValueError, match="bad input"):
+                wrapped()
+
+        func.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    def test_retryable_client_retries_each_verb(self):
+        """Test that the prebuilt per-verb wrappers retry transient errors."""
+        mock_client = Mock()
+        response = Mock(spec=httpx.Response)
+        mock_client.post.side_effect = [httpx.NetworkError("down"), response, response]
+        client = RetryableHTTPClient(
+            mock_client, RetryConfig(max_retries=1, initial_delay=0.0)
+        )
+
+        assert client.post("/items", json={}) is response
+        assert client.post("/items", json={}) is response
+        assert mock_client.post.call_count == 3
+
+    @staticmethod
+    def _retry_client(handler, max_retries=2):
+        """Build a client whose transport retries over a mock transport."""
+        config = RetryConfig(max_retries=max_retries, initial_delay=0.0)
+        transport = RetryTransport(httpx.MockTransport(handler), config)
+        return httpx.Client(base_url="https://test.api.com", transport=transport)
+
+    def test_retry_transport_retries_retryable_status(self):
+        """Test that the transport retries a 503 and returns the success."""
+        statuses = iter([503, 200])
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(next(statuses), json={"data": []})
+
+        with self._retry_client(handler) as client:
+            response = client.get("/parks")
+
+        assert response.status_code == 200
+        assert len(calls) == 2
+
+    def test_retry_transport_returns_last_response_when_exhausted(self):
+        """Test that the final retryable response is returned unchanged."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(503)
+
+        with self._retry_client(handler, max_retries=2) as client:
+            response = client.get("/parks")
+
+        assert response.status_code == 503
+        assert len(calls) == 3
+
+    def test_retry_transport_retries_timeouts(self):
+        """Test that transport timeouts are retried and re-raised at the end."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            raise httpx.ConnectTimeout("timed out", request=request)
+
+        with self._retry_client(handler, max_retries=1) as client:
+            with pytest.raises(httpx.ConnectTimeout):
+                client.get("/parks")
+
+        assert len(calls) == 2
+
+    def test_retry_transport_honors_retry_after(self):
+        """Test that the transport sleeps for the server-requested delay."""
+        responses = iter(
+            [httpx.Response(429, headers={"Retry-After": "3"}), httpx.Response(200)]
+        )
+
+        with patch("src.api.retry.time.sleep") as mock_sleep:
+            with self._retry_client(lambda request: next(responses)) as client:
+                response = client.get("/parks")
+
+        assert response.status_code == 200
+        mock_sleep.assert_called_once_with(3.0)
+
+    def test_retry_transport_does_not_retry_client_errors(self):
+        """Test that non-retryable statuses are returned after one attempt."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(404)
+
+        with self._retry_client(handler) as client:
+            response = client.get("/parks")
+
+        assert response.status_code == 404
+        assert len(calls) == 1
+
 
 class TestAPIClientIntegration:
     """Integration tests for API client with rate limiting and retry."""
@@ -412,6 +662,21 @@ class TestAPIClientIntegration:
             # Verify client is not wrapped
             assert not isinstance(client.client, RetryableHTTPClient)
 
+    def test_client_with_zero_retries_is_not_wrapped(self):
+        """Test that max_retries=0 uses the raw HTTPX client."""
+        from src.api.retry import RetryableHTTPClient
+
+        with patch("httpx.Client") as mock_client_class:
+            mock_client_instance = Mock()
+            mock_client_class.return_value = mock_client_instance
+
+            client = NPSAPIClient(
+                enable_rate_limiting=False, enable_retry=True, max_retries=0
+            )
+
+            assert not isinstance(client.client, RetryableHTTPClient)
+            assert client.client is mock_client_instance
+
     def test_client_retry_on_transient_error(self):
         """Test that client retries on transient errors."""
         with patch("httpx.Client") as mock_client_class:
@@ -505,6 +770,36 @@ class TestAPIClientIntegration:
             client3 = get_client()
             assert client3 is not client1
 
+    def test_global_client_concurrent_first_call(self):
+        """Test that concurrent first calls share a single global client."""
+        from src.api import client as client_module
+
+        previous = client_module._client
+        client_module._client = None
+        barrier = threading.Barrier(8)
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(client_module.get_client())
+
+        with (
+            patch("httpx.Client"),
+            patch.object(
+                client_module, "NPSAPIClient", side_effect=lambda **kwargs: Mock()
+            ) as mock_cls,
+        ):
+            threads = [threading.Thread(target=worker) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            assert mock_cls.call_count == 1
+            assert all(result is results[0] for result in results)
+
+        client_module._client = previous
+
     def test_client_close_with_retry_wrapper(self):
         """Test closing client when wrapped with retry logic."""
         with patch("httpx.Client") as mock_client_class:
@@ -583,3 +878,70 @@ class TestAPIClientIntegration:
             result = client.get_events(park_code="yose")
 
             assert result == {"data": []}
+
+    def test_successful_request_skips_logging_when_debug_disabled(self):
+        """Test that URLs and durations are not built for suppressed logs."""
+        with patch("httpx.Client") as mock_client_class:
+            mock_client_instance = Mock()
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.json.return_value = {"data": []}
+            mock_client_instance.get.return_value = mock_response
+            mock_client_class.return_value = mock_client_instance
+
+            client = NPSAPIClient(enable_rate_limiting=False, enable_retry=False)
+            with (
+                patch("src.api.client.is_enabled_for", return_value=False),
+                patch("src.api.client.log_api_request") as mock_log_request,
+                patch("src.api.client.log_api_response") as mock_log_response,
+            ):
+                client.get("/alerts")
+
+            mock_log_request.assert_not_called()
+            mock_log_response.assert_not_called()
+
+    def test_get_parks_by_codes_uses_single_request(self):
+        """Test that bulk park lookups send one comma-separated parkCode."""
+        with patch("httpx.Client") as mock_client_class:
+            mock_client_instance = Mock()
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.json.return_value = {"total": "2", "data": [{}, {}]}
+            mock_response.raise_for_status = Mock()
+            mock_client_instance.get.return_value = mock_response
+            mock_client_class.return_value = mock_client_instance
+
+            client = NPSAPIClient(enable_rate_limiting=False, enable_retry=False)
+            result = client.get_parks_by_codes(["yell", "yose", "yell"])
+
+            mock_client_instance.get.assert_called_once_with(
+                "/parks", params={"parkCode": "yell,yose", "limit": 2}
+            )
+            assert result["total"] == "2"
+
+    def test_get_parks_by_codes_batches_long_lists(self):
+        """Test that long code lists are split and merged back together."""
+        with patch("httpx.Client") as mock_client_class:
+            mock_client_instance = Mock()
+
+            def fake_get(path, params):
+                response = Mock()
+                response.status_code = 200
+                response.raise_for_status = Mock()
+                codes = params["parkCode"].split(",")
+                response.json.return_value = {
+                    "total": str(len(codes)),
+                    "data": [{"parkCode": code} for code in codes],
+                }
+                return response
+
+            mock_client_instance.get.side_effect = fake_get
+            mock_client_class.return_value = mock_client_instance
+
+            client = NPSAPIClient(enable_rate_limiting=False, enable_retry=False)
+            client._PARK_CODES_PER_REQUEST = 2
+            result = client.get_parks_by_codes(["a", "b", "c"])
+
+            assert mock_client_instance.get.call_count == 2
+            assert result["total"] == "3"
+            assert [park["parkCode"] for park in result["data"]] == ["a", "b", "c"]
@@ -0,0 +1,92 @@
+"""Unit tests for the API response cache."""
+
+from unittest.mock import Mock, patch
+
+from src.api.cache import TTLCache, make_cache_key
+from src.api.client import NPSAPIClient
+
+
+class TestTTLCache:
+    """Test suite for TTLCache."""
+
+    def test_get_returns_stored_value(self):
+        """Test that a stored value is returned before it expires."""
+        cache = TTLCache(ttl=60)
+        cache.set("key", {"data": []})
+        assert cache.get("key") == {"data": []}
+
+    def test_entries_expire_after_ttl(self):
+        """Test that expired entries are dropped on lookup."""
+        cache = TTLCache(ttl=10)
+        with patch("src.api.cache.time.monotonic", return_value=100.0):
+            cache.set("key", "value")
+        with patch("src.api.cache.time.monotonic", return_value=111.0):
+            assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test that the cache never grows beyond maxsize."""
+        cache = TTLCache(ttl=60, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_make_cache_key_ignores_param_order(self):
+        """Test that parameter order does not affect the cache key."""
+        assert make_cache_key("/parks", {"a": 1, "b": 2}) == make_cache_key(
+            "/parks", {"b": 2, "a": 1}
+        )
+
+    def test_make_cache_key_rejects_unhashable_params(self):
+        """Test that unhashable parameter values disable caching."""
+        assert make_cache_key("/parks", {"fields": ["images"]}) is None
+
+
+class TestClientResponseCache:
+    """Test response caching in NPSAPIClient."""
+
+    def _client(self, mock_client_class, **kwargs):
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"data": [], "total": "0"}
+        mock_client_class.return_value.get.return_value = mock_response
+        return NPSAPIClient(
+            api_key="test-key", enable_rate_limiting=False, enable_retry=False, **kwargs
+        )
+
+    def test_cacheable_endpoint_is_fetched_once(self):
+        """Test that repeated park lookups are served from the cache."""
+        with patch("httpx.Client") as mock_client_class:
+            client = self._client(mock_client_class)
+
+            first = client.get_park_by_code("yell")
+            second = client.get_park_by_code("yell")
+
+            assert first == second
+            assert mock_client_class.return_value.get.call_count == 1
+
+    def test_dynamic_endpoint_is_not_cached(self):
+        """Test that alerts are always fetched fresh."""
+        with patch("httpx.Client") as mock_client_class:
+            client = self._client(mock_client_class)
+
+            client.get_alerts(park_code="yell")
+            client.get_alerts(park_code="yell")
+
+            assert mock_client_class.return_value.get.call_count == 2
+
+    def test_cache_can_be_disabled(self):
+        """Test that cache_ttl=None disables response caching."""
+        with patch("httpx.Client") as mock_client_class:
+            client = self._client(mock_client_class, cache_ttl=None)
+
+            client.get_park_by_code("yell")
+            client.get_park_by_code("yell")
+
+            assert client.cache is None
+            assert mock_client_class.return_value.get.call_count == 2
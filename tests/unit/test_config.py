@@ -53,3 +53,19 @@ def test_settings_with_custom_values() -> None:
     assert settings.nps_api_key == "custom_key"
     assert settings.log_level == "ERROR"
     assert settings.server_name == "Custom Server"
+
+
+def test_get_settings_is_memoized() -> None:
+    """Test that settings are loaded once and can be reloaded on demand."""
+    import src.config as config
+
+    first = config.get_settings()
+    try:
+        assert config.get_settings() is first
+        assert config.settings is first
+
+        with patch.dict(os.environ, {"SERVER_NAME": "Reloaded Server"}):
+            config.get_settings.cache_clear()
+            assert config.get_settings().server_name == "Reloaded Server"
+    finally:
+        config.get_settings.cache_clear()
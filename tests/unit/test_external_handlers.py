@@ -1,15 +1,23 @@
 """Unit tests for external data handlers."""
 
+import threading
+from datetime import datetime, timezone
 from unittest.mock import Mock, patch
 
+import pytest
+from pydantic import ValidationError
+
+from src.api.weather import WeatherAPIError
+from src.handlers._external import _format_openweather_time, build_open_meteo_response
 from src.handlers.get_air_quality import get_air_quality
-from src.handlers.get_park_context import get_park_context
+from src.handlers.get_park_context import get_park_context, get_park_context_async
 from src.handlers.get_weather import get_weather
 from src.models.requests import (
     GetAirQualityRequest,
     GetParkContextRequest,
     GetWeatherRequest,
 )
+from src.utils.geo import resolve_park_location
 
 
 def test_get_air_quality_coordinates_success():
@@ -65,6 +73,28 @@ def test_get_weather_open_meteo_success():
         assert result["temperature_c"] == 22.5
 
 
+def test_get_weather_rejects_unknown_provider():
+    with patch("src.handlers.get_weather.get_open_meteo_client") as mock_client:
+        request = GetWeatherRequest(latitude=37.8, longitude=-119.5, provider="nws")
+        result = get_weather(request)
+
+    assert result["error"] == "invalid_input"
+    mock_client.assert_not_called()
+
+
+@pytest.mark.parametrize("provider", ["open-meteo", "open_meteo", "Open-Meteo"])
+def test_get_weather_dispatches_open_meteo_aliases(provider):
+    with patch("src.handlers.get_weather.get_open_meteo_client") as mock_client:
+        mock_client.return_value.get_current_weather.return_value = {
+            "latitude": 37.8,
+            "longitude": -119.5,
+        }
+        request = GetWeatherRequest(latitude=37.8, longitude=-119.5, provider=provider)
+        result = get_weather(request)
+
+    assert result["provider"] == "open-meteo"
+
+
 def test_get_park_context_success():
     mock_air_response = {
         "status": "success",
@@ -119,3 +149,137 @@ def test_get_park_context_success():
                 assert result["park"]["code"] == "samp"
                 assert result["airQuality"]["provider"] == "airvisual"
                 assert result["weather"]["provider"] == "open-meteo"
+
+
+def _mock_park():
+    park = Mock()
+    park.full_name = "Sample Park"
+    park.park_code = "samp"
+    park.url = "https://example.com"
+    return park
+
+
+async def test_get_park_context_fetches_air_quality_and_weather_concurrently():
+    """Test that both upstream calls are in flight at the same time."""
+    barrier = threading.Barrier(2, timeout=5)
+
+    def nearest_city(latitude, longitude):
+        barrier.wait()
+        return {"status": "success", "data": {}}
+
+    def current_weather(latitude, longitude):
+        barrier.wait()
+        return {"latitude": latitude, "longitude": longitude}
+
+    with (
+        patch(
+            "src.handlers.get_park_context.resolve_park_location",
+            return_value=(_mock_park(), 37.8, -119.5),
+        ),
+        patch("src.handlers.get_park_context.get_air_quality_client") as mock_air,
+        patch("src.handlers.get_park_context.get_open_meteo_client") as mock_weather,
+    ):
+        mock_air.return_value.get_nearest_city.side_effect = nearest_city
+        mock_weather.return_value.get_current_weather.side_effect = current_weather
+
+        result = await get_park_context_async(
+            GetParkContextRequest(park_code="samp", weather_provider="open-meteo")
+        )
+
+    assert result["airQuality"]["location"]["latitude"] == 37.8
+    assert result["weather"]["provider"] == "open-meteo"
+
+
+async def test_get_park_context_sync_shim_inside_running_loop():
+    """Test that the sync entry point works with auto fallback under a loop."""
+    with (
+        patch(
+            "src.handlers.get_park_context.resolve_park_location",
+            return_value=(_mock_park(), 37.8, -119.5),
+        ),
+        patch("src.handlers.get_park_context.get_settings") as mock_settings,
+        patch("src.handlers.get_park_context.get_air_quality_client") as mock_air,
+        patch(
+            "src.handlers.get_park_context.get_openweather_client"
+        ) as mock_openweather,
+        patch("src.handlers.get_park_context.get_open_meteo_client") as mock_open_meteo,
+    ):
+        mock_settings.return_value.openweather_api_key = "key"
+        mock_air.return_value.get_nearest_city.return_value = {"data": {}}
+        mock_openweather.return_value.get_current_weather.side_effect = WeatherAPIError(
+            "Invalid API key", status_code=401
+        )
+        mock_open_meteo.return_value.get_current_weather.return_value = {
+            "latitude": 37.8,
+            "longitude": -119.5,
+        }
+
+        result = get_park_context(GetParkContextRequest(park_code="samp"))
+
+    assert result["weather"]["provider"] == "open-meteo"
+
+
+def test_get_park_context_rejects_provider_before_park_lookup():
+    """Test that an unsupported provider is rejected without an NPS call."""
+    with patch("src.handlers.get_park_context.resolve_park_location") as mock_resolve:
+        result = get_park_context(
+            GetParkContextRequest(park_code="samp", weather_provider="bogus")
+        )
+
+    mock_resolve.assert_not_called()
+    assert result["error"] == "invalid_input"
+    assert result["details"] == {"provider": "bogus"}
+
+
+def test_resolve_park_location_is_memoized():
+    """Test that repeat lookups for one park code reuse the first result."""
+    resolve_park_location.cache_clear()
+    try:
+        with (
+            patch("src.utils.geo.nps_client.get_client") as mock_client,
+            patch("src.utils.geo.ParkData") as mock_park_data,
+        ):
+            mock_client.return_value.get_park_by_code.return_value = {"data": [{}]}
+            mock_park_data.model_validate.return_value = Mock(
+                latitude="37.8", longitude="-119.5"
+            )
+
+            first = resolve_park_location("samp")
+            second = resolve_park_location("samp")
+    finally:
+        resolve_park_location.cache_clear()
+
+    assert second is first
+    mock_client.return_value.get_park_by_code.assert_called_once_with("samp")
+
+
+def test_open_meteo_builder_drops_missing_fields():
+    """Test that hand-built payloads match the former model_dump output."""
+    payload = build_open_meteo_response(
+        {"latitude": 37.8, "longitude": -119.5, "current_weather": {"temperature": 22}}
+    )
+
+    assert payload == {
+        "provider": "open-meteo",
+        "latitude": 37.8,
+        "longitude": -119.5,
+        "temperature_c": 22.0,
+    }
+
+
+def test_debug_validate_checks_payload_against_model():
+    """Test that DEBUG_VALIDATE runs the response model over the payload."""
+    data = {"latitude": 37.8, "longitude": -119.5, "current_weather": {"time": 1}}
+
+    assert build_open_meteo_response(data)["observation_time"] == 1
+    with patch("src.utils.validation.get_settings") as mock_settings:
+        mock_settings.return_value.debug_validate = True
+        with pytest.raises(ValidationError):
+            build_open_meteo_response(data)
+
+
+@pytest.mark.parametrize("timestamp", [0, 1704067200, 1718000123, 4102444799])
+def test_openweather_time_matches_datetime_isoformat(timestamp):
+    """Test that the gmtime formatting matches the datetime isoformat output."""
+    expected = datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+    assert _format_openweather_time(timestamp) == expected
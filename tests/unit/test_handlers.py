@@ -1,10 +1,20 @@
 """Unit tests for handler error handling."""
 
+import importlib
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+from src.handlers.find_parks import find_parks
+from src.handlers.get_alerts import get_alerts, get_alerts_bulk
 from src.handlers.get_campgrounds import get_campgrounds
 from src.handlers.get_events import get_events
-from src.models.requests import GetCampgroundsRequest, GetEventsRequest
+from src.models.requests import (
+    FindParksRequest,
+    GetAlertsRequest,
+    GetCampgroundsRequest,
+    GetEventsRequest,
+)
 
 
 @patch("src.handlers.get_campgrounds.get_client")
@@ -228,3 +238,96 @@ def test_get_events_all_items_invalid(mock_get_client):
     assert result["total"] == 3
     assert result["limit"] == 10
     assert result["start"] == 0
+
+
+@patch("src.handlers.find_parks.get_client")
+def test_find_parks_reports_invalid_states_in_order(mock_get_client):
+    """Test that invalid state codes are reported once each, in input order."""
+    request = FindParksRequest(state_code="zz, CA,xx,ZZ")
+    result = find_parks(request)
+
+    assert result["error"] == "Invalid state code(s): ZZ, XX"
+    mock_get_client.assert_not_called()
+
+
+def test_handler_package_resolves_functions_lazily():
+    """Test that package attributes are handler functions, not submodules."""
+    import src.handlers as handlers
+
+    alerts_module = importlib.import_module("src.handlers.get_alerts")
+
+    assert handlers.get_alerts is alerts_module.get_alerts
+    assert handlers.load_handler("get_alerts") is alerts_module.get_alerts
+    with pytest.raises(AttributeError):
+        handlers.load_handler("not_a_handler")
+
+
+def _alert(alert_id, park_code):
+    return {
+        "id": alert_id,
+        "url": "",
+        "title": "Closure",
+        "parkCode": park_code,
+        "description": "",
+        "category": "Park Closure",
+        "lastIndexedDate": "",
+    }
+
+
+@patch("src.handlers.get_alerts.get_client")
+def test_get_alerts_bulk_uses_one_request(mock_get_client):
+    """Test that several park codes are fetched with a single API call."""
+    mock_get_client.return_value.get_alerts.return_value = {
+        "total": "2",
+        "limit": "10",
+        "start": "0",
+        "data": [_alert("1", "yose"), _alert("2", "grca")],
+    }
+
+    result = get_alerts_bulk(["yose", "grca"])
+
+    mock_get_client.return_value.get_alerts.assert_called_once_with(
+        limit=10, parkCode="yose,grca"
+    )
+    assert set(result["alertsByPark"]) == {"yose", "grca"}
+
+
+@patch("src.handlers.get_alerts.get_client")
+def test_request_dump_skipped_when_info_disabled(mock_get_client):
+    """Test that the request is not dumped for a log record that is dropped."""
+    mock_get_client.return_value.get_alerts.return_value = {"data": []}
+
+    with (
+        patch("src.handlers.get_alerts.logger") as mock_logger,
+        patch.object(GetAlertsRequest, "model_dump") as mock_dump,
+    ):
+        mock_logger.isEnabledFor.return_value = False
+        get_alerts(GetAlertsRequest(park_code="yose"))
+
+    mock_dump.assert_not_called()
+
+
+@patch("src.handlers.get_events.get_client")
+def test_get_events_sends_only_set_params(mock_get_client):
+    """Test that unset and empty request fields are not sent upstream."""
+    mock_get_client.return_value.get_events.return_value = {"data": []}
+
+    get_events(GetEventsRequest(park_code="yose", q="", date_start="2024-06-01"))
+
+    mock_get_client.return_value.get_events.assert_called_once_with(
+        limit=10, parkCode="yose", dateStart="2024-06-01"
+    )
+
+
+@patch("src.handlers.get_alerts.get_client")
+def test_get_alerts_can_skip_grouping(mock_get_client):
+    """Test that the by-park grouping is left out when not requested."""
+    mock_get_client.return_value.get_alerts.return_value = {
+        "total": "1",
+        "data": [_alert("1", "yose")],
+    }
+
+    result = get_alerts(GetAlertsRequest(park_code="yose", includeGrouping=False))
+
+    assert "alertsByPark" not in result
+    assert len(result["alerts"]) == 1
@@ -0,0 +1,43 @@
+"""Unit tests for the shared HTTP connection pool."""
+
+from unittest.mock import Mock
+
+from src.api import _http
+from src.api.air_quality import AirQualityClient
+from src.api.client import NPSAPIClient
+
+
+def test_clients_share_one_pool():
+    """Test that clients built on the shared transport reuse one pool."""
+    nps = NPSAPIClient(
+        api_key="key",
+        enable_rate_limiting=False,
+        enable_retry=False,
+        transport=_http.get_http_transport(),
+    )
+    air = AirQualityClient(
+        api_key="key",
+        enable_rate_limiting=False,
+        enable_retry=False,
+        transport=_http.get_http_transport(),
+    )
+
+    assert nps.client._transport._transport is _http._transport
+    assert air.client._transport._transport is _http._transport
+    assert nps.client.headers["X-Api-Key"] == "key"
+
+
+def test_closing_a_client_leaves_the_pool_open():
+    """Test that the shared transport view does not close the pool."""
+    pool = Mock()
+    _http._SharedTransport(pool).close()
+
+    pool.close.assert_not_called()
+
+
+def test_close_http_transport_releases_pool():
+    """Test that closing the shared pool makes the next call create a new one."""
+    first = _http.get_http_transport()._transport
+    _http.close_http_transport()
+
+    assert _http.get_http_transport()._transport is not first
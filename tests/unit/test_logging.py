@@ -1,15 +1,21 @@
 """Unit tests for structured logging."""
 
+import json
 import logging
+from unittest.mock import Mock, patch
+
+import structlog
 
 from src.utils.logging import (
     censor_sensitive_data,
     configure_logging,
     get_logger,
+    is_enabled_for,
     log_api_request,
     log_api_response,
     log_request,
     log_response,
+    ms_since,
 )
 
 
@@ -37,6 +43,48 @@ class TestLoggingConfiguration:
         logger = get_logger(__name__)
         assert logger is not None
 
+    def test_json_renderer_output(self):
+        """Test that JSON logs render non-JSON values as strings."""
+        configure_logging(log_level="INFO", json_logs=True)
+        renderer = structlog.get_config()["processors"][-1]
+
+        line = renderer(None, "info", {"event": "parks_found", "took": Mock})
+
+        assert json.loads(line) == {"event": "parks_found", "took": str(Mock)}
+
+    def test_events_below_level_skip_processors(self):
+        """Test that filtered-out events are dropped before other processors."""
+        configure_logging(log_level="INFO", json_logs=False)
+        logger = get_logger("test_level_filter")
+
+        with patch(
+            "structlog.processors.TimeStamper.__call__",
+            side_effect=AssertionError("processor ran"),
+        ):
+            logger.debug("dropped_event")
+
+    def test_log_lines_are_written_by_listener_thread(self, capsys):
+        """Test that log lines reach stderr through the queued writer."""
+        from logging.handlers import QueueHandler
+
+        import src.utils.logging as logging_module
+
+        root = logging.getLogger()
+        saved_handlers, saved_level = root.handlers[:], root.level
+        root.handlers = []
+        try:
+            configure_logging(log_level="INFO", json_logs=True)
+            assert isinstance(root.handlers[0], QueueHandler)
+
+            get_logger("test_listener").info("queued_event")
+            logging_module._stop_log_writer()
+        finally:
+            logging_module._stop_log_writer()
+            root.handlers = saved_handlers
+            root.setLevel(saved_level)
+
+        assert json.loads(capsys.readouterr().err)["event"] == "queued_event"
+
     def test_configure_logging_without_timestamp(self):
         """Test configuring logging without timestamps."""
         configure_logging(log_level="INFO", json_logs=False, include_timestamp=False)
@@ -152,6 +200,39 @@ class TestAPILogging:
 
         assert len(caplog.records) > 0
 
+    def test_api_logging_skipped_when_level_disabled(self):
+        """Test that API log helpers return early for disabled levels."""
+        logger = Mock()
+        logger.isEnabledFor.return_value = False
+
+        log_api_request(logger, "GET", "https://api.example.com/parks", {"q": "x"})
+        log_api_response(logger, "GET", "https://api.example.com/parks", 200, 1.0)
+
+        logger.debug.assert_not_called()
+        logger.isEnabledFor.assert_called_with(logging.DEBUG)
+
+    def test_api_logging_checks_level_for_status(self):
+        """Test that error and client-error responses check their own level."""
+        logger = Mock()
+        logger.isEnabledFor.side_effect = lambda level: level >= logging.WARNING
+
+        log_api_response(logger, "GET", "https://api.example.com/parks", 404, 1.0)
+        log_api_response(
+            logger, "GET", "https://api.example.com/parks", 0, 1.0, error="boom"
+        )
+
+        logger.warning.assert_called_once()
+        logger.error.assert_called_once()
+
+    def test_is_enabled_for_defaults_to_true_without_level_check(self):
+        """Test that loggers lacking isEnabledFor are treated as enabled."""
+        assert is_enabled_for(object(), logging.DEBUG) is True
+
+    def test_ms_since_converts_perf_counter_ns(self):
+        """Test that ms_since measures from a perf_counter_ns reading."""
+        with patch("src.utils.logging.time.perf_counter_ns", return_value=3_500_000):
+            assert ms_since(1_000_000) == 2.5
+
 
 class TestSensitiveDataCensoring:
     """Test sensitive data censoring."""
@@ -1,11 +1,12 @@
 """Unit tests for main entry point."""
 
+import subprocess
 import sys
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.main import main, parse_args
+from src.main import _build_parser, main, parse_args
 
 
 class TestParseArgs:
@@ -19,6 +20,11 @@ class TestParseArgs:
             assert args.log_json is None
             assert args.no_timestamp is False
 
+    def test_parse_args_fast_path_matches_parser_defaults(self):
+        """Test that the no-argument fast path returns the parser's defaults."""
+        with patch.object(sys, "argv", ["python-mcp-nationalparks"]):
+            assert parse_args() == _build_parser().parse_args([])
+
     def test_parse_args_log_level(self):
         """Test parsing with log level argument."""
         with patch.object(
@@ -65,13 +71,28 @@ class TestParseArgs:
             with pytest.raises(SystemExit):
                 parse_args()
 
+    def test_help_does_not_import_server(self):
+        """Test that --help exits before the server and settings are imported."""
+        code = (
+            "import sys\n"
+            "sys.argv = ['python-mcp-nationalparks', '--help']\n"
+            "from src.main import main\n"
+            "try:\n"
+            "    main()\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "assert 'src.server' not in sys.modules\n"
+            "assert 'src.config' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True, capture_output=True)
+
 
 class TestMain:
     """Tests for main function."""
 
-    @patch("src.main.get_server")
-    @patch("src.main.configure_logging")
-    @patch("src.main.get_logger")
+    @patch("src.server.get_server")
+    @patch("src.utils.logging.configure_logging")
+    @patch("src.utils.logging.get_logger")
     @patch.object(sys, "argv", ["python-mcp-nationalparks"])
     def test_main_starts_server(
         self, mock_get_logger, mock_configure_logging, mock_get_server
@@ -94,9 +115,9 @@ class TestMain:
         mock_get_server.assert_called_once()
         mock_server.run.assert_called_once()
 
-    @patch("src.main.get_server")
-    @patch("src.main.configure_logging")
-    @patch("src.main.get_logger")
+    @patch("src.server.get_server")
+    @patch("src.utils.logging.configure_logging")
+    @patch("src.utils.logging.get_logger")
     @patch.object(sys, "argv", ["python-mcp-nationalparks", "--log-level", "DEBUG"])
     def test_main_with_cli_args(
         self, mock_get_logger, mock_configure_logging, mock_get_server
@@ -118,9 +139,9 @@ class TestMain:
         call_kwargs = mock_configure_logging.call_args[1]
         assert call_kwargs["log_level"] == "DEBUG"
 
-    @patch("src.main.get_server")
-    @patch("src.main.configure_logging")
-    @patch("src.main.get_logger")
+    @patch("src.server.get_server")
+    @patch("src.utils.logging.configure_logging")
+    @patch("src.utils.logging.get_logger")
     @patch.object(sys, "argv", ["python-mcp-nationalparks"])
     def test_main_handles_keyboard_interrupt(
         self, mock_get_logger, mock_configure_logging, mock_get_server
@@ -140,9 +161,9 @@ class TestMain:
         assert exc_info.value.code == 0
         mock_logger.info.assert_called()
 
-    @patch("src.main.get_server")
-    @patch("src.main.configure_logging")
-    @patch("src.main.get_logger")
+    @patch("src.server.get_server")
+    @patch("src.utils.logging.configure_logging")
+    @patch("src.utils.logging.get_logger")
     @patch.object(sys, "argv", ["python-mcp-nationalparks"])
     def test_main_handles_exception(
         self, mock_get_logger, mock_configure_logging, mock_get_server
@@ -161,3 +182,18 @@ class TestMain:
 
         assert exc_info.value.code == 1
         mock_logger.error.assert_called()
+
+    @patch("src.server.get_server")
+    @patch("src.utils.logging.configure_logging")
+    @patch("src.utils.logging.get_logger")
+    @patch.object(sys, "argv", ["python-mcp-nationalparks", "--quiet"])
+    def test_main_quiet_skips_banner(
+        self, mock_get_logger, mock_configure_logging, mock_get_server, capsys
+    ):
+        """Test that --quiet keeps the startup banner off stderr."""
+        mock_get_server.return_value.run.side_effect = SystemExit(0)
+
+        with pytest.raises(SystemExit):
+            main()
+
+        assert "running on stdio" not in capsys.readouterr().err
@@ -1,9 +1,12 @@
 """Unit tests for Pydantic models."""
 
+import subprocess
+import sys
+
 import pytest
 from pydantic import ValidationError
 
-from src.models.errors import ErrorResponse, ValidationErrorResponse
+from src.models.errors import ErrorResponse, ErrorType, ValidationErrorResponse
 from src.models.requests import (
     FindParksRequest,
     GetAlertsRequest,
@@ -12,7 +15,7 @@ from src.models.requests import (
     GetParkDetailsRequest,
     GetVisitorCentersRequest,
 )
-from src.models.responses import AlertData, Contacts, NPSResponse
+from src.models.responses import AlertData, Contacts, NPSResponse, PhoneNumber
 
 
 class TestRequestModels:
@@ -87,6 +90,20 @@ class TestRequestModels:
         assert request.date_start == "2024-01-01"
         assert request.date_end == "2024-12-31"
 
+    @pytest.mark.parametrize(
+        "model",
+        [
+            GetAlertsRequest,
+            GetVisitorCentersRequest,
+            GetCampgroundsRequest,
+            GetEventsRequest,
+        ],
+    )
+    def test_park_code_list_is_joined(self, model):
+        """Test that a list of park codes becomes one comma-separated filter."""
+        request = model(parkCode=["yose", " grca ", ""])
+        assert request.park_code == "yose,grca"
+
 
 class TestResponseModels:
     """Test response models."""
@@ -163,6 +180,18 @@ class TestErrorModels:
         assert error.message == "API request failed"
         assert error.details["status_code"] == 500
 
+    def test_error_response_from_exception_normalizes_error_type(self):
+        """Test that ErrorType members are stored as their string values."""
+        error = ErrorResponse.from_exception(ErrorType.API_ERROR, "API request failed")
+
+        assert type(error.error) is str
+        assert error.model_dump() == {
+            "error": "api_error",
+            "message": "API request failed",
+            "details": {},
+            "status_code": None,
+        }
+
     def test_validation_error_response(self):
         """Test ValidationErrorResponse model."""
         error = ValidationErrorResponse(
@@ -174,3 +203,83 @@ class TestErrorModels:
         assert error.error == "validation_error"
         assert error.message == "Validation failed"
         assert len(error.validation_errors) == 1
+
+    def test_validation_error_response_from_pydantic_error(self):
+        """Test conversion of a pydantic ValidationError."""
+        with pytest.raises(ValidationError) as exc_info:
+            GetAlertsRequest(limit=0)
+
+        error = ValidationErrorResponse.from_pydantic_error(exc_info.value)
+
+        assert [e.loc for e in error.validation_errors] == [["limit"]]
+        assert error.validation_errors[0].type == "greater_than_equal"
+        assert error.status_code == 422
+
+    def test_validation_error_response_ignores_other_exceptions(self):
+        """Test that non-pydantic exceptions produce no error entries."""
+        error = ValidationErrorResponse.from_pydantic_error(ValueError("bad"))
+        assert error.validation_errors == []
+
+    def test_categorize_error_returns_type_and_status(self):
+        """Test the error categories for validation and unexpected errors."""
+        from src.utils.error_handler import categorize_error
+
+        with pytest.raises(ValidationError) as exc_info:
+            GetAlertsRequest(limit=0)
+
+        assert categorize_error(exc_info.value) == (ErrorType.VALIDATION_ERROR, 422)
+        assert categorize_error(ValueError("bad")) == (ErrorType.INTERNAL_ERROR, 500)
+
+    def test_error_handlers_match_error_models(self):
+        """Test that the hand-built handler dicts match the model dumps."""
+        from src.utils.error_handler import (
+            handle_generic_error,
+            handle_validation_error,
+        )
+
+        with pytest.raises(ValidationError) as exc_info:
+            GetAlertsRequest(limit=0, start=-1)
+
+        assert handle_validation_error(exc_info.value) == (
+            ValidationErrorResponse.from_pydantic_error(exc_info.value).model_dump()
+        )
+        assert handle_generic_error(ValueError("bad")) == (
+            ErrorResponse(
+                error="internal_error",
+                message="bad",
+                details={"error_class": "ValueError"},
+                status_code=500,
+            ).model_dump()
+        )
+
+
+def test_models_package_exports_resolve_lazily():
+    """Test that package exports resolve without eagerly loading every model."""
+    code = (
+        "import sys; import src.models.errors; "
+        "assert 'src.models.responses' not in sys.modules; "
+        "from src.models import ParkData; "
+        "assert ParkData.__module__ == 'src.models.responses'"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_leaf_records_validate_aliases_without_instance_dict():
+    """Test that leaf records accept API aliases and are slotted."""
+    contacts = Contacts.model_validate(
+        {
+            "phoneNumbers": [
+                {
+                    "phoneNumber": "209-372-0200",
+                    "description": "",
+                    "extension": "",
+                    "type": "Voice",
+                }
+            ]
+        }
+    )
+
+    phone = contacts.phone_numbers[0]
+    assert isinstance(phone, PhoneNumber)
+    assert phone.phone_number == "209-372-0200"
+    assert not hasattr(phone, "__dict__")
@@ -0,0 +1,70 @@
+"""Unit tests for JSON serialization helpers."""
+
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+
+from src.utils import serialization
+from src.utils.serialization import dumps, loads, response_json, response_preview
+
+
+def test_loads_decodes_bytes_and_str():
+    """Test that loads accepts both bytes and str documents."""
+    assert loads(b'{"total": "1"}') == {"total": "1"}
+    assert loads('{"data": []}') == {"data": []}
+
+
+def test_loads_raises_value_error_on_invalid_json():
+    """Test that invalid JSON raises a ValueError subclass."""
+    with pytest.raises(ValueError):
+        loads(b"not json")
+
+
+def test_loads_falls_back_to_stdlib_without_orjson():
+    """Test that the stdlib decoder is used when orjson is unavailable."""
+    with patch.object(serialization, "orjson", None):
+        assert loads(b'{"limit": "10"}') == {"limit": "10"}
+
+
+def test_response_json_decodes_response_body():
+    """Test that response_json decodes a real HTTPX response body."""
+    response = httpx.Response(200, json={"data": [{"id": "1"}]})
+    assert response_json(response) == {"data": [{"id": "1"}]}
+
+
+def test_response_json_falls_back_to_response_json_method():
+    """Test that responses without a byte body use response.json()."""
+    response = Mock()
+    response.json.return_value = {"data": []}
+
+    assert response_json(response) == {"data": []}
+    response.json.assert_called_once()
+
+
+def test_response_preview_decodes_only_prefix():
+    """Test that response_preview returns a bounded decoded prefix."""
+    response = httpx.Response(500, content=b"x" * 2000)
+    assert response_preview(response) == "x" * 500
+    assert response_preview(response, limit=10) == "x" * 10
+
+
+def test_response_preview_replaces_split_multibyte_characters():
+    """Test that a prefix ending mid-character is still decodable."""
+    response = httpx.Response(500, content="é".encode() * 3)
+    assert response_preview(response, limit=3) == "é�"
+
+
+def test_dumps_encodes_compact_utf8_json():
+    """Test that dumps returns compact UTF-8 JSON bytes."""
+    assert (
+        dumps({"name": "Café", "ids": [1, 2]}) == '{"name":"Café","ids":[1,2]}'.encode()
+    )
+
+
+def test_dumps_falls_back_to_stdlib_without_orjson():
+    """Test that the stdlib encoder produces the same output as orjson."""
+    payload = {"name": "Café", "total": 1, "tags": None}
+    with patch.object(serialization, "orjson", None):
+        fallback = dumps(payload)
+    assert fallback == dumps(payload)
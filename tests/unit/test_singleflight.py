@@ -0,0 +1,49 @@
+"""Unit tests for request coalescing."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.utils.singleflight import SingleFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    """Test that threads asking for one key while it is in flight share it."""
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        started.set()
+        release.wait(timeout=5)
+        return {"data": []}
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        leader = executor.submit(flight.do, "yell", fetch)
+        started.wait(timeout=5)
+        followers = [executor.submit(flight.do, "yell", fetch) for _ in range(3)]
+        # Give the followers time to join the in-flight call
+        time.sleep(0.1)
+        release.set()
+        results = [leader.result()] + [f.result() for f in followers]
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert len(flight) == 0
+
+
+def test_errors_propagate_and_are_not_remembered():
+    """Test that a failed call raises and the next call runs again."""
+    flight = SingleFlight()
+
+    def fail():
+        raise ValueError("upstream down")
+
+    with pytest.raises(ValueError):
+        flight.do("yell", fail)
+
+    assert flight.do("yell", lambda: "ok") == "ok"
@@ -0,0 +1,59 @@
+"""Unit tests for validation helpers."""
+
+from typing import List
+from unittest.mock import patch
+
+import pytest
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from src.utils.error_handler import handle_generic_error
+from src.utils.validation import checked, validate_items
+
+
+class _Item(BaseModel):
+    id: int
+
+
+_ADAPTER = TypeAdapter(List[_Item])
+
+
+def test_validate_items_returns_all_valid_records():
+    """Test that a fully valid list is validated without callbacks."""
+    invalid = []
+    result = validate_items(
+        _ADAPTER, [{"id": 1}, {"id": "2"}], lambda i, e: invalid.append(i)
+    )
+
+    assert [item.id for item in result] == [1, 2]
+    assert invalid == []
+
+
+def test_validate_items_skips_invalid_records_in_order():
+    """Test that invalid records are reported and the rest kept in order."""
+    invalid = []
+    items = [{"id": 1}, {"id": "x"}, {}, {"id": 4}]
+
+    result = validate_items(
+        _ADAPTER, items, lambda item, errors: invalid.append((item, len(errors)))
+    )
+
+    assert [item.id for item in result] == [1, 4]
+    assert invalid == [({"id": "x"}, 1), ({}, 1)]
+
+
+def test_checked_validates_only_in_debug_mode():
+    """Test that payloads are validated only when DEBUG_VALIDATE is set."""
+    assert checked(_Item, {"id": "x"}) == {"id": "x"}
+    with patch("src.utils.validation.get_settings") as mock_settings:
+        mock_settings.return_value.debug_validate = True
+        with pytest.raises(ValidationError):
+            checked(_Item, {"id": "x"})
+
+
+def test_error_responses_pass_debug_validation():
+    """Test that hand-built error responses match the ErrorResponse model."""
+    with patch("src.utils.validation.get_settings") as mock_settings:
+        mock_settings.return_value.debug_validate = True
+        response = handle_generic_error(ValueError("bad"))
+
+    assert response["error"] == "internal_error"
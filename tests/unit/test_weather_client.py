@@ -0,0 +1,204 @@
+"""Unit tests for the weather API clients."""
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from src.api import weather
+from src.api.weather import (
+    OpenMeteoClient,
+    OpenWeatherClient,
+    WeatherAPIError,
+    close_weather_clients,
+    get_open_meteo_client,
+    get_openweather_client,
+)
+from src.models.errors import ErrorType
+
+
+def test_sync_timeout_maps_to_weather_api_error():
+    """Test that transport timeouts surface as timeout errors."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectTimeout("timed out", request=request)
+
+    client = OpenMeteoClient(enable_rate_limiting=False, enable_retry=False)
+    client.client = httpx.Client(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+
+    with pytest.raises(WeatherAPIError) as exc_info:
+        client.get_current_weather(44.6, -110.5)
+    client.close()
+
+    assert exc_info.value.error_type == ErrorType.TIMEOUT_ERROR
+
+
+class TestWeatherCache:
+    """Test suite for weather response caching."""
+
+    @staticmethod
+    def _client(calls, **kwargs) -> OpenMeteoClient:
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(200, json={"latitude": 44.6})
+
+        client = OpenMeteoClient(enable_retry=False, **kwargs)
+        client.client = httpx.Client(
+            base_url=client.base_url, transport=httpx.MockTransport(handler)
+        )
+        return client
+
+    def test_nearby_lookups_share_cached_response(self):
+        """Test that repeat lookups skip the network and the rate limiter."""
+        calls = []
+        client = self._client(calls, requests_per_hour=3600)
+
+        first = client.get_current_weather(44.6001, -110.5001)
+        tokens_after_first = client.rate_limiter.tokens
+        second = client.get_current_weather(44.6002, -110.5002)
+        client.close()
+
+        assert second == first
+        assert len(calls) == 1
+        assert client.rate_limiter.tokens == tokens_after_first
+
+    def test_zero_ttl_disables_cache(self):
+        """Test that cache_ttl=0 sends every request upstream."""
+        calls = []
+        client = self._client(calls, enable_rate_limiting=False, cache_ttl=0)
+
+        client.get_current_weather(44.6, -110.5)
+        client.get_current_weather(44.6, -110.5)
+        client.close()
+
+        assert client.cache is None
+        assert len(calls) == 2
+
+
+def test_openweather_request_uses_static_params():
+    """Test that per-call coordinates are merged with the static params."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={})
+
+    client = OpenWeatherClient(
+        api_key="test-key", enable_rate_limiting=False, enable_retry=False
+    )
+    client.client = httpx.Client(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+    client.get_current_weather(44.6, -110.5)
+    client.close()
+
+    params = requests[0].url.params
+    assert requests[0].url.path.endswith("/weather")
+    assert params["appid"] == "test-key"
+    assert params["units"] == "metric"
+    assert (params["lat"], params["lon"]) == ("44.6", "-110.5")
+
+
+def test_unexpected_error_skips_traceback_unless_debugging():
+    """Test that unexpected errors only attach a traceback at DEBUG level."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise RuntimeError("boom")
+
+    client = OpenMeteoClient(enable_rate_limiting=False, enable_retry=False)
+    client.client = httpx.Client(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+
+    with patch.object(weather, "logger") as mock_logger:
+        mock_logger.isEnabledFor.return_value = False
+        with pytest.raises(WeatherAPIError) as exc_info:
+            client.get_current_weather(44.6, -110.5)
+    client.close()
+
+    assert exc_info.value.error_type == ErrorType.UNKNOWN_ERROR
+    (kwargs,) = [
+        call.kwargs
+        for call in mock_logger.error.call_args_list
+        if call.args == ("api_unexpected_error",)
+    ]
+    assert kwargs["exc_info"] is False
+
+
+def test_global_providers_share_http_client():
+    """Test that the provider singletons share one connection pool."""
+    close_weather_clients()
+    try:
+        openweather = get_openweather_client()
+        open_meteo = get_open_meteo_client()
+        assert openweather.client is open_meteo.client
+
+        shared = openweather.client
+        openweather.close()
+        assert not shared.is_closed
+    finally:
+        close_weather_clients()
+
+    assert shared.is_closed
+
+
+def test_client_transport_uses_http2_and_pool_limits():
+    """Test that the HTTP/2 and pool settings reach the transport."""
+    with patch.object(weather.httpx, "HTTPTransport") as mock_transport:
+        OpenMeteoClient(enable_rate_limiting=False, max_keepalive_connections=4)
+
+    _, kwargs = mock_transport.call_args
+    assert kwargs["http2"] is True
+    assert kwargs["verify"] is False
+    assert kwargs["limits"].max_keepalive_connections == 4
+
+
+def test_open_meteo_request_url_template():
+    """Test that the prebuilt Open-Meteo URL matches the expected query."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={})
+
+    client = OpenMeteoClient(enable_rate_limiting=False, enable_retry=False)
+    client.client = httpx.Client(transport=httpx.MockTransport(handler))
+    client.get_current_weather(44.6, -110.5)
+    client.close()
+
+    assert dict(requests[0].url.params) == {
+        "current_weather": "true",
+        "windspeed_unit": "ms",
+        "latitude": "44.6",
+        "longitude": "-110.5",
+    }
+
+
+@pytest.mark.parametrize(
+    ("client_factory", "body"),
+    [
+        (
+            lambda: OpenWeatherClient(api_key="key", enable_rate_limiting=False),
+            {"message": "Invalid API key"},
+        ),
+        (
+            lambda: OpenMeteoClient(enable_rate_limiting=False),
+            {"reason": "Invalid API key"},
+        ),
+    ],
+)
+def test_http_error_uses_provider_error_key(client_factory, body):
+    """Test that each provider's error message key is read from error bodies."""
+    client = client_factory()
+    client.client = httpx.Client(
+        transport=httpx.MockTransport(lambda request: httpx.Response(400, json=body))
+    )
+
+    with pytest.raises(WeatherAPIError) as exc_info:
+        client.get_current_weather(44.6, -110.5)
+    client.close()
+
+    assert exc_info.value.message == "Invalid API key"
+    assert exc_info.value.status_code == 400